@@ -0,0 +1,60 @@
+# benchmarks/bench_follow_up_stream.py
+# 꼬리 질문 생성: 전체 응답 후 TTS (generate_follow_up_questions) vs 줄 단위 스트리밍 TTS (stream_follow_up_questions)
+# 첫 번째 꼬리 질문 음성이 준비되기까지(time-to-first-audio)와 전체 완료 시간을 비교합니다.
+#
+#   python -m benchmarks.bench_follow_up_stream --token-latency 0.05 --tts-latency 0.3
+
+import argparse
+import asyncio
+import time
+
+from interview.application.interview_service import InterviewService
+from interview.application.follow_up_prefetch import FollowUpPrefetcher
+from benchmarks.fakes import MemoryRepository, StubLLMClient, StubTTSClient, make_info
+
+
+async def measure(args, streaming: bool):
+    llm = StubLLMClient(latency=args.llm_latency, token_latency=args.token_latency)
+    service = InterviewService(
+        repo=MemoryRepository(),
+        llm=llm,
+        tts=StubTTSClient(latency=args.tts_latency),
+        ocr=None,
+        tts_limiter=asyncio.Semaphore(8),
+        prefetcher=FollowUpPrefetcher(),  # prefetch 없이 비교 (start 하지 않음)
+    )
+    session = await service.create_session_with_questions("1", "1", make_info(1, 1))
+    session.qa_flow[0].answer = "답변"
+    await service.repo.update_session(session)
+
+    start = time.perf_counter()
+    if not streaming:
+        await service.generate_follow_up_questions(session.session_id, 0)
+        total = time.perf_counter() - start
+        return total, total
+    first = None
+    async for event in await service.stream_follow_up_questions(session.session_id, 0):
+        if event["type"] == "follow_up" and first is None:
+            first = time.perf_counter() - start
+    return first, time.perf_counter() - start
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--llm-latency", type=float, default=0.3, help="첫 토큰까지 지연(초)")
+    parser.add_argument("--token-latency", type=float, default=0.05, help="글자(토큰)당 지연(초)")
+    parser.add_argument("--tts-latency", type=float, default=0.3, help="stub TTS 1회 지연(초)")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"llm_latency={args.llm_latency}s, token_latency={args.token_latency}s, tts_latency={args.tts_latency}s")
+    print(f"{'mode':>9} | {'first audio(ms)':>15} | {'total(ms)':>9}")
+    for streaming in (False, True):
+        results = [await measure(args, streaming) for _ in range(args.repeat)]
+        first = sum(r[0] for r in results) / len(results)
+        total = sum(r[1] for r in results) / len(results)
+        print(f"{'stream' if streaming else 'batch':>9} | {first * 1000:>15.1f} | {total * 1000:>9.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,104 @@
+# benchmarks/bench_llm_batching.py
+# LocalClient 질문 생성: batch 크기별 처리량 (prompts/s)
+# GPU 서버는 로컬 fake 서버로 대체합니다. 한 번에 한 요청만 처리(GPU 하나)하며,
+# 요청 1회 = base 지연 + 프롬프트당 지연 × 프롬프트 수 × (batch면 per-prompt 할인) 으로 흉내냅니다.
+#
+#   python -m benchmarks.bench_llm_batching --prompts 32 --batch-sizes 1 2 4 8 16
+
+import os
+import json
+import time
+import asyncio
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeGPUHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    gpu = threading.Lock()
+    base_latency = 0.05
+    per_prompt = 0.02
+    batch_discount = 0.25       # batch 안에서는 프롬프트당 비용이 이만큼으로 줄어듦
+    batch_supported = True
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        if self.path.endswith("_batch"):
+            if not self.batch_supported:
+                return self._reply(404, {"detail": "Not Found"})
+            prompts = [r["prompt"] for r in body["requests"]]
+            cost = self.base_latency + self.per_prompt * self.batch_discount * len(prompts)
+            self._run(cost)
+            return self._reply(200, {"responses": [{"response": self._answer(p)} for p in prompts]})
+        self._run(self.base_latency + self.per_prompt)
+        self._reply(200, {"response": self._answer(body["prompt"])})
+
+    def _run(self, cost: float):
+        with self.gpu:
+            time.sleep(cost)
+
+    @staticmethod
+    def _answer(prompt: str) -> str:
+        return "\n".join(f"{i + 1}. 질문 {i + 1}" for i in range(5))
+
+    def _reply(self, status: int, obj: dict):
+        data = json.dumps(obj).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeGPUServer(ThreadingHTTPServer):
+    request_queue_size = 128  # 동시 접속이 많아도 accept backlog에서 끊기지 않도록
+
+
+async def measure(prompts: int, batch_size: int, window: float) -> float:
+    from interview.infra.llm.local_client import LocalClient
+    from interview.infra.llm.batching import PromptBatcher
+    from interview.infra.llm.http_client import aclose_http_clients
+    from benchmarks.fakes import make_info
+
+    client = LocalClient()
+    client.batcher = PromptBatcher(client._apost_payload, client._apost_batch, window=window, max_batch_size=batch_size)
+    infos = [make_info(1, 5) for _ in range(prompts)]
+    start = time.perf_counter()
+    results = await asyncio.gather(*(client.agenerate_questions(info, [{"question": "q", "answer": f"a{i}"}])
+                                     for i, info in enumerate(infos)))
+    elapsed = time.perf_counter() - start
+    assert all(results), "empty response"
+    await aclose_http_clients()
+    return prompts / elapsed
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--prompts", type=int, default=32, help="동시에 생성할 참가자(프롬프트) 수")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--window-ms", type=float, default=20)
+    parser.add_argument("--no-batch-endpoint", action="store_true", help="batch 미지원 서버 (단건 fallback 확인)")
+    args = parser.parse_args()
+
+    FakeGPUHandler.batch_supported = not args.no_batch_endpoint
+    server = FakeGPUServer(("127.0.0.1", 0), FakeGPUHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    os.environ["USE_LLM"] = "true"
+    os.environ["GPU_API_URL"] = f"http://127.0.0.1:{server.server_port}/llm/generate"
+
+    print(f"prompts={args.prompts}, window={args.window_ms}ms, batch endpoint={'on' if FakeGPUHandler.batch_supported else 'off'}")
+    print(f"{'batch size':>10} | {'prompts/s':>9} | {'speedup':>7}")
+    baseline = None
+    for size in args.batch_sizes:
+        throughput = await measure(args.prompts, size, args.window_ms / 1000)
+        baseline = baseline or throughput
+        print(f"{size:>10} | {throughput:>9.1f} | {throughput / baseline:>6.1f}x")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,136 @@
+# benchmarks/bench_polly_stream.py
+# PollyClient.synthesize_to_s3: 기존(임시 파일 + upload_file) vs 스트리밍(upload_fileobj)
+# 지연 시간과 peak RSS를 비교합니다. Polly/S3는 로컬 HTTP stand-in 서버로 대체하고,
+# 클라이언트는 실제 boto3를 사용합니다 (endpoint_url만 로컬로 변경).
+#
+#   python -m benchmarks.bench_polly_stream --audio-kb 512 --calls 50
+
+import os
+import sys
+import time
+import uuid
+import argparse
+import resource
+import tempfile
+import threading
+import subprocess
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1: keep-alive + botocore의 "Expect: 100-continue" 처리
+    protocol_version = "HTTP/1.1"
+    audio_bytes = b""
+
+    def do_POST(self):  # Polly SynthesizeSpeech
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "audio/mpeg")
+        self.send_header("Content-Length", str(len(self.audio_bytes)))
+        self.end_headers()
+        self.wfile.write(self.audio_bytes)
+
+    def do_PUT(self):  # S3 PutObject
+        remaining = int(self.headers.get("Content-Length", 0))
+        while remaining > 0:
+            remaining -= len(self.rfile.read(min(remaining, 64 * 1024)))
+        self.send_response(200)
+        self.send_header("ETag", '"bench"')
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+def start_server(audio_kb: int) -> ThreadingHTTPServer:
+    StandInHandler.audio_bytes = os.urandom(audio_kb * 1024)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def make_clients(endpoint: str):
+    import boto3
+    from botocore.config import Config
+
+    config = Config(
+        max_pool_connections=32,
+        s3={"addressing_style": "path"},
+        request_checksum_calculation="when_required",
+    )
+    kwargs = dict(region_name="us-east-1", endpoint_url=endpoint,
+                  aws_access_key_id="bench", aws_secret_access_key="bench", config=config)
+    return boto3.client("polly", **kwargs), boto3.client("s3", **kwargs)
+
+
+def legacy_synthesize_to_s3(polly, s3, bucket: str, text: str, filename: str) -> str:
+    """변경 전 구현: 전체 스트림을 메모리로 읽고 임시 파일에 쓴 뒤 upload_file"""
+    response = polly.synthesize_speech(Text=text, OutputFormat="mp3", VoiceId="Seoyeon")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        local_path = os.path.join(tmpdir, filename)
+        with open(local_path, "wb") as f:
+            f.write(response["AudioStream"].read())
+        s3.upload_file(local_path, bucket, filename)
+    return filename
+
+
+def run_variant(variant: str, audio_kb: int, calls: int):
+    """자식 프로세스에서 한 가지 구현만 실행 (ru_maxrss를 구현별로 분리하기 위함)"""
+    server = start_server(audio_kb)
+    endpoint = f"http://127.0.0.1:{server.server_address[1]}"
+    polly, s3 = make_clients(endpoint)
+
+    os.environ.setdefault("S3_BUCKET_NAME", "bench-bucket")
+    os.environ["TTS_CACHE_ENABLED"] = "false"
+    from interview.infra.tts.polly_client import PollyClient
+    client = PollyClient(polly_client=polly, s3_client=s3)
+
+    def call(i: int):
+        filename = f"{uuid.uuid4().hex}.mp3"
+        if variant == "legacy":
+            legacy_synthesize_to_s3(polly, s3, "bench-bucket", "자기소개 부탁드립니다.", filename)
+        else:
+            client.synthesize_to_s3("자기소개 부탁드립니다.", filename=filename)
+
+    call(0)  # warm-up (커넥션 수립)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    latencies = []
+    for i in range(calls):
+        start = time.perf_counter()
+        call(i)
+        latencies.append(time.perf_counter() - start)
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    server.shutdown()
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000
+    print(f"{variant},{p50:.2f},{p99:.2f},{rss_after},{rss_after - rss_before}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--audio-kb", type=int, default=512, help="합성 오디오 크기(KB)")
+    parser.add_argument("--calls", type=int, default=50)
+    parser.add_argument("--variant", choices=["legacy", "stream"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.variant:
+        run_variant(args.variant, args.audio_kb, args.calls)
+        return
+
+    print(f"audio={args.audio_kb}KB, calls={args.calls}")
+    print(f"{'variant':>8} | {'p50(ms)':>8} | {'p99(ms)':>8} | {'peak RSS(KB)':>12} | {'RSS growth(KB)':>14}")
+    for variant in ("legacy", "stream"):
+        out = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_polly_stream", "--variant", variant,
+             "--audio-kb", str(args.audio_kb), "--calls", str(args.calls)],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip().splitlines()[-1]
+        name, p50, p99, peak, growth = out.split(",")
+        print(f"{name:>8} | {float(p50):>8.2f} | {float(p99):>8.2f} | {int(peak):>12} | {int(growth):>14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+# benchmarks/bench_session_codec.py
+# SESSION_CODEC 별 세션 항목 크기, DynamoDB 용량 단위(RCU/WCU), encode/decode CPU 비교
+#
+#   python -m benchmarks.bench_session_codec --questions 5 --follow-ups 2 --sessions 50
+#
+# 크기는 DynamoDB 의 항목 크기 계산 규칙(속성 이름 + 값, List/Map 은 3바이트 + 원소당 1바이트)으로 추정합니다.
+# WCU 는 1KB, 강한 일관성 RCU 는 4KB 단위로 올림합니다. UpdateItem 도 변경 크기가 아니라 항목 전체 크기로 과금되므로
+# 답변을 저장할 때마다 그 시점의 항목 크기만큼 WCU 를 씁니다.
+
+import copy
+import math
+import time
+import random
+import argparse
+from decimal import Decimal
+
+from interview.domain.interview import Cursor, FollowUpQA, InterviewSession, QA
+from interview.infra.repository.codec import codec_id, decode_document, encode_document
+
+# 면접 답변에 흔한 문장. 무작위로 섞고 숫자를 바꿔 같은 문장이 그대로 반복되지 않게 합니다.
+SENTENCES = [
+    "저는 이전 회사에서 주문 처리 시스템의 백엔드를 {n}년 동안 담당했습니다.",
+    "트래픽이 평소보다 {n}배 늘어나는 이벤트 기간에 응답 지연이 크게 증가하는 문제가 있었습니다.",
+    "원인을 분석해 보니 데이터베이스 커넥션 풀이 고갈되면서 요청이 대기열에 쌓이고 있었습니다.",
+    "그래서 읽기 요청을 캐시 계층으로 분리하고 쓰기 요청은 메시지 큐를 통해 비동기로 처리하도록 바꿨습니다.",
+    "그 결과 평균 응답 시간이 {n}0% 정도 줄었고 장애 없이 이벤트를 마칠 수 있었습니다.",
+    "팀원들과 의견이 달랐을 때는 먼저 각자의 근거를 문서로 정리해서 공유하자고 제안했습니다.",
+    "데이터를 기준으로 이야기하니 감정적인 대립 없이 결론을 낼 수 있었습니다.",
+    "이 경험을 통해 기술적인 선택에도 합의 과정이 중요하다는 것을 배웠습니다.",
+    "코드 리뷰에서는 변경 이유와 영향 범위를 먼저 설명하고 테스트 결과를 함께 첨부하는 편입니다.",
+    "신입 개발자 {n}명의 온보딩을 맡아 개발 환경 구축 문서를 새로 작성하기도 했습니다.",
+    "장애가 발생했을 때는 먼저 영향 범위를 파악하고 고객 공지를 한 뒤 근본 원인을 찾았습니다.",
+    "사후 회고에서는 재발 방지를 위해 모니터링 지표와 알림 기준을 {n}가지 추가했습니다.",
+    "지원한 직무에서는 대규모 트래픽을 안정적으로 처리하는 경험을 더 쌓고 싶습니다.",
+    "부족한 점은 프론트엔드 경험이 적다는 것인데 최근 개인 프로젝트로 보완하고 있습니다.",
+    "입사 후에는 서비스 지표를 직접 개선하는 데 기여하는 개발자가 되고 싶습니다.",
+]
+FEEDBACK = [
+    "답변의 구조가 상황, 행동, 결과 순서로 명확해 이해하기 쉬웠습니다.",
+    "구체적인 수치를 제시한 점이 설득력을 높였습니다.",
+    "다만 본인의 역할과 팀의 역할이 섞여 있어 기여도가 분명하게 드러나지 않았습니다.",
+    "비슷한 상황이 다시 온다면 어떻게 다르게 접근할지 덧붙이면 더 좋겠습니다.",
+    "질문의 의도와 직접 관련이 적은 설명이 {n}문장 정도 포함되어 답변이 길어졌습니다.",
+    "기술 용어를 정확하게 사용했고 선택의 근거를 잘 설명했습니다.",
+    "결론을 먼저 말하고 근거를 이어서 설명하면 전달력이 좋아집니다.",
+]
+
+
+def _text(rng: random.Random, pool, chars: int) -> str:
+    parts, length = [], 0
+    while length < chars:
+        sentence = rng.choice(pool).format(n=rng.randint(2, 9))
+        parts.append(sentence)
+        length += len(sentence) + 1
+    return " ".join(parts)
+
+
+def make_session(rng: random.Random, index: int, questions: int, follow_ups: int, answer_chars: int) -> InterviewSession:
+    qa_flow = []
+    for q in range(questions):
+        qa_flow.append(QA(
+            question=_text(rng, SENTENCES, 80) + " 그 경험에 대해 설명해 주세요.",
+            answer=_text(rng, SENTENCES, answer_chars),
+            audio_path=f"https://bucket.s3.amazonaws.com/tts/{index}/{q}.mp3",
+            follow_up_length=follow_ups,
+            follow_ups=[
+                FollowUpQA(question=_text(rng, SENTENCES, 60) + " 조금 더 구체적으로 말씀해 주세요.",
+                           answer=_text(rng, SENTENCES, answer_chars // 2),
+                           audio_path=f"https://bucket.s3.amazonaws.com/tts/{index}/{q}-{f}.mp3")
+                for f in range(follow_ups)
+            ],
+            feedback=_text(rng, FEEDBACK, 600),
+        ))
+    return InterviewSession(
+        interview_id=str(index), member_interview_id="1", session_id=f"session-{index}",
+        cursor=Cursor(q_idx=questions - 1, f_idx=follow_ups - 1), question_length=questions,
+        qa_flow=qa_flow, final_report=_text(rng, FEEDBACK, 3000), version=questions * (follow_ups + 2),
+    )
+
+
+def dynamo_size(value, name: str = "") -> int:
+    """DynamoDB 항목(속성) 크기 추정 (bytes)"""
+    size = len(name.encode("utf-8"))
+    if value is None or isinstance(value, bool):
+        return size + 1
+    if isinstance(value, str):
+        return size + len(value.encode("utf-8"))
+    if isinstance(value, (bytes, bytearray)):
+        return size + len(value)
+    if isinstance(value, (int, float, Decimal)):
+        digits = len(str(abs(value)).replace(".", "").lstrip("0")) or 1
+        return size + math.ceil(digits / 2) + 1
+    if isinstance(value, dict):
+        return size + 3 + sum(dynamo_size(v, k) + 1 for k, v in value.items())
+    if isinstance(value, list):
+        return size + 3 + sum(dynamo_size(v) + 1 for v in value)
+    raise TypeError(type(value))
+
+
+def _item_size(doc: dict) -> int:
+    return sum(dynamo_size(v, k) for k, v in doc.items())
+
+
+def _partial(session: InterviewSession, answered: int) -> InterviewSession:
+    """답변을 answered 개 저장한 시점의 세션 (이후 답변/피드백/리포트는 아직 없음)"""
+    partial = session.model_copy(deep=True)
+    for i, qa in enumerate(partial.qa_flow):
+        if i >= answered:
+            qa.answer = qa.feedback = None
+            qa.follow_ups = [f.model_copy(update={"answer": None}) for f in qa.follow_ups or []]
+    partial.final_report = None
+    return partial
+
+
+def measure(codec_name: str, sessions, repeat: int) -> dict:
+    codec = codec_id(codec_name)
+    docs = [encode_document(s.dict(), codec) for s in sessions]
+    sizes = [_item_size(doc) for doc in docs]
+
+    # 질문마다 답변 저장(UpdateItem) 1번씩 할 때 누적 WCU
+    lifecycle_wcu = 0
+    for session in sessions:
+        for answered in range(1, session.question_length + 1):
+            lifecycle_wcu += math.ceil(_item_size(encode_document(_partial(session, answered).dict(), codec)) / 1024)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for session in sessions:
+            encode_document(session.dict(), codec)
+    encode = (time.perf_counter() - start) / (repeat * len(sessions))
+
+    # decode_document 는 제자리에서 풀기 때문에 매번 드라이버가 돌려준 것 같은 새 문서를 씁니다.
+    fresh = [[copy.deepcopy(doc) for doc in docs] for _ in range(repeat)]
+    start = time.perf_counter()
+    for batch in fresh:
+        for doc in batch:
+            InterviewSession(**decode_document(doc))
+    decode = (time.perf_counter() - start) / (repeat * len(sessions))
+
+    return {
+        "avg_kb": sum(sizes) / len(sizes) / 1024,
+        "max_kb": max(sizes) / 1024,
+        "wcu": sum(math.ceil(s / 1024) for s in sizes) / len(sizes),
+        "rcu": sum(math.ceil(s / 4096) for s in sizes) / len(sizes),
+        "lifecycle_wcu": lifecycle_wcu / len(sessions),
+        "encode_us": encode * 1e6,
+        "decode_us": decode * 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--codecs", nargs="+", default=["none", "zlib", "zstd"])
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--questions", type=int, default=5)
+    parser.add_argument("--follow-ups", type=int, default=2)
+    parser.add_argument("--answer-chars", type=int, default=1200, help="메인 답변 글자 수 (꼬리 질문 답변은 절반)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    sessions = [make_session(rng, i, args.questions, args.follow_ups, args.answer_chars) for i in range(args.sessions)]
+    print(f"sessions={args.sessions}, questions={args.questions}, follow_ups={args.follow_ups}, "
+          f"answer_chars={args.answer_chars}")
+    print(f"{'codec':>6} | {'avg KB':>7} | {'max KB':>7} | {'put WCU':>7} | {'get RCU':>7} | "
+          f"{'answers WCU':>11} | {'encode(us)':>10} | {'decode(us)':>10}")
+    for name in args.codecs:
+        try:
+            r = measure(name, sessions, args.repeat)
+        except RuntimeError as e:
+            print(f"{name:>6} | skipped: {e}")
+            continue
+        print(f"{name:>6} | {r['avg_kb']:>7.1f} | {r['max_kb']:>7.1f} | {r['wcu']:>7.1f} | {r['rcu']:>7.1f} | "
+              f"{r['lifecycle_wcu']:>11.1f} | {r['encode_us']:>10.0f} | {r['decode_us']:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
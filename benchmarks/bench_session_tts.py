@@ -0,0 +1,48 @@
+# benchmarks/bench_session_tts.py
+# 질문 수에 따른 create_session_with_questions 지연 시간 (TTS 순차 vs 병렬)
+#
+#   python -m benchmarks.bench_session_tts --tts-latency 0.2 --concurrency 8
+
+import argparse
+import asyncio
+import time
+
+from interview.application.interview_service import InterviewService
+from benchmarks.fakes import MemoryRepository, StubLLMClient, StubTTSClient, make_info
+
+
+async def measure(question_count: int, concurrency: int, tts_latency: float, repeat: int) -> float:
+    service = InterviewService(
+        repo=MemoryRepository(),
+        llm=StubLLMClient(),
+        tts=StubTTSClient(latency=tts_latency),
+        ocr=None,
+        tts_limiter=asyncio.Semaphore(concurrency),
+    )
+    info = make_info(participants=1, question_number=question_count)
+    elapsed = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await service.create_session_with_questions("1", "1", info)
+        elapsed.append(time.perf_counter() - start)
+    return sum(elapsed) / len(elapsed)
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tts-latency", type=float, default=0.1, help="stub TTS 1회 지연(초)")
+    parser.add_argument("--concurrency", type=int, default=8, help="병렬 TTS 상한")
+    parser.add_argument("--questions", type=int, nargs="+", default=[1, 3, 5, 10, 20])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"tts_latency={args.tts_latency}s, concurrency={args.concurrency}")
+    print(f"{'questions':>9} | {'sequential(ms)':>14} | {'parallel(ms)':>12} | {'speedup':>7}")
+    for n in args.questions:
+        seq = await measure(n, 1, args.tts_latency, args.repeat)
+        par = await measure(n, args.concurrency, args.tts_latency, args.repeat)
+        print(f"{n:>9} | {seq * 1000:>14.1f} | {par * 1000:>12.1f} | {seq / par:>6.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
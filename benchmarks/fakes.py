@@ -0,0 +1,198 @@
+# benchmarks/fakes.py
+# 외부 서비스(LLM, Polly/S3, DB) 없이 InterviewService를 구동하기 위한 stub 구현
+
+import time
+import random
+import asyncio
+import threading
+from interview.domain.interview import InterviewSession
+from interview.domain.repository.interview_repo import InterviewRepository, SessionConflictError
+from interview.domain.llm.llm_client import LLMClient
+from interview.domain.tts.tts_client import TTSClient
+
+
+class Delay:
+    """고정 지연 ± jitter 비율 만큼의 균등 분포. seed가 같으면 같은 순서의 지연을 돌려줍니다."""
+
+    def __init__(self, base: float = 0.0, jitter: float = 0.0, seed: int = 0):
+        self.base = base
+        self.jitter = jitter
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()  # TTS stub은 to_thread 워커에서 호출됩니다
+
+    def sample(self) -> float:
+        if not self.jitter or not self.base:
+            return self.base
+        with self._lock:
+            return max(0.0, self.base * (1 + self.jitter * self._rng.uniform(-1, 1)))
+
+
+class MemoryRepository(InterviewRepository):
+    """
+    실제 저장소처럼 dict로 직렬화해 보관합니다 (읽을 때마다 새 객체).
+    latency를 주면 실제 드라이버(pymongo/boto3)처럼 호출마다 이벤트 루프를 막고 기다립니다.
+    update_session 은 실제 저장소처럼 version 이 다르면 SessionConflictError 를 올립니다 (동시 쓰기가 서로 덮어쓰지 않도록).
+    """
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, seed: int = 0):
+        self.items = {}
+        self._delay = Delay(latency, jitter, seed)
+        self._lock = threading.Lock()  # 동기 저장소는 여러 thread 에서 호출됩니다
+
+    def _wait(self):
+        delay = self._delay.sample()
+        if delay:
+            time.sleep(delay)
+
+    def save_session(self, session: InterviewSession) -> InterviewSession:
+        self._wait()
+        with self._lock:
+            self._store(session)
+        return session
+
+    def update_session(self, session: InterviewSession) -> InterviewSession:
+        self._wait()
+        with self._lock:
+            current = self.items.get(session.session_id)
+            if current is not None and current["version"] != session.version:
+                raise SessionConflictError(session.session_id, session.version)
+            self._store(session)
+        return session
+
+    def _store(self, session: InterviewSession):
+        session.version += 1
+        session.mark_clean()
+        self.items[session.session_id] = session.model_dump()
+
+    def get_all_sessions(self):
+        self._wait()
+        return [InterviewSession(**item) for item in self.items.values()]
+
+    def get_session_by_interview_and_member_interview_id(self, interview_id: str, member_interview_id: str):
+        self._wait()
+        for item in self.items.values():
+            if item["interview_id"] == interview_id and item["member_interview_id"] == member_interview_id:
+                return InterviewSession(**item)
+        return None
+
+    def get_session_by_id(self, session_id: str):
+        self._wait()
+        item = self.items.get(session_id)
+        return InterviewSession(**item) if item else None
+
+    def delete_session(self, session_id: str) -> bool:
+        self._wait()
+        return self.items.pop(session_id, None) is not None
+
+    def delete_all_sessions(self) -> int:
+        self._wait()
+        count = len(self.items)
+        self.items.clear()
+        return count
+
+
+class StubTTSClient(TTSClient):
+    """Polly + S3 왕복을 time.sleep(latency)로 흉내냅니다."""
+
+    def __init__(self, latency: float = 0.05, jitter: float = 0.0, seed: int = 0):
+        self.latency = latency
+        self.calls = 0
+        self._delay = Delay(latency, jitter, seed)
+
+    def synthesize_to_s3(self, text: str, voice_id: str = "Seoyeon", filename: str = None) -> str:
+        self.calls += 1
+        time.sleep(self._delay.sample())
+        return filename
+
+
+class StubLLMClient(LLMClient):
+    """questionNumber 만큼 질문을 돌려주는 고정 응답 LLM"""
+
+    def __init__(self, latency: float = 0.0, token_latency: float = 0.0, jitter: float = 0.0, seed: int = 0):
+        self.latency = latency
+        self._delay = Delay(latency, jitter, seed)
+        # 꼬리 질문 스트리밍 시 글자(토큰) 하나당 지연. 0이면 latency 후 한 번에 돌려줍니다.
+        self.token_latency = token_latency
+
+    def generate_questions(self, info: dict, cover_letter) -> str:
+        count = info["result"]["options"]["questionNumber"]
+        return "\n".join(f"{i + 1}. 질문 {i + 1}" for i in range(count))
+
+    def generate_follow_up(self, session: InterviewSession, index: int) -> list:
+        return [f"{index}번 질문 꼬리 질문 1", f"{index}번 질문 꼬리 질문 2"]
+
+    def generate_feedback(self, session: InterviewSession, index: int) -> str:
+        return "논리적으로 잘 설명했으나, 구체적인 사례가 부족합니다."
+
+    def generate_final_report(self, session: InterviewSession) -> str:
+        return "지원자는 문제 해결 능력과 협업 역량이 뛰어나며, 직무 적합성이 높습니다."
+
+    async def agenerate_questions(self, info: dict, cover_letter) -> str:
+        await asyncio.sleep(self._delay.sample())
+        return self.generate_questions(info, cover_letter)
+
+    async def agenerate_follow_up(self, session: InterviewSession, index: int) -> list:
+        if self.token_latency:
+            text = "\n".join(self.generate_follow_up(session, index))
+            await asyncio.sleep(self._delay.sample() + self.token_latency * len(text))
+        else:
+            await asyncio.sleep(self._delay.sample())
+        return self.generate_follow_up(session, index)
+
+    async def astream_follow_up(self, session: InterviewSession, index: int):
+        if not self.token_latency:
+            async for question in super().astream_follow_up(session, index):
+                yield question
+            return
+        await asyncio.sleep(self._delay.sample())
+        for question in self.generate_follow_up(session, index):
+            await asyncio.sleep(self.token_latency * (len(question) + 1))
+            yield question
+
+    async def agenerate_feedback(self, session: InterviewSession, index: int) -> str:
+        await asyncio.sleep(self._delay.sample())
+        return self.generate_feedback(session, index)
+
+    async def agenerate_final_report(self, session: InterviewSession) -> str:
+        await asyncio.sleep(self._delay.sample())
+        return self.generate_final_report(session)
+
+
+def make_info(participants: int = 1, question_number: int = 5, interview_id: int = 1) -> dict:
+    """InfoModel 형태의 요청 payload"""
+    return {
+        "isSuccess": True,
+        "code": "COMMON200",
+        "message": "성공입니다.",
+        "result": {
+            "interviewId": interview_id,
+            "interview": {
+                "interviewId": interview_id,
+                "corporateName": "인잡",
+                "jobName": "백엔드 개발자",
+                "startType": "NOW",
+                "participantCount": participants,
+            },
+            "options": {
+                "interviewFormat": "INDIVIDUAL",
+                "interviewType": "PERSONALITY",
+                "voiceType": "FEMALE20",
+                "questionNumber": question_number,
+                "answerTime": 60,
+            },
+            "participants": [
+                {
+                    "memberInterviewId": i + 1,
+                    "resumeDTO": {"resumeId": i + 1, "fileUrl": "https://example.com/resume.pdf"},
+                    "coverLetterDTO": {
+                        "coverletterId": i + 1,
+                        "corporateName": "인잡",
+                        "jobName": "백엔드 개발자",
+                        "qnaList": [{"question": "지원 동기는?", "answer": "성장하고 싶어서입니다."}],
+                        "createdAt": "2025-01-01T00:00:00",
+                    },
+                }
+                for i in range(participants)
+            ],
+        },
+    }
@@ -0,0 +1,130 @@
+# benchmarks/loadtest/__main__.py
+# 외부 서비스 없이 면접 전체 흐름을 동시에 N 건 돌려 endpoint 별 p50/p95/p99 와 sessions/s 를 측정합니다.
+# LLM / TTS / 저장소 / Transcribe 는 지연을 주입한 결정적 fake 입니다 (benchmarks/fakes.py, transcribe.py).
+#
+#   python -m benchmarks.loadtest --transport http ws --concurrency 1 8 32
+#   python -m benchmarks.loadtest --save-baseline        # benchmarks/loadtest/baseline.json 갱신
+#   python -m benchmarks.loadtest --compare              # baseline 대비 regression 이 있으면 exit 1
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+import logging
+from dataclasses import asdict
+
+import httpx
+
+from benchmarks.loadtest.stack import FakeLatency, Stack
+from benchmarks.loadtest.interviews import InterviewClient, Scenario, synthetic_pcm
+from benchmarks.loadtest.report import Recorder, compare, format_run, load_baseline, run_result, save_baseline
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+async def run_level(stack: Stack, scenario: Scenario, concurrency: int, interviews: int, first_id: int) -> dict:
+    recorder = Recorder()
+    stack.reset(recorder)
+    speech = synthetic_pcm(scenario.speech_seconds)
+    limits = httpx.Limits(max_connections=concurrency * 2, max_keepalive_connections=concurrency * 2)
+    failed = 0
+
+    async with httpx.AsyncClient(base_url=stack.base_url, timeout=60.0, limits=limits) as http:
+        client = InterviewClient(stack, http, scenario, recorder, speech)
+        ids = iter(range(first_id, first_id + interviews))
+
+        async def worker():
+            nonlocal failed
+            for interview_id in ids:
+                try:
+                    await client.run(interview_id)
+                except Exception as e:
+                    failed += 1
+                    logging.warning(f"interview {interview_id} failed: {e!r}")
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        wall = time.perf_counter() - start
+    return run_result(recorder, interviews - failed, failed, wall)
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--transport", nargs="+", choices=["http", "ws"], default=["http", "ws"])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32], help="동시에 진행하는 면접 수")
+    parser.add_argument("--interviews", type=int, default=None, help="단계별 면접 수 (기본 concurrency × 2)")
+    parser.add_argument("--questions", type=int, default=3)
+    parser.add_argument("--stream-follow-ups", action="store_true", help="꼬리 질문을 NDJSON 스트림 endpoint 로 요청")
+    parser.add_argument("--speech-seconds", type=float, default=1.0, help="ws 답변 한 번의 합성 음성 길이")
+    parser.add_argument("--audio-pace", type=float, default=0.1, help="음성 전송 속도 (1.0 = 실시간, 0 = 대기 없음)")
+    parser.add_argument("--llm-latency", type=float, default=0.2)
+    parser.add_argument("--llm-token-latency", type=float, default=0.0)
+    parser.add_argument("--tts-latency", type=float, default=0.05)
+    parser.add_argument("--repo-latency", type=float, default=0.002)
+    parser.add_argument("--stt-latency", type=float, default=0.15)
+    parser.add_argument("--jitter", type=float, default=0.3, help="지연 ± 비율 (균등 분포)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.25, help="regression 판단 비율")
+    parser.add_argument("--min-delta-ms", type=float, default=5.0, help="이보다 작은 지연 증가는 무시")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.INFO if args.verbose else logging.WARNING)
+
+    latency = FakeLatency(
+        llm=args.llm_latency, llm_token=args.llm_token_latency, tts=args.tts_latency,
+        repo=args.repo_latency, stt=args.stt_latency, jitter=args.jitter, seed=args.seed,
+    )
+    stack = Stack(latency)
+    await stack.start()
+    runs = {}
+    next_id = 1
+    try:
+        for transport in args.transport:
+            scenario = Scenario(
+                transport=transport, questions=args.questions, stream_follow_ups=args.stream_follow_ups,
+                speech_seconds=args.speech_seconds, audio_pace=args.audio_pace,
+            )
+            for concurrency in args.concurrency:
+                interviews = args.interviews or concurrency * 2
+                key = f"{transport}@{concurrency}"
+                runs[key] = await run_level(stack, scenario, concurrency, interviews, next_id)
+                next_id += interviews
+                print(format_run(key, runs[key]), flush=True)
+    finally:
+        await stack.stop()
+
+    config = {
+        "latency": asdict(latency), "questions": args.questions, "stream_follow_ups": args.stream_follow_ups,
+        "speech_seconds": args.speech_seconds, "audio_pace": args.audio_pace, "interviews": args.interviews,
+    }
+    if args.save_baseline:
+        save_baseline(args.baseline, config, runs)
+        print(f"baseline saved → {args.baseline}")
+        return 0
+    if not args.compare:
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print(f"baseline 파일이 없습니다: {args.baseline}")
+        return 1
+    if baseline["config"] != config:
+        print("⚠️ baseline 과 설정이 다릅니다. 비교 결과를 그대로 믿기 어렵습니다.")
+    lines, regressions = compare(baseline, runs, args.threshold, args.min_delta_ms)
+    print("\n".join(lines))
+    if regressions:
+        print(f"\n❌ regression {len(regressions)}건")
+        for item in regressions:
+            print(f"  - {item}")
+        return 1
+    print("\n✅ baseline 대비 regression 없음")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
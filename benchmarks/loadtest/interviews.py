@@ -0,0 +1,171 @@
+# benchmarks/loadtest/interviews.py
+# 면접 한 건을 처음부터 끝까지 진행하는 가상 클라이언트
+#
+#   질문 생성 → (메인 답변 → 꼬리 질문 생성 → 꼬리 질문 답변들) × 질문 수 → 피드백/최종 리포트 완료 대기
+#
+# transport="http": 모든 단계를 FastAPI 에 직접 요청합니다.
+# transport="ws"  : 질문 생성은 ws_server 의 init/ready 흐름으로, 답변은 ws_client.py 처럼 PCM 을 흘려보내
+#                   (fake) Transcribe → ws_server 의 PATCH 로 저장됩니다. 꼬리 질문 생성은 HTTP 입니다.
+
+import json
+import math
+import time
+import asyncio
+import struct
+from dataclasses import dataclass
+from urllib.parse import urlencode
+
+import httpx
+import websockets
+
+from benchmarks.fakes import make_info
+from benchmarks.loadtest.report import Recorder
+from benchmarks.loadtest.stack import Stack
+from benchmarks.loadtest.transcribe import BYTES_PER_SECOND
+
+CHUNK_BYTES = 3200  # 16kHz PCM 16-bit mono → 100ms (ws_client.py 와 같음)
+CHUNK_SECONDS = CHUNK_BYTES / BYTES_PER_SECOND
+SILENCE_CHUNKS = 3
+MEMBER_ID = "1"
+
+
+def synthetic_pcm(seconds: float, frequency: float = 220.0) -> list:
+    """사인파 음성 chunk 목록 (16-bit little-endian)"""
+    samples = int(seconds * BYTES_PER_SECOND / 2)
+    data = b"".join(
+        struct.pack("<h", int(8000 * math.sin(2 * math.pi * frequency * i / (BYTES_PER_SECOND / 2))))
+        for i in range(samples)
+    )
+    return [data[i:i + CHUNK_BYTES] for i in range(0, len(data), CHUNK_BYTES)]
+
+
+@dataclass
+class Scenario:
+    transport: str = "http"
+    questions: int = 3
+    stream_follow_ups: bool = False
+    speech_seconds: float = 1.0
+    audio_pace: float = 0.1       # 1.0 = 실시간, 0 = 대기 없이 전송
+    report_timeout: float = 60.0
+
+
+class InterviewClient:
+    def __init__(self, stack: Stack, http: httpx.AsyncClient, scenario: Scenario, recorder: Recorder, speech: list):
+        self.stack = stack
+        self.http = http
+        self.scenario = scenario
+        self.recorder = recorder
+        self.speech = speech
+
+    async def run(self, interview_id: int):
+        start = time.perf_counter()
+        if self.scenario.transport == "ws":
+            session_id = await self._generate_over_ws(interview_id)
+        else:
+            session_id = await self._generate_over_http(interview_id)
+
+        for index in range(self.scenario.questions):
+            await self._answer(session_id, index, -1)
+            follow_ups = await self._follow_ups(session_id, index)
+            for f_index in range(follow_ups):
+                await self._answer(session_id, index, f_index)
+
+        answered = time.perf_counter()
+        await self._wait_for_report(session_id)
+        now = time.perf_counter()
+        self.recorder.observe("client: last answer → final report", now - answered)
+        self.recorder.observe("client: interview total", now - start)
+
+    # ─────────────────── 질문 생성 ────────────────────
+    async def _generate_over_http(self, interview_id: int) -> str:
+        info = make_info(participants=1, question_number=self.scenario.questions, interview_id=interview_id)
+        response = await self.http.post("/interview/generate_questions", json=info)
+        response.raise_for_status()
+        return response.json()[0]["session_id"]
+
+    async def _generate_over_ws(self, interview_id: int) -> str:
+        info = make_info(participants=1, question_number=self.scenario.questions, interview_id=interview_id)
+        query = urlencode({"session_id": f"lobby-{interview_id}", "participant_id": MEMBER_ID})
+        start = time.perf_counter()
+        async with websockets.connect(f"{self.stack.ws_url}/?{query}") as ws:
+            await ws.send(json.dumps({"type": "init", "expected_participants": [MEMBER_ID], "info_payload": info}))
+            await ws.send(json.dumps({"type": "ready"}))
+            async for message in ws:
+                event = json.loads(message)
+                if event.get("type") == "all_ready":
+                    break
+                if event.get("type") == "error":
+                    raise RuntimeError(event.get("message"))
+        self.recorder.observe("client: ws ready → all_ready", time.perf_counter() - start)
+        response = await self.http.get(f"/interview/session/{interview_id}/{MEMBER_ID}")
+        response.raise_for_status()
+        return response.json()["session_id"]
+
+    # ─────────────────── 답변 ────────────────────
+    def _answer_path(self, session_id: str, index: int, f_index: int) -> str:
+        if f_index == -1:
+            return f"/interview/session/{session_id}/qa/{index}/answer"
+        return f"/interview/session/{session_id}/qa/{index}/follow-up/{f_index}/answer"
+
+    async def _answer(self, session_id: str, index: int, f_index: int):
+        path = self._answer_path(session_id, index, f_index)
+        if self.scenario.transport != "ws":
+            response = await self.http.patch(path, content="합성 답변입니다.", headers={"Content-Type": "text/plain"})
+            response.raise_for_status()
+            return
+
+        saved = self.recorder.wait_for_request("PATCH", path)
+        query = urlencode({"session_id": session_id, "index": index, "f_index": f_index,
+                           "participant_id": MEMBER_ID, "mode": "stt"})
+        async with websockets.connect(f"{self.stack.ws_url}/?{query}") as ws:
+            for chunk in self.speech:
+                await ws.send(chunk)
+                if self.scenario.audio_pace:
+                    await asyncio.sleep(CHUNK_SECONDS * self.scenario.audio_pace)
+            speech_end = time.perf_counter()
+            for _ in range(SILENCE_CHUNKS):
+                await ws.send(bytes(CHUNK_BYTES))
+            async for message in ws:
+                event = json.loads(message)
+                if event.get("type") == "stt_status" and event.get("status") == "end":
+                    self.recorder.observe("client: ws speech end → stt_text", time.perf_counter() - speech_end)
+                    break
+            status = await asyncio.wait_for(saved, timeout=30)
+        self.recorder.observe("client: ws speech end → answer saved", time.perf_counter() - speech_end)
+        if status >= 400:
+            raise RuntimeError(f"answer PATCH failed with {status}")
+
+    # ─────────────────── 꼬리 질문 ────────────────────
+    async def _follow_ups(self, session_id: str, index: int) -> int:
+        path = f"/interview/session/{session_id}/qa/{index}/generate_follow-ups"
+        if not self.scenario.stream_follow_ups:
+            response = await self.http.post(path)
+            response.raise_for_status()
+            return len(response.json()["qa_flow"][index]["follow_ups"])
+
+        start = time.perf_counter()
+        count = 0
+        async with self.http.stream("POST", f"{path}/stream") as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                event = json.loads(line)
+                if event["type"] == "follow_up":
+                    if count == 0:
+                        self.recorder.observe("client: follow-up stream first event", time.perf_counter() - start)
+                    count += 1
+                elif event["type"] == "error":
+                    raise RuntimeError(event["message"])
+        return count
+
+    # ─────────────────── 피드백 / 최종 리포트 ────────────────────
+    async def _wait_for_report(self, session_id: str):
+        # 백그라운드 job 결과는 (지연 없는) 저장소를 직접 봅니다. HTTP 로 polling 하면 부하가 섞입니다.
+        deadline = time.perf_counter() + self.scenario.report_timeout
+        while time.perf_counter() < deadline:
+            item = self.stack.repo.items.get(session_id)
+            if item and item.get("final_report"):
+                return
+            await asyncio.sleep(0.02)
+        raise TimeoutError(f"final report for {session_id} not ready after {self.scenario.report_timeout}s")
@@ -0,0 +1,130 @@
+# benchmarks/loadtest/report.py
+# 지연 시간 기록, p50/p95/p99 집계, baseline 저장/비교
+
+import json
+import math
+import asyncio
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(values: List[float], q: float) -> float:
+    """nearest-rank 백분위"""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(len(ordered) * q / 100))
+    return ordered[rank - 1]
+
+
+class Recorder:
+    """
+    이름(endpoint / 클라이언트 측 구간) 별 지연 시간과 오류 수.
+    같은 이벤트 루프 안에서 특정 HTTP 요청이 끝나기를 기다릴 수도 있습니다 (wait_for_request).
+    """
+
+    def __init__(self):
+        self.samples: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self._waiters: Dict[Tuple[str, str], List[asyncio.Future]] = defaultdict(list)
+
+    def observe(self, name: str, seconds: float, ok: bool = True):
+        self.samples[name].append(seconds)
+        if not ok:
+            self.errors[name] += 1
+
+    def wait_for_request(self, method: str, path: str) -> asyncio.Future:
+        """요청을 보내기 전에 호출해야 합니다. 요청이 끝나면 status code 로 resolve 됩니다."""
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[(method, path)].append(future)
+        return future
+
+    def request_finished(self, method: str, path: str, status: int):
+        waiters = self._waiters.pop((method, path), [])
+        for future in waiters:
+            if not future.done():
+                future.set_result(status)
+
+    def summary(self) -> Dict[str, dict]:
+        result = {}
+        for name, values in sorted(self.samples.items()):
+            entry = {"count": len(values), "errors": self.errors.get(name, 0)}
+            for q in PERCENTILES:
+                entry[f"p{q}"] = round(percentile(values, q) * 1000, 2)
+            result[name] = entry
+        return result
+
+
+def run_result(recorder: Recorder, completed: int, failed: int, wall: float) -> dict:
+    return {
+        "completed": completed,
+        "failed": failed,
+        "wall_seconds": round(wall, 3),
+        "sessions_per_second": round(completed / wall, 3) if wall else 0.0,
+        "latency_ms": recorder.summary(),
+    }
+
+
+def format_run(key: str, result: dict) -> str:
+    lines = [
+        f"── {key}: {result['sessions_per_second']:.2f} sessions/s "
+        f"(completed {result['completed']}, failed {result['failed']}, wall {result['wall_seconds']:.2f}s)",
+        f"{'name':<76} {'count':>6} {'err':>4} {'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9}",
+    ]
+    for name, entry in result["latency_ms"].items():
+        lines.append(
+            f"{name:<76} {entry['count']:>6} {entry['errors']:>4} "
+            f"{entry['p50']:>9.1f} {entry['p95']:>9.1f} {entry['p99']:>9.1f}"
+        )
+    return "\n".join(lines)
+
+
+def save_baseline(path: str, config: dict, runs: Dict[str, dict]):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"config": config, "runs": runs}, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def load_baseline(path: str) -> Optional[dict]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def compare(baseline: dict, runs: Dict[str, dict], threshold: float, min_delta_ms: float) -> Tuple[List[str], List[str]]:
+    """
+    (출력 줄, regression 목록).
+    지연은 threshold 비율 이상 그리고 min_delta_ms 이상 늘었을 때, 처리량은 threshold 비율 이상 줄었을 때 regression.
+    """
+    lines, regressions = [], []
+    for key, result in runs.items():
+        base = baseline["runs"].get(key)
+        if base is None:
+            lines.append(f"── {key}: baseline 없음")
+            continue
+        base_sps, sps = base["sessions_per_second"], result["sessions_per_second"]
+        change = (sps - base_sps) / base_sps if base_sps else 0.0
+        lines.append(f"── {key}: sessions/s {base_sps:.2f} → {sps:.2f} ({change:+.0%})")
+        if base_sps and change < -threshold:
+            regressions.append(f"{key} sessions/s {change:+.0%}")
+        if result["failed"] > base["failed"]:
+            regressions.append(f"{key} failed interviews {base['failed']} → {result['failed']}")
+
+        for name, entry in result["latency_ms"].items():
+            base_entry = base["latency_ms"].get(name)
+            if base_entry is None:
+                continue
+            cells = []
+            for q in PERCENTILES:
+                before, after = base_entry[f"p{q}"], entry[f"p{q}"]
+                delta = after - before
+                ratio = delta / before if before else 0.0
+                mark = ""
+                if before and ratio > threshold and delta > min_delta_ms:
+                    mark = " !"
+                    regressions.append(f"{key} {name} p{q} {before:.1f} → {after:.1f}ms ({ratio:+.0%})")
+                cells.append(f"p{q} {before:>8.1f} → {after:>8.1f} ({ratio:+5.0%}){mark}")
+            lines.append(f"   {name:<76} " + "  ".join(cells))
+    return lines, regressions
@@ -0,0 +1,123 @@
+# benchmarks/loadtest/stack.py
+# FastAPI 앱(main.app)과 ws_server 를 같은 이벤트 루프에서 띄우고, 외부 backend 를 fake 로 바꿉니다.
+
+import os
+
+# 최종 리포트 알림은 외부 서버로 나가므로 끕니다 (main import 전에 설정해야 load_dotenv 가 덮어쓰지 않음)
+os.environ["FEEDBACK_NOTIFY_URL"] = ""
+
+import time
+import socket
+import asyncio
+import logging
+from dataclasses import dataclass
+
+import uvicorn
+from dependency_injector import providers
+
+import main
+import ws_server
+from interview.interface import dependencies
+from benchmarks.fakes import MemoryRepository, StubLLMClient, StubTTSClient
+from benchmarks.loadtest.report import Recorder
+from benchmarks.loadtest.transcribe import FakeTranscribeClient
+
+
+@dataclass
+class FakeLatency:
+    llm: float = 0.2
+    llm_token: float = 0.0
+    tts: float = 0.05
+    repo: float = 0.002
+    stt: float = 0.15
+    jitter: float = 0.3
+    seed: int = 0
+
+
+class EndpointTimer:
+    """ASGI 래퍼: 요청마다 'METHOD route template' 이름으로 응답 끝까지의 시간을 기록합니다."""
+
+    def __init__(self, app, stack: "Stack"):
+        self.app = app
+        self.stack = stack
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        status = 500
+        start = time.perf_counter()
+
+        async def timed_send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, timed_send)
+        finally:
+            recorder = self.stack.recorder
+            route = scope.get("route")
+            name = f"{scope['method']} {route.path if route else scope['path']}"
+            recorder.observe(name, time.perf_counter() - start, ok=status < 400)
+            recorder.request_finished(scope["method"], scope["path"], status)
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class Stack:
+    def __init__(self, latency: FakeLatency):
+        self.latency = latency
+        self.recorder = Recorder()
+        self.repo: MemoryRepository = None
+        self.base_url = ""
+        self.ws_url = ""
+        self._server: uvicorn.Server = None
+        self._server_task: asyncio.Task = None
+        self._ws = None
+
+    def reset(self, recorder: Recorder):
+        """새 저장소/fake 로 교체 (동시성 단계마다 같은 seed 로 다시 시작)"""
+        lat = self.latency
+        self.recorder = recorder
+        self.repo = MemoryRepository(lat.repo, lat.jitter, lat.seed)
+        container = dependencies.container
+        container.repo.override(providers.Object(self.repo))
+        container.llm.override(providers.Object(
+            StubLLMClient(lat.llm, token_latency=lat.llm_token, jitter=lat.jitter, seed=lat.seed + 1)))
+        container.tts.override(providers.Object(StubTTSClient(lat.tts, lat.jitter, lat.seed + 2)))
+        container.ocr.override(providers.Object(None))
+        FakeTranscribeClient.configure(lat.stt, lat.jitter, lat.seed + 3)
+
+    async def start(self):
+        self.reset(self.recorder)
+        ws_server.TranscribeStreamingClient = FakeTranscribeClient
+
+        port = _free_port()
+        config = uvicorn.Config(EndpointTimer(main.app, self), host="127.0.0.1", port=port,
+                                log_level="warning", lifespan="on", log_config=None)
+        self._server = uvicorn.Server(config)
+        self._server_task = asyncio.create_task(self._server.serve())
+        while not self._server.started:
+            if self._server_task.done():
+                self._server_task.result()
+            await asyncio.sleep(0.01)
+        self.base_url = f"http://127.0.0.1:{port}"
+        ws_server.FASTAPI_BASE_URL = self.base_url
+
+        self._ws = await ws_server.serve(ws_server.handle_connection, host="127.0.0.1", port=0,
+                                         create_protocol=ws_server.CustomProtocol)
+        self.ws_url = f"ws://127.0.0.1:{self._ws.sockets[0].getsockname()[1]}"
+        logging.info(f"load test stack: api={self.base_url} ws={self.ws_url}")
+
+    async def stop(self):
+        if self._ws is not None:
+            self._ws.close()
+            await self._ws.wait_closed()
+        if self._server is not None:
+            self._server.should_exit = True
+            await self._server_task
@@ -0,0 +1,97 @@
+# benchmarks/loadtest/transcribe.py
+# Amazon Transcribe streaming 대체. ws_server.TranscribeStreamingClient 자리에 끼워 넣습니다.
+#
+# - 음성 chunk(0이 아닌 PCM)가 partial_every 개 쌓일 때마다 partial 결과를 보냅니다.
+# - 음성 뒤에 무음 chunk(전부 0)가 오면 발화 끝으로 보고, stt 지연 후 final 결과를 보냅니다.
+# - transcript 는 받은 음성 길이로만 정해지므로 같은 입력이면 항상 같은 문장이 나옵니다.
+
+import asyncio
+from typing import Optional
+
+from amazon_transcribe.model import Alternative, Result, Transcript, TranscriptEvent
+
+from benchmarks.fakes import Delay
+
+SAMPLE_RATE = 16000
+BYTES_PER_SECOND = SAMPLE_RATE * 2  # 16-bit mono
+
+
+def _event(text: str, is_partial: bool) -> TranscriptEvent:
+    alternative = Alternative(transcript=text, items=[], entities=[])
+    return TranscriptEvent(transcript=Transcript(results=[Result(is_partial=is_partial, alternatives=[alternative])]))
+
+
+def transcript_for(speech_bytes: int) -> str:
+    return f"합성 음성 {speech_bytes / BYTES_PER_SECOND:.1f}초 분량의 답변입니다."
+
+
+class _InputStream:
+    def __init__(self, stream: "FakeTranscribeStream"):
+        self._stream = stream
+
+    async def send_audio_event(self, audio_chunk: bytes):
+        self._stream.feed(audio_chunk)
+
+    async def end_stream(self):
+        self._stream.finish()
+
+
+class FakeTranscribeStream:
+    def __init__(self, delay: Delay, partial_every: int):
+        self.delay = delay
+        self.partial_every = partial_every
+        self.input_stream = _InputStream(self)
+        self.output_stream = self._events()
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._speech_bytes = 0
+        self._speech_chunks = 0
+        self._finals: set = set()
+
+    def feed(self, chunk: bytes):
+        if any(chunk):
+            self._speech_bytes += len(chunk)
+            self._speech_chunks += 1
+            if self.partial_every and self._speech_chunks % self.partial_every == 0:
+                self._queue.put_nowait(_event(transcript_for(self._speech_bytes), True))
+        elif self._speech_bytes:
+            # 발화 끝 (endpointing)
+            speech_bytes, self._speech_bytes, self._speech_chunks = self._speech_bytes, 0, 0
+            task = asyncio.create_task(self._emit_final(speech_bytes))
+            self._finals.add(task)
+            task.add_done_callback(self._finals.discard)
+
+    async def _emit_final(self, speech_bytes: int):
+        await asyncio.sleep(self.delay.sample())
+        self._queue.put_nowait(_event(transcript_for(speech_bytes), False))
+
+    def finish(self):
+        async def close():
+            if self._finals:
+                await asyncio.gather(*self._finals, return_exceptions=True)
+            self._queue.put_nowait(None)
+        asyncio.create_task(close())
+
+    async def _events(self):
+        while True:
+            event = await self._queue.get()
+            if event is None:
+                return
+            yield event
+
+
+class FakeTranscribeClient:
+    """TranscribeStreamingClient(region=...) 와 같은 모양. 지연 설정은 configure() 로 클래스에 지정합니다."""
+
+    delay = Delay(0.15)
+    partial_every = 5
+
+    def __init__(self, region: Optional[str] = None, **kwargs):
+        self.region = region
+
+    @classmethod
+    def configure(cls, latency: float, jitter: float = 0.0, seed: int = 0, partial_every: int = 5):
+        cls.delay = Delay(latency, jitter, seed)
+        cls.partial_every = partial_every
+
+    async def start_stream_transcription(self, **kwargs) -> FakeTranscribeStream:
+        return FakeTranscribeStream(self.delay, self.partial_every)
@@ -1,42 +1,110 @@
 from dependency_injector import containers, providers
-from interview.application.interview_service import InterviewService
-from interview.domain.repository.interview_repo import InterviewRepository
+from interview.application.interview_service import InterviewService, shared_single_flight
+from interview.domain.repository.interview_repo import AsyncInterviewRepository, InterviewRepository
 from interview.infra.repository.interview_repo_mongo import InterviewRepositoryMongo
+from interview.infra.repository.interview_repo_mongo_async import AsyncInterviewRepositoryMongo
 from interview.infra.repository.interview_repo_dynamo import InterviewRepositoryDynamo
+from interview.infra.repository.interview_repo_dynamo_async import AsyncInterviewRepositoryDynamo
+from interview.infra.repository.interview_repo_sqlite import InterviewRepositorySqlite
+from interview.infra.repository.session_cache import SESSION_CACHE_ENABLED, SessionCache
 from interview.infra.llm.openai_client import GPTClient
 from interview.infra.llm.bedrock_client import BedrockClient
 from interview.infra.llm.openchat_client import OpenChatClient
 from interview.infra.llm.local_client import LocalClient
+from interview.infra.llm.response_cache import CachedLLMClient, LLMResponseCache
+from interview.infra.llm.router import RouterLLMClient
 from interview.infra.tts.polly_client import PollyClient
 from interview.infra.ocr.tesseract_client import TesseractOCRClient
+from interview.infra.llm.tokens import token_usage
+from interview.infra.metrics.registry import registry
+from interview.infra.metrics.collectors import cache_collector, single_flight_collector, token_usage_collector
+from interview.infra.metrics.instrumented import (
+    InstrumentedAsyncRepository, InstrumentedLLMClient, InstrumentedRepository, InstrumentedService,
+    InstrumentedTTSClient,
+)
+from typing import List, Union
 import os
 
+# /metrics 용 계측. 클라이언트/저장소를 감싸기만 하므로 provider 코드는 그대로입니다.
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+if METRICS_ENABLED:
+    registry.register_collector("llm_tokens", token_usage_collector(token_usage))
+    registry.register_collector("singleflight", single_flight_collector(shared_single_flight()))
+
+# 서버 종료 시 커넥션 풀을 닫아야 하는 async 저장소
+_async_repositories: List[AsyncInterviewRepository] = []
+
+async def aclose_repositories():
+    while _async_repositories:
+        await _async_repositories.pop().close()
+
 class InterviewRepositoryFactory:
     @staticmethod
-    def get_repository() -> InterviewRepository:
+    def get_repository() -> Union[InterviewRepository, AsyncInterviewRepository]:
         backend = os.getenv("REPO_BACKEND", "dynamo").lower()
         if backend == "mongo":
-            return InterviewRepositoryMongo()
+            repo = InterviewRepositoryMongo()
         elif backend == "dynamo":
-            return InterviewRepositoryDynamo()
+            repo = InterviewRepositoryDynamo()
+        elif backend == "mongo-async":
+            repo = AsyncInterviewRepositoryMongo()
+        elif backend == "dynamo-async":
+            repo = AsyncInterviewRepositoryDynamo()
+        elif backend == "sqlite":
+            repo = InterviewRepositorySqlite()
         else:
             raise ValueError(f"Unsupported REPO_BACKEND: {backend}")
 
+        if isinstance(repo, AsyncInterviewRepository):
+            # 세션 캐시는 동기 저장소 앞에만 둡니다 (동기 저장소는 service 가 thread 에서 호출)
+            _async_repositories.append(repo)
+            return InstrumentedAsyncRepository(repo, backend) if METRICS_ENABLED else repo
+        if METRICS_ENABLED:
+            repo = InstrumentedRepository(repo, backend)
+        if not SESSION_CACHE_ENABLED:
+            return repo
+        # 계측 바깥에 두어 repo_* 지표가 실제 저장소 호출만 세도록 합니다.
+        cache = SessionCache(repo)
+        if METRICS_ENABLED:
+            registry.register_collector("session_cache", cache_collector("session_cache", cache))
+        return cache
+
 class LLMClientFactory:
     @staticmethod
-    def get_llm_client():
-        provider = os.getenv("LLM_PROVIDER", "bedrock").lower()
-
+    def get_provider(provider: str):
         if provider == "bedrock":
-            return BedrockClient()
+            client = BedrockClient()
         elif provider == "openai":
-            return GPTClient()
+            client = GPTClient()
         elif provider == "openchat":
-            return OpenChatClient()
+            client = OpenChatClient()
         elif provider == "local":
-            return LocalClient()
+            client = LocalClient()
         else:
             raise ValueError(f"Unsupported LLM_CLIENT: {provider}")
+        return InstrumentedLLMClient(client, provider) if METRICS_ENABLED else client
+
+    @staticmethod
+    def get_llm_client():
+        # 쉼표로 여러 개를 지정하면 (예: "bedrock,openai") 앞에서부터 우선순위로 라우팅합니다.
+        providers = [p.strip() for p in os.getenv("LLM_PROVIDER", "bedrock").lower().split(",") if p.strip()]
+        if len(providers) == 1:
+            client = LLMClientFactory.get_provider(providers[0])
+        else:
+            client = RouterLLMClient([(p, LLMClientFactory.get_provider(p)) for p in providers])
+
+        # 스텁 응답(USE_LLM=false)은 캐시하지 않습니다.
+        if not client.use_llm or os.getenv("LLM_CACHE_ENABLED", "true").lower() != "true":
+            return client
+        cache = LLMResponseCache(
+            max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1024")),
+            ttl_seconds=float(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600))),
+            cache_dir=os.getenv("LLM_CACHE_DIR", ".cache/llm") or None,
+        )
+        bypass = os.getenv("LLM_CACHE_BYPASS", "false").lower() == "true"
+        if METRICS_ENABLED:
+            registry.register_collector("llm_cache", cache_collector("llm_cache", cache))
+        return CachedLLMClient(client, cache, bypass=bypass, provider=",".join(providers))
 
 class TTSClientFactory:
     @staticmethod
@@ -44,9 +112,14 @@ class TTSClientFactory:
         provider = os.getenv("TTS_PROVIDER", "polly").lower()
 
         if provider == "polly":
-            return PollyClient()
+            client = PollyClient()
         else:
             raise ValueError(f"Unsupported TTS_CLIENT: {provider}")
+        if not METRICS_ENABLED:
+            return client
+        if client.cache:
+            registry.register_collector("tts_cache", cache_collector("tts_cache", client.cache))
+        return InstrumentedTTSClient(client, provider)
 
 class OCRClientFactory:
     @staticmethod
@@ -59,6 +132,11 @@ class OCRClientFactory:
             raise ValueError(f"Unsupported OCR_CLIENT: {provider}")
 
 
+def build_interview_service(**kwargs) -> InterviewService:
+    service = InterviewService(**kwargs)
+    return InstrumentedService(service) if METRICS_ENABLED else service
+
+
 class InterviewContainer(containers.DeclarativeContainer):
     wiring_config = containers.WiringConfiguration(
         modules=["interview.interface.controllers"]
@@ -68,4 +146,4 @@ class InterviewContainer(containers.DeclarativeContainer):
     llm = providers.Singleton(LLMClientFactory.get_llm_client)
     tts = providers.Singleton(TTSClientFactory.get_tts_client)
     ocr = providers.Singleton(OCRClientFactory.get_ocr_client)
-    service = providers.Factory(InterviewService, repo=repo, llm=llm, tts=tts, ocr=ocr)
+    service = providers.Factory(build_interview_service, repo=repo, llm=llm, tts=tts, ocr=ocr)
@@ -0,0 +1,66 @@
+import asyncio
+from itertools import islice
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Union
+
+from interview.domain.interview import InterviewSession, QA
+from interview.domain.repository.interview_repo import AsyncInterviewRepository, InterviewRepository
+
+# iter_sessions 를 thread 에서 한 번에 읽어 올 세션 수
+ITER_BATCH_SIZE = 100
+
+
+class ThreadedRepository(AsyncInterviewRepository):
+    """
+    동기 InterviewRepository(pymongo, boto3, 세션 캐시 등)를 asyncio.to_thread 로 감싸
+    service 가 드라이버 I/O 동안 이벤트 루프를 막지 않도록 합니다.
+    """
+
+    def __init__(self, repo: InterviewRepository):
+        self.repo = repo
+
+    async def save_session(self, session: InterviewSession) -> InterviewSession:
+        return await asyncio.to_thread(self.repo.save_session, session)
+
+    async def save_sessions(self, sessions: List[InterviewSession]) -> List[InterviewSession]:
+        return await asyncio.to_thread(self.repo.save_sessions, sessions)
+
+    async def update_session(self, session: InterviewSession) -> InterviewSession:
+        return await asyncio.to_thread(self.repo.update_session, session)
+
+    async def get_all_sessions(self) -> list[InterviewSession]:
+        return await asyncio.to_thread(self.repo.get_all_sessions)
+
+    async def iter_sessions(self) -> AsyncIterator[InterviewSession]:
+        sessions = await asyncio.to_thread(lambda: iter(self.repo.iter_sessions()))
+        try:
+            while batch := await asyncio.to_thread(lambda: list(islice(sessions, ITER_BATCH_SIZE))):
+                for session in batch:
+                    yield session
+        finally:
+            close = getattr(sessions, "close", None)
+            if close is not None:
+                await asyncio.to_thread(close)
+
+    async def get_session_by_interview_and_member_interview_id(self, interview_id: str, member_interview_id: str) -> InterviewSession:
+        return await asyncio.to_thread(
+            self.repo.get_session_by_interview_and_member_interview_id, interview_id, member_interview_id
+        )
+
+    async def get_session_by_id(self, session_id: str) -> InterviewSession:
+        return await asyncio.to_thread(self.repo.get_session_by_id, session_id)
+
+    async def get_session_fields(self, session_id: str, fields: Sequence[str]) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self.repo.get_session_fields, session_id, fields)
+
+    async def get_qa(self, session_id: str, index: int) -> Optional[QA]:
+        return await asyncio.to_thread(self.repo.get_qa, session_id, index)
+
+    async def delete_session(self, session_id: str) -> bool:
+        return await asyncio.to_thread(self.repo.delete_session, session_id)
+
+    async def delete_all_sessions(self) -> int:
+        return await asyncio.to_thread(self.repo.delete_all_sessions)
+
+
+def as_async_repository(repo: Union[InterviewRepository, AsyncInterviewRepository]) -> AsyncInterviewRepository:
+    return repo if isinstance(repo, AsyncInterviewRepository) else ThreadedRepository(repo)
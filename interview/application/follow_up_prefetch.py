@@ -0,0 +1,81 @@
+import time
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+
+@dataclass
+class _Prefetch:
+    answer: str
+    task: asyncio.Task
+    started_at: float
+    # take() 로 가져가면 set → 남은 delay 를 기다리지 않고 바로 생성
+    claimed: asyncio.Event
+
+
+class FollowUpPrefetcher:
+    """
+    메인 답변이 저장되는 즉시 꼬리 질문(LLM + TTS) 생성을 백그라운드로 시작해 두고,
+    generate_follow-ups 요청이 오면 그 결과를 넘겨줍니다.
+    키는 (session_id, index)이며, 답변이 바뀌면 기존 작업은 취소 후 새로 시작합니다.
+    """
+
+    def __init__(self, delay: float = 0.3, ttl: float = 600.0):
+        # delay: STT가 답변을 연속으로 PATCH 하는 경우 매번 LLM을 호출하지 않도록 잠깐 기다립니다.
+        #        generate_follow-ups 가 먼저 가져가면(take) 더 기다리지 않습니다.
+        self.delay = delay
+        self.ttl = ttl
+        self._entries: Dict[Tuple[str, int], _Prefetch] = {}
+
+    def start(self, session_id: str, index: int, answer: str, build: Callable[[], Awaitable]) -> None:
+        key = (session_id, index)
+        current = self._entries.get(key)
+        if current and current.answer == answer:
+            return
+        self.discard(session_id, index)
+        self._purge_expired()
+
+        claimed = asyncio.Event()
+
+        async def run():
+            try:
+                await asyncio.wait_for(claimed.wait(), self.delay)
+            except asyncio.TimeoutError:
+                pass
+            return await build()
+
+        task = asyncio.create_task(run())
+        task.add_done_callback(self._log_failure)
+        self._entries[key] = _Prefetch(answer, task, time.monotonic(), claimed)
+
+    def take(self, session_id: str, index: int, answer: Optional[str]) -> Optional[asyncio.Task]:
+        """저장된 답변과 같은 답변으로 시작한 작업만 돌려줍니다. 다르면 버립니다."""
+        entry = self._entries.pop((session_id, index), None)
+        if entry is None:
+            return None
+        if entry.answer != answer:
+            entry.task.cancel()
+            return None
+        entry.claimed.set()
+        return entry.task
+
+    def discard(self, session_id: str, index: int) -> None:
+        entry = self._entries.pop((session_id, index), None)
+        if entry:
+            entry.task.cancel()
+
+    def _purge_expired(self):
+        # generate_follow-ups가 끝내 호출되지 않은 결과가 쌓이지 않도록 정리
+        now = time.monotonic()
+        for key, entry in list(self._entries.items()):
+            if now - entry.started_at > self.ttl:
+                entry.task.cancel()
+                del self._entries[key]
+
+    @staticmethod
+    def _log_failure(task: asyncio.Task):
+        if task.cancelled():
+            return
+        if task.exception():
+            logging.warning(f"Speculative follow-up generation failed: {task.exception()}")
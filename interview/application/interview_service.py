@@ -1,13 +1,23 @@
 # interview_service.py (수정 완료)
 
-from interview.domain.interview import InterviewSession, Cursor
-from interview.domain.repository.interview_repo import InterviewRepository
+from interview.domain.interview import InterviewSession, Cursor, JobStatus, FollowUpQA
+from interview.domain.repository.interview_repo import AsyncInterviewRepository, InterviewRepository, SessionConflictError
 from interview.domain.llm.llm_client import LLMClient
 from interview.domain.tts.tts_client import TTSClient
 from interview.domain.ocr.ocr_client import OCRClient
 from interview.domain.info import InfoModel
-from typing import List
+from interview.application.async_repo import as_async_repository
+from interview.application.follow_up_prefetch import FollowUpPrefetcher
+from interview.application.job_engine import Job, JobAbortedError, JobEngine, PENDING, DONE, FAILED, UNFINISHED
+from interview.application.singleflight import SingleFlight
+from interview.infra.llm.http_client import get_async_http_client
+from datetime import datetime, timezone
+from typing import AsyncIterator, Callable, Dict, List, Optional, Union
+from contextlib import aclosing
+import os
+import json
 import uuid
+import hashlib
 import httpx
 import logging
 import asyncio
@@ -16,12 +26,95 @@ import copy
 # NOTE: 이 값은 API 요청에 questionNumber가 없을 경우의 기본값으로 계속 사용됩니다.
 MAX_QUESTIONS = 5
 MAX_FOLLOW_UPS = 2
+# 동시에 진행되는 TTS(Polly + S3) 호출 수 상한. 모든 참가자/요청이 공유합니다.
+TTS_CONCURRENCY = int(os.getenv("TTS_CONCURRENCY", "8"))
+
+# 메인 답변 저장 직후 꼬리 질문을 미리 생성할지 여부
+FOLLOW_UP_PREFETCH = os.getenv("FOLLOW_UP_PREFETCH", "true").lower() == "true"
+
+# 피드백 / 최종 리포트 백그라운드 작업 설정
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "4"))
+JOB_MAX_RETRIES = int(os.getenv("JOB_MAX_RETRIES", "2"))
+# 이 시간 동안 상태가 갱신되지 않은 미완료 job 은 (재시작 등으로) 큐에서 사라진 것으로 보고 다시 넣습니다.
+JOB_LEASE_SECONDS = float(os.getenv("JOB_LEASE_SECONDS", "300"))
+# 다른 worker/replica 와 같은 세션을 동시에 저장해 충돌했을 때 다시 읽어 반영하는 횟수
+WRITE_CONFLICT_RETRIES = int(os.getenv("WRITE_CONFLICT_RETRIES", "5"))
+# 최종 리포트 완료 알림을 보낼 주소 (비우면 알림 생략)
+FEEDBACK_NOTIFY_URL = os.getenv("FEEDBACK_NOTIFY_URL", "https://interview.play-qr.site/notifications/feedback")
+
+_tts_limiter: Optional[asyncio.Semaphore] = None
+_follow_up_prefetcher: Optional[FollowUpPrefetcher] = None
+_job_engine: Optional[JobEngine] = None
+_single_flight: Optional[SingleFlight] = None
+
+def shared_tts_limiter() -> asyncio.Semaphore:
+    global _tts_limiter
+    if _tts_limiter is None:
+        _tts_limiter = asyncio.Semaphore(TTS_CONCURRENCY)
+    return _tts_limiter
+
+def shared_follow_up_prefetcher() -> FollowUpPrefetcher:
+    global _follow_up_prefetcher
+    if _follow_up_prefetcher is None:
+        _follow_up_prefetcher = FollowUpPrefetcher()
+    return _follow_up_prefetcher
+
+def shared_job_engine() -> JobEngine:
+    global _job_engine
+    if _job_engine is None:
+        _job_engine = JobEngine(workers=JOB_WORKERS, max_retries=JOB_MAX_RETRIES)
+    return _job_engine
+
+def shared_single_flight() -> SingleFlight:
+    global _single_flight
+    if _single_flight is None:
+        _single_flight = SingleFlight()
+    return _single_flight
+
+def content_hash(*parts) -> str:
+    raw = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+def feedback_job_key(index: int) -> str:
+    return f"feedback:{index}"
+
+FINAL_REPORT_JOB_KEY = "final_report"
 
 class InterviewService:
-    def __init__(self, repo: InterviewRepository, llm: LLMClient, tts: TTSClient, ocr: OCRClient):
-        self.repo = repo
+    def __init__(self, repo: Union[InterviewRepository, AsyncInterviewRepository], llm: LLMClient, tts: TTSClient, ocr: OCRClient,
+                 tts_limiter: Optional[asyncio.Semaphore] = None,
+                 prefetcher: Optional[FollowUpPrefetcher] = None,
+                 jobs: Optional[JobEngine] = None,
+                 flights: Optional[SingleFlight] = None):
+        # 동기 저장소는 thread 에서 실행해 이벤트 루프를 막지 않도록 감쌉니다.
+        self.repo = as_async_repository(repo)
         self.llm = llm
         self.tts = tts
+        # NOTE: service는 요청마다 새로 만들어지므로 기본값은 프로세스 전역 semaphore를 사용합니다.
+        self.tts_limiter = tts_limiter or shared_tts_limiter()
+        self.prefetcher = prefetcher or shared_follow_up_prefetcher()
+        self.jobs = jobs or shared_job_engine()
+        # 동시에 들어온 같은 LLM/TTS 호출은 한 번만 실행 (재시도 요청 등)
+        self.flights = flights or shared_single_flight()
+
+    async def _synthesize(self, text: str, filename: str, isolate_errors: bool = True) -> Optional[str]:
+        async def run() -> str:
+            async with self.tts_limiter:
+                return await asyncio.to_thread(self.tts.synthesize_to_s3, text, filename=filename)
+
+        try:
+            # 같은 합성이 진행 중이면 그 결과(S3 URI)를 같이 사용합니다. key 는 TTS 클라이언트가 정합니다
+            # (Polly 는 오디오 캐시와 같은 text/voice/format, 캐시를 끄면 파일 이름까지).
+            return await self.flights.do(("tts", self.tts.flight_key(text, filename)), run)
+        except Exception as e:
+            if not isolate_errors:
+                raise
+            logging.error(f"TTS generation failed for question '{text}': {e}")
+            return None
+
+    async def _synthesize_all(self, items: List[tuple], isolate_errors: bool = True) -> List[Optional[str]]:
+        """(text, filename) 목록을 tts_limiter 범위 안에서 병렬로 합성합니다. 결과 순서는 입력 순서와 같습니다."""
+        return await asyncio.gather(*(self._synthesize(text, filename, isolate_errors) for text, filename in items))
 
     async def create_sessions_concurrently(self, info: InfoModel) -> List[InterviewSession]:
         base_dict = info.model_dump()
@@ -34,17 +127,24 @@ class InterviewService:
             member_interview_id = str(participant.memberInterviewId)
             info_one = copy.deepcopy(base_dict)
             info_one["result"]["participants"] = [participant.model_dump()]
-            return await asyncio.to_thread(
-                self.create_session_with_questions,
-                interview_id,
-                member_interview_id,
-                info_one
-            )
+            return await self._build_session(interview_id, member_interview_id, info_one)
 
+        # 참가자별 질문/TTS 를 모두 만든 뒤 한 번의 bulk 요청으로 저장
         sessions = await asyncio.gather(*(create_for_participant(p) for p in info.result.participants))
+        await self.repo.save_sessions(list(sessions))
+        for session in sessions:
+            logging.info(f"Session {session.session_id} created for member {session.member_interview_id} "
+                         f"with {session.question_length} questions.")
         return sessions
 
-    def create_session_with_questions(self, interview_id: str, member_interview_id: str, info: dict) -> InterviewSession:
+    async def create_session_with_questions(self, interview_id: str, member_interview_id: str, info: dict) -> InterviewSession:
+        session = await self._build_session(interview_id, member_interview_id, info)
+        await self.repo.save_session(session)
+        logging.info(f"Session {session.session_id} created for member {member_interview_id} with {session.question_length} questions.")
+        return session
+
+    async def _build_session(self, interview_id: str, member_interview_id: str, info: dict) -> InterviewSession:
+        """질문 생성 + TTS 까지 마친 새 세션 (저장은 하지 않음)"""
         if not all([interview_id, member_interview_id, info]):
             raise ValueError("interview_id, member_interview_id, and info must be provided")
 
@@ -59,21 +159,21 @@ class InterviewService:
         except (AttributeError, TypeError):
             question_count = MAX_QUESTIONS
 
-        question_text = self.llm.generate_questions(info, cover_letter)
+        # ws_server 타임아웃 후 재요청 등으로 같은 입력의 질문 생성이 겹치면 한 번만 호출
+        question_text = await self.flights.do(
+            ("questions", content_hash(info, cover_letter)),
+            lambda: self.llm.agenerate_questions(info, cover_letter),
+        )
         # CHANGED: 하드코딩된 MAX_QUESTIONS 대신 추출한 question_count 사용
         questions = [q.strip() for q in question_text.split("\n") if q.strip()][:question_count]
         
         session_id = f"sess_{uuid.uuid4().hex[:8]}"
         qa_flow = []
 
-        for i, q in enumerate(questions):
-            filename = f"{session_id}_{i}.mp3"
-            s3_uri = None
-            try:
-                s3_uri = self.tts.synthesize_to_s3(q, filename=filename)
-            except Exception as e:
-                logging.error(f"TTS generation failed for question '{q}': {e}")
-
+        audio_paths = await self._synthesize_all(
+            [(q, f"{session_id}_{i}.mp3") for i, q in enumerate(questions)]
+        )
+        for q, s3_uri in zip(questions, audio_paths):
             qa_flow.append({
                 "question": q, "audio_path": s3_uri, "answer": None,
                 "feedback": None, "follow_ups": [], "follow_up_length": 0,
@@ -89,99 +189,343 @@ class InterviewService:
             question_length=len(questions),
             final_report=None,
         )
-        self.repo.save_session(session)
-        logging.info(f"Session {session_id} created for member {member_interview_id} with {len(questions)} questions.")
         return session
 
-    # --- 이하 메서드는 변경 사항 없습니다 ---
+    async def answer_main_question(self, session_id: str, index: int, answer: str) -> InterviewSession:
+        def apply(s: InterviewSession):
+            s.qa_flow[index].answer = answer
 
-    def answer_main_question(self, session_id: str, index: int, answer: str) -> InterviewSession:
-        session = self.repo.get_session_by_id(session_id)
-        if not session or index >= len(session.qa_flow):
+        try:
+            session = await self._apply(session_id, apply)
+        except IndexError:
+            return None
+        if not session:
             return None
-        session.qa_flow[index].answer = answer
-        self.repo.update_session(session)
+
+        # 답변이 저장되면 꼬리 질문 생성을 바로 시작 (답변이 다시 바뀌면 prefetcher가 취소 후 재시작)
+        if FOLLOW_UP_PREFETCH:
+            snapshot = session.model_copy(deep=True)
+            self.prefetcher.start(session_id, index, answer, lambda: self._build_follow_ups(snapshot, index))
         return session
 
-    def generate_follow_up_questions(self, session_id: str, index: int) -> InterviewSession:
-        session = self.repo.get_session_by_id(session_id)
-        if not session or index >= len(session.qa_flow):
-            return None
+    async def _build_follow_ups(self, session: InterviewSession, index: int) -> List[dict]:
+        """LLM으로 꼬리 질문을 만들고 TTS까지 마친 follow_ups 목록 (저장은 하지 않음)"""
+        # 같은 답변에 대한 생성(prefetch, generate_follow-ups 재시도)이 진행 중이면 그 결과를 같이 사용
+        key = ("follow_up", session.session_id, index, content_hash(session.qa_flow[index].answer))
+        return await self.flights.do(key, lambda: self._generate_follow_ups(session, index))
 
-        follow_ups = self.llm.generate_follow_up(session, index)
-        enriched_follow_ups = []
+    async def _generate_follow_ups(self, session: InterviewSession, index: int) -> List[dict]:
+        follow_ups = await self.llm.agenerate_follow_up(session, index)
+        follow_ups = follow_ups[:MAX_FOLLOW_UPS]
 
-        for i, question in enumerate(follow_ups[:MAX_FOLLOW_UPS]):
-            filename = f"{session.session_id}_{index}_{i}.mp3"
-            audio_path = self.tts.synthesize_to_s3(question, filename=filename)
-            enriched_follow_ups.append({"question": question, "audio_path": audio_path, "answer": None})
+        # NOTE: 꼬리 질문은 기존과 동일하게 TTS 실패 시 예외를 그대로 올립니다.
+        audio_paths = await self._synthesize_all(
+            [(q, f"{session.session_id}_{index}_{i}.mp3") for i, q in enumerate(follow_ups)],
+            isolate_errors=False,
+        )
+        return [
+            {"question": question, "audio_path": audio_path, "answer": None}
+            for question, audio_path in zip(follow_ups, audio_paths)
+        ]
 
-        session.qa_flow[index].follow_up_length = len(enriched_follow_ups)
-        session.qa_flow[index].follow_ups = enriched_follow_ups
-        session.cursor.f_idx = 0
-        self.repo.update_session(session)
-        return session
+    async def _stream_build_follow_ups(self, session: InterviewSession, index: int) -> AsyncIterator[dict]:
+        """
+        _build_follow_ups 의 스트리밍 버전.
+        LLM 응답에서 꼬리 질문 한 줄이 완성되는 즉시 TTS를 시작하고, 음성이 준비되면 질문 순서대로 냅니다.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
 
-    def answer_follow_up_question(self, session_id: str, index: int, f_index: int, answer: str) -> InterviewSession:
-        session = self.repo.get_session_by_id(session_id)
+        async def produce():
+            try:
+                count = 0
+                async with aclosing(self.llm.astream_follow_up(session, index)) as questions:
+                    async for question in questions:
+                        filename = f"{session.session_id}_{index}_{count}.mp3"
+                        task = asyncio.create_task(self._synthesize(question, filename, isolate_errors=False))
+                        queue.put_nowait((question, task))
+                        count += 1
+                        if count >= MAX_FOLLOW_UPS:
+                            break
+            finally:
+                queue.put_nowait(None)
+
+        producer = asyncio.create_task(produce())
+        started = []
+        try:
+            while (entry := await queue.get()) is not None:
+                question, task = entry
+                started.append(task)
+                yield {"question": question, "audio_path": await task, "answer": None}
+            await producer  # LLM 쪽 예외 전달
+        finally:
+            producer.cancel()
+            for task in started:
+                task.cancel()
+
+    async def _take_prefetched_follow_ups(self, session_id: str, index: int, answer: Optional[str]) -> Optional[List[dict]]:
+        prefetched = self.prefetcher.take(session_id, index, answer)
+        if prefetched is None:
+            return None
+        try:
+            return await prefetched
+        except Exception as e:
+            logging.warning(f"Prefetched follow-ups unavailable for {session_id}[{index}], regenerating: {e}")
+            return None
+
+    async def _session_for_llm(self, session_id: str) -> InterviewSession:
+        session = await self.repo.get_session_by_id(session_id)
         if not session:
+            raise RuntimeError(f"Session {session_id} was deleted")
+        return session
+
+    async def _save_follow_ups(self, session_id: str, index: int, follow_ups: List[dict]) -> Optional[InterviewSession]:
+        def apply(s: InterviewSession):
+            s.qa_flow[index].follow_up_length = len(follow_ups)
+            s.qa_flow[index].follow_ups = [FollowUpQA(**item) for item in follow_ups]
+            s.cursor.f_idx = 0
+
+        # LLM/TTS를 기다리는 동안 피드백 job이 같은 세션을 저장했을 수 있으므로 다시 읽어서 반영
+        return await self._apply(session_id, apply)
+
+    async def generate_follow_up_questions(self, session_id: str, index: int) -> InterviewSession:
+        # prefetch 결과를 쓸 수 있으면 질문 하나만 읽으면 되고, 세션 전체는 LLM 을 호출할 때만 읽습니다.
+        qa = await self.repo.get_qa(session_id, index)
+        if not qa:
+            return None
+
+        enriched_follow_ups = await self._take_prefetched_follow_ups(session_id, index, qa.answer)
+        if enriched_follow_ups is None:
+            enriched_follow_ups = await self._build_follow_ups(await self._session_for_llm(session_id), index)
+        return await self._save_follow_ups(session_id, index, enriched_follow_ups)
+
+    async def stream_follow_up_questions(self, session_id: str, index: int) -> Optional[AsyncIterator[dict]]:
+        """
+        generate_follow_up_questions 의 스트리밍 버전. 세션/질문이 없으면 None.
+        이벤트: {"type": "follow_up", "f_index", "question", "audio_path", "answer"} (준비되는 대로)
+               → {"type": "session", "session": InterviewSession} (저장 후 마지막에 한 번)
+        """
+        qa = await self.repo.get_qa(session_id, index)
+        if not qa:
             return None
+
+        async def events():
+            follow_ups = await self._take_prefetched_follow_ups(session_id, index, qa.answer)
+            if follow_ups is not None:
+                for f_index, item in enumerate(follow_ups):
+                    yield {"type": "follow_up", "f_index": f_index, **item}
+            else:
+                follow_ups = []
+                session = await self._session_for_llm(session_id)
+                async with aclosing(self._stream_build_follow_ups(session, index)) as items:
+                    async for item in items:
+                        yield {"type": "follow_up", "f_index": len(follow_ups), **item}
+                        follow_ups.append(item)
+            if not follow_ups:
+                raise RuntimeError("LLM returned no follow-up questions")
+            yield {"type": "session", "session": await self._save_follow_ups(session_id, index, follow_ups)}
+
+        return events()
+
+    async def answer_follow_up_question(self, session_id: str, index: int, f_index: int, answer: str) -> InterviewSession:
+        enqueue_feedback = False
+
+        def apply(s: InterviewSession):
+            nonlocal enqueue_feedback
+            s.qa_flow[index].follow_ups[f_index].answer = answer
+            s.cursor.f_idx += 1
+
+            # 마지막 꼬리 질문까지 답하면 다음 질문으로 넘어가고, 피드백은 백그라운드 job에서 생성합니다.
+            enqueue_feedback = s.cursor.f_idx >= s.qa_flow[index].follow_up_length
+            if enqueue_feedback:
+                s.cursor.q_idx += 1
+                s.cursor.f_idx = -1
+                if not self.jobs.is_active(self._job_id(session_id, feedback_job_key(index))):
+                    s.jobs[feedback_job_key(index)] = self._job_status("feedback", index, PENDING)
+
         try:
-            session.qa_flow[index].follow_ups[f_index].answer = answer
-            session.cursor.f_idx += 1
-            self.repo.update_session(session)
-            
-            if session.cursor.f_idx >= session.qa_flow[index].follow_up_length:
-                self.generate_feedback(session_id, index)
-            return session
+            session = await self._apply(session_id, apply)
         except (IndexError, KeyError):
             return None
+        if session and enqueue_feedback:
+            self._submit_feedback_job(session_id, index)
+        return session
 
-    def generate_feedback(self, session_id: str, index: int) -> InterviewSession:
-        session = self.repo.get_session_by_id(session_id)
+    async def generate_feedback(self, session_id: str, index: int) -> InterviewSession:
+        """피드백 job 본문. LLM 응답이 비어 있으면 예외를 올려 JobEngine이 재시도하게 합니다."""
+        session = await self.repo.get_session_by_id(session_id)
         if not session or index >= len(session.qa_flow):
-            return None
-        feedback = self.llm.generate_feedback(session, index)
-        session.qa_flow[index].feedback = feedback
-        session.cursor.q_idx += 1
-        session.cursor.f_idx = -1
-        self.repo.update_session(session)
-
-        if session.cursor.q_idx >= session.question_length:
-            self.generate_final_report(session_id)
+            raise JobAbortedError(f"Session {session_id} or question {index} not found")
+        feedback = await self.llm.agenerate_feedback(session, index)
+        if not feedback:
+            raise RuntimeError("LLM returned empty feedback")
+
+        def apply(s: InterviewSession):
+            s.qa_flow[index].feedback = feedback
+            s.jobs[feedback_job_key(index)] = self._job_status(
+                "feedback", index, DONE, self._attempts(s, feedback_job_key(index))
+            )
+            self._mark_final_report_pending(s)
+
+        session = await self._apply(session_id, apply)
+        if not session:
+            raise JobAbortedError(f"Session {session_id} was deleted")
+        self._maybe_submit_final_report(session)
         return session
 
-    def generate_final_report(self, session_id: str) -> InterviewSession:
-        session = self.repo.get_session_by_id(session_id)
+    async def generate_final_report(self, session_id: str) -> InterviewSession:
+        """최종 리포트 job 본문"""
+        session = await self.repo.get_session_by_id(session_id)
         if not session:
-            return None
-        final_report = self.llm.generate_final_report(session)
-        session.final_report = final_report
-        self.repo.update_session(session)
+            raise JobAbortedError(f"Session {session_id} not found")
+        final_report = await self.llm.agenerate_final_report(session)
+        if not final_report:
+            raise RuntimeError("LLM returned empty final report")
+
+        def apply(s: InterviewSession):
+            s.final_report = final_report
+            s.jobs[FINAL_REPORT_JOB_KEY] = self._job_status(
+                "final_report", None, DONE, self._attempts(s, FINAL_REPORT_JOB_KEY)
+            )
+
+        session = await self._apply(session_id, apply)
+        if not session:
+            raise JobAbortedError(f"Session {session_id} was deleted")
+        if not FEEDBACK_NOTIFY_URL:
+            return session
 
         try:
             post_payload = {
                 "interviewId": session.interview_id,
                 "memberInterviewId": session.member_interview_id
             }
-            response = httpx.post(
-                "https://interview.play-qr.site/notifications/feedback",
+            # 요청마다 클라이언트를 만들지 않고 keep-alive 커넥션 풀을 공유합니다.
+            response = await get_async_http_client().post(
+                FEEDBACK_NOTIFY_URL,
                 json=post_payload,
-                timeout=5.0
+                timeout=5.0,
             )
             response.raise_for_status()
         except httpx.HTTPError as e:
-            print(f"❌ Failed to send report to external server: {e}")
+            logging.info(f"❌ Failed to send report to external server: {e}")
 
         return session
 
-    def get_all_sessions(self) -> List[InterviewSession]:
-        return self.repo.get_all_sessions()
-    def get_session_by_id(self, session_id: str) -> InterviewSession:
-        return self.repo.get_session_by_id(session_id)
-    def get_session_by_interview_and_member_interview_id(self, interview_id: str, member_interview_id: str) -> InterviewSession:
-        return self.repo.get_session_by_interview_and_member_interview_id(interview_id, member_interview_id)
-    def delete_session(self, session_id: str) -> bool:
-        return self.repo.delete_session(session_id)
-    def delete_all_sessions(self) -> int:
-        return self.repo.delete_all_sessions()
\ No newline at end of file
+    async def get_job_status(self, session_id: str) -> Optional[Dict[str, JobStatus]]:
+        fields = await self.repo.get_session_fields(session_id, ["jobs"])
+        if not fields:
+            return None
+        self._resubmit_stale_jobs(session_id, fields["jobs"])
+        return fields["jobs"]
+
+    # ─────────────────── 백그라운드 job 헬퍼 ────────────────────
+    @staticmethod
+    def _job_id(session_id: str, key: str) -> str:
+        return f"{session_id}:{key}"
+
+    @staticmethod
+    def _job_status(kind: str, index: Optional[int], status: str, attempts: int = 0, error: Optional[str] = None) -> JobStatus:
+        return JobStatus(
+            kind=kind, index=index, status=status, attempts=attempts, error=error,
+            updated_at=datetime.now(timezone.utc).isoformat(),
+        )
+
+    @staticmethod
+    def _attempts(session: InterviewSession, key: str) -> int:
+        current = session.jobs.get(key)
+        return current.attempts if current else 1
+
+    async def _apply(self, session_id: str, mutate: Callable[[InterviewSession], None]) -> Optional[InterviewSession]:
+        """
+        최신 세션을 다시 읽어 변경분만 반영 (긴 LLM 호출 동안의 다른 쓰기를 덮어쓰지 않도록).
+        그 사이 다른 worker/replica 가 먼저 저장했으면(version 충돌) 다시 읽어 mutate 를 다시 적용합니다.
+        """
+        for attempt in range(WRITE_CONFLICT_RETRIES + 1):
+            session = await self.repo.get_session_by_id(session_id)
+            if not session:
+                return None
+            mutate(session)
+            try:
+                await self.repo.update_session(session)
+                return session
+            except SessionConflictError:
+                if attempt == WRITE_CONFLICT_RETRIES:
+                    raise
+                logging.info(f"Session {session_id} changed concurrently (version {session.version}), retrying")
+
+    def _status_writer(self, session_id: str, kind: str, index: Optional[int], key: str):
+        async def on_status(status: str, attempts: int, error: Optional[str]):
+            def apply(s: InterviewSession):
+                s.jobs[key] = self._job_status(kind, index, status, attempts, error)
+                # 피드백이 최종 실패해도 최종 리포트는 진행
+                if status == FAILED and kind == "feedback":
+                    self._mark_final_report_pending(s)
+
+            session = await self._apply(session_id, apply)
+            if status == FAILED and kind == "feedback":
+                self._maybe_submit_final_report(session)
+        return on_status
+
+    def _submit_feedback_job(self, session_id: str, index: int):
+        key = feedback_job_key(index)
+        self.jobs.submit(Job(
+            key=self._job_id(session_id, key),
+            run=lambda: self.generate_feedback(session_id, index),
+            on_status=self._status_writer(session_id, "feedback", index, key),
+        ))
+
+    def _submit_final_report_job(self, session_id: str):
+        self.jobs.submit(Job(
+            key=self._job_id(session_id, FINAL_REPORT_JOB_KEY),
+            run=lambda: self.generate_final_report(session_id),
+            on_status=self._status_writer(session_id, "final_report", None, FINAL_REPORT_JOB_KEY),
+        ))
+
+    @staticmethod
+    def _final_report_due(session: InterviewSession) -> bool:
+        if session.final_report is not None or session.cursor.q_idx < session.question_length:
+            return False
+        for i, qa in enumerate(session.qa_flow):
+            job = session.jobs.get(feedback_job_key(i))
+            if qa.feedback is None and not (job and job.status == FAILED):
+                return False
+        return True
+
+    def _mark_final_report_pending(self, session: InterviewSession):
+        # 마지막 피드백과 같은 쓰기로 PENDING 을 남겨, submit 전에 프로세스가 내려가도 복구 대상이 되게 합니다.
+        if FINAL_REPORT_JOB_KEY not in session.jobs and self._final_report_due(session):
+            session.jobs[FINAL_REPORT_JOB_KEY] = self._job_status("final_report", None, PENDING)
+
+    def _maybe_submit_final_report(self, session: Optional[InterviewSession]):
+        if session and self._final_report_due(session):
+            self._submit_final_report_job(session.session_id)
+
+    def _resubmit_stale_jobs(self, session_id: str, jobs: Dict[str, JobStatus]):
+        """
+        큐는 프로세스 메모리에만 있으므로 재시작/배포 중에 대기·실행 중이던 job 은 사라집니다.
+        JOB_LEASE_SECONDS 넘게 상태가 갱신되지 않은 미완료 job 을 다시 넣습니다.
+        """
+        now = datetime.now(timezone.utc)
+        for key, job in jobs.items():
+            if job.status not in UNFINISHED or self.jobs.is_active(self._job_id(session_id, key)):
+                continue
+            updated_at = datetime.fromisoformat(job.updated_at) if job.updated_at else None
+            if updated_at and (now - updated_at).total_seconds() < JOB_LEASE_SECONDS:
+                continue
+            logging.warning(f"Job {session_id}:{key} stuck in {job.status} since {job.updated_at}, resubmitting")
+            if key == FINAL_REPORT_JOB_KEY:
+                self._submit_final_report_job(session_id)
+            elif job.kind == "feedback" and job.index is not None:
+                self._submit_feedback_job(session_id, job.index)
+
+    async def get_all_sessions(self) -> List[InterviewSession]:
+        return await self.repo.get_all_sessions()
+    def iter_all_sessions(self) -> AsyncIterator[InterviewSession]:
+        return self.repo.iter_sessions()
+    async def get_session_by_id(self, session_id: str) -> InterviewSession:
+        return await self.repo.get_session_by_id(session_id)
+    async def get_session_by_interview_and_member_interview_id(self, interview_id: str, member_interview_id: str) -> InterviewSession:
+        return await self.repo.get_session_by_interview_and_member_interview_id(interview_id, member_interview_id)
+    async def delete_session(self, session_id: str) -> bool:
+        return await self.repo.delete_session(session_id)
+    async def delete_all_sessions(self) -> int:
+        return await self.repo.delete_all_sessions()
\ No newline at end of file
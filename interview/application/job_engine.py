@@ -0,0 +1,112 @@
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional
+
+# 상태 값 (InterviewSession.jobs 에 저장)
+PENDING = "pending"
+RUNNING = "running"
+RETRYING = "retrying"
+DONE = "done"
+FAILED = "failed"
+# 아직 끝나지 않은 상태 (프로세스가 재시작되면 큐에서 사라질 수 있음)
+UNFINISHED = frozenset({PENDING, RUNNING, RETRYING})
+
+
+class JobAbortedError(Exception):
+    """다시 시도해도 소용없는 실패 (세션 삭제 등). 재시도 없이 바로 FAILED 로 기록합니다."""
+
+
+@dataclass
+class Job:
+    key: str
+    # 실제 작업. 결과 저장과 DONE 상태 기록까지 run 안에서 한 번의 쓰기로 처리합니다.
+    # DONE 을 기록할 수 없으면(세션/질문 없음) JobAbortedError 를 올려야 합니다.
+    run: Callable[[], Awaitable[None]]
+    # 상태 변경 기록 (status, attempts, error)
+    on_status: Callable[[str, int, Optional[str]], Awaitable[None]]
+
+
+class JobEngine:
+    """
+    피드백 / 최종 리포트 생성을 HTTP 요청 밖에서 처리하는 asyncio 워커 풀.
+    - 같은 key(session, index)의 작업이 대기/실행 중이면 다시 넣지 않습니다.
+    - 실패 시 max_retries 만큼 지수 backoff 후 재시도합니다.
+    """
+
+    def __init__(self, workers: int = 4, max_retries: int = 2, retry_backoff: float = 1.0):
+        self.workers = workers
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._active: Dict[str, Job] = {}
+
+    def submit(self, job: Job) -> bool:
+        """큐에 넣었으면 True, 같은 key가 이미 처리 중이면 False"""
+        if job.key in self._active:
+            return False
+        self._ensure_started()
+        self._active[job.key] = job
+        self._queue.put_nowait(job)
+        return True
+
+    def is_active(self, key: str) -> bool:
+        return key in self._active
+
+    async def join(self):
+        """대기 중인 작업이 모두 끝날 때까지 기다립니다 (테스트/벤치마크용)"""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def shutdown(self):
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+        self._active.clear()
+
+    # ─────────────────── 내부 ────────────────────
+    def _ensure_started(self):
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if not self._tasks:
+            self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def _worker(self):
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._execute(job)
+            finally:
+                self._active.pop(job.key, None)
+                self._queue.task_done()
+
+    async def _execute(self, job: Job):
+        for attempt in range(1, self.max_retries + 2):
+            try:
+                await self._report(job, RUNNING, attempt, None)
+                await job.run()
+                return
+            except asyncio.CancelledError:
+                raise
+            except JobAbortedError as e:
+                logging.warning(f"Job {job.key} aborted: {e}")
+                await self._report(job, FAILED, attempt, str(e))
+                return
+            except Exception as e:
+                if attempt > self.max_retries:
+                    logging.error(f"❌ Job {job.key} failed after {attempt} attempt(s): {e}")
+                    await self._report(job, FAILED, attempt, str(e))
+                    return
+                logging.warning(f"Job {job.key} attempt {attempt} failed, retrying: {e}")
+                await self._report(job, RETRYING, attempt, str(e))
+                await asyncio.sleep(self.retry_backoff * (2 ** (attempt - 1)))
+
+    @staticmethod
+    async def _report(job: Job, status: str, attempts: int, error: Optional[str]):
+        try:
+            await job.on_status(status, attempts, error)
+        except Exception as e:
+            logging.warning(f"Job {job.key} status update ({status}) failed: {e}")
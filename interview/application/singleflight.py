@@ -0,0 +1,44 @@
+import asyncio
+import logging
+from collections import Counter
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class SingleFlight:
+    """
+    같은 key의 작업이 이미 진행 중이면 새로 시작하지 않고 그 결과를 함께 기다립니다.
+    (클라이언트 재시도, ws_server 타임아웃 후 재요청 등으로 같은 LLM/TTS 호출이 겹치는 경우)
+    key 의 첫 번째 항목은 operation 이름이며, operation 별로 호출/병합 횟수를 집계합니다.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[Tuple[Hashable, ...], asyncio.Future] = {}
+        self.calls: Counter = Counter()
+        self.coalesced: Counter = Counter()
+
+    async def do(self, key: Tuple[Hashable, ...], fn: Callable[[], Awaitable[Any]]) -> Any:
+        operation = key[0]
+        self.calls[operation] += 1
+        future = self._inflight.get(key)
+        if future is not None:
+            self.coalesced[operation] += 1
+            logging.info(f"🔗 Coalesced in-flight {operation} call ({self.coalesced[operation]} so far)")
+        else:
+            future = asyncio.ensure_future(fn())
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        # 먼저 온 호출자가 취소돼도(연결 끊김 등) 함께 기다리는 호출자는 결과를 받도록 shield
+        return await asyncio.shield(future)
+
+    def _forget(self, key: Tuple[Hashable, ...], future: asyncio.Future):
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+
+    def in_flight(self) -> int:
+        return len(self._inflight)
+
+    def stats(self) -> dict:
+        return {
+            operation: {"calls": self.calls[operation], "coalesced": self.coalesced[operation]}
+            for operation in self.calls
+        }
@@ -1,6 +1,8 @@
-from typing import Optional, List, Tuple
+import copy
+from functools import lru_cache
+from typing import Any, Iterable, Optional, List, Tuple, Dict
 from dataclasses import dataclass
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr, TypeAdapter
 from interview.domain.info import InfoModel
 
 @dataclass
@@ -21,6 +23,52 @@ class QA(BaseModel):
     follow_ups: Optional[List[FollowUpQA]] = None
     feedback: Optional[str] = None
 
+class JobStatus(BaseModel):
+    kind: str                      # "feedback" | "final_report"
+    index: Optional[int] = None
+    status: str                    # pending | running | retrying | done | failed
+    attempts: int = 0
+    error: Optional[str] = None
+    updated_at: Optional[str] = None   # ISO8601 (DynamoDB에 datetime/float 저장 불가)
+
+# 변경 경로: ("qa_flow", 0, "answer") 처럼 필드 이름 / list index 의 tuple
+ChangePath = Tuple[Any, ...]
+# changes() 에서 dict 에서 사라진 key 를 나타내는 값
+REMOVED = object()
+
+
+def _diff(old: Any, new: Any, path: ChangePath, out: List[Tuple[ChangePath, Any]]) -> None:
+    if old == new:
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key, value in new.items():
+            if key in old:
+                _diff(old[key], value, path + (key,), out)
+            else:
+                out.append((path + (key,), value))
+        for key in old.keys() - new.keys():
+            out.append((path + (key,), REMOVED))
+        return
+    # 길이가 같은 list 는 원소 단위로, 길이가 바뀌면 list 전체를 교체
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        for i, (a, b) in enumerate(zip(old, new)):
+            _diff(a, b, path + (i,), out)
+        return
+    out.append((path, new))
+
+
+def apply_changes(data: dict, changes: List[Tuple[ChangePath, Any]]) -> None:
+    """changes() 결과를 model_dump() 형태의 dict 에 그대로 반영합니다 (값은 복사)."""
+    for path, value in changes:
+        target = data
+        for segment in path[:-1]:
+            target = target[segment]
+        if value is REMOVED:
+            target.pop(path[-1], None)
+        else:
+            target[path[-1]] = copy.deepcopy(value)
+
+
 class InterviewSession(BaseModel):
     interview_id: str
     member_interview_id: str
@@ -31,3 +79,47 @@ class InterviewSession(BaseModel):
     # info: InfoModel
     qa_flow: List[QA]
     final_report: Optional[str] = None
+    # 백그라운드 작업 상태 ("feedback:{index}", "final_report")
+    jobs: Dict[str, JobStatus] = {}
+    # 저장할 때마다 저장소가 1씩 올립니다. 읽은 뒤 다른 쓰기가 있었으면 저장이 SessionConflictError 로 실패합니다.
+    version: int = 0
+
+    # 저장소에서 읽었거나 저장한 시점의 상태. update_session 이 바뀐 필드만 쓰는 데 사용합니다.
+    _snapshot: Optional[dict] = PrivateAttr(default=None)
+
+    def mark_clean(self, snapshot: Optional[dict] = None) -> None:
+        """
+        저장소와 같은 상태로 표시 (저장소가 읽기/쓰기 직후 호출).
+        snapshot 을 주면 저장소에 있는 상태가 그것이라고 표시합니다 (아직 저장하지 않은 변경이 있는 경우).
+        """
+        self._snapshot = self.model_dump() if snapshot is None else snapshot
+
+    def changes(self) -> Optional[List[Tuple[ChangePath, Any]]]:
+        """
+        mark_clean 이후 바뀐 (경로, 새 값) 목록. 값이 REMOVED 면 삭제된 key 입니다.
+        저장소에서 읽은 세션이 아니면(추적 중이 아니면) None — 전체를 저장해야 합니다.
+        """
+        if self._snapshot is None:
+            return None
+        out: List[Tuple[ChangePath, Any]] = []
+        _diff(self._snapshot, self.model_dump(), (), out)
+        return out
+
+
+@lru_cache(maxsize=None)
+def _field_adapter(field: str) -> TypeAdapter:
+    return TypeAdapter(InterviewSession.model_fields[field].annotation)
+
+
+def parse_session_fields(doc: dict, fields: Iterable[str]) -> Dict[str, Any]:
+    """
+    저장소에서 일부 필드만 읽은 문서를 InterviewSession 의 필드 타입으로 변환합니다 (projection 조회용).
+    문서에 없는 필드는 기본값을 씁니다.
+    """
+    result = {}
+    for field in fields:
+        if field in doc:
+            result[field] = _field_adapter(field).validate_python(doc[field])
+        else:
+            result[field] = copy.deepcopy(InterviewSession.model_fields[field].get_default())
+    return result
@@ -1,15 +1,36 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import AsyncIterator, List
+from interview.domain.interview import InterviewSession
 
 class LLMClient(ABC):
     @abstractmethod
-    def generate_questions(self, info: dict) -> str: ...
+    def generate_questions(self, info: dict, cover_letter) -> str: ...
 
     @abstractmethod
-    def generate_follow_up(self, qa_history: list[dict]) -> str: ...
-        
+    def generate_follow_up(self, session: InterviewSession, index: int) -> List[str]: ...
+
+    @abstractmethod
+    def generate_feedback(self, session: InterviewSession, index: int) -> str: ...
+
     @abstractmethod
-    def generate_feedback(self, qa_history: list[dict]) -> str: ...
+    def generate_final_report(self, session: InterviewSession) -> str: ...
 
+    # --- async 버전: 이벤트 루프에서 직접 await (스레드 풀 사용 X) ---
     @abstractmethod
-    def generate_final_report(self, qa_history: list[dict]) -> str: ...
\ No newline at end of file
+    async def agenerate_questions(self, info: dict, cover_letter) -> str: ...
+
+    @abstractmethod
+    async def agenerate_follow_up(self, session: InterviewSession, index: int) -> List[str]: ...
+
+    @abstractmethod
+    async def agenerate_feedback(self, session: InterviewSession, index: int) -> str: ...
+
+    @abstractmethod
+    async def agenerate_final_report(self, session: InterviewSession) -> str: ...
+
+
+    # --- streaming: 꼬리 질문을 한 줄(질문 하나)씩 완성되는 대로 돌려줍니다 ---
+    async def astream_follow_up(self, session: InterviewSession, index: int) -> AsyncIterator[str]:
+        # 기본 구현은 전체 응답을 기다린 뒤 나눠서 넘깁니다. 토큰 스트리밍을 지원하는 provider는 override 합니다.
+        for question in await self.agenerate_follow_up(session, index) or []:
+            yield question
@@ -1,5 +1,18 @@
 from abc import ABC, abstractmethod
-from interview.domain.interview import InterviewSession
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence
+from interview.domain.interview import InterviewSession, QA
+
+
+class SessionConflictError(Exception):
+    """
+    update_session: 세션을 읽은 뒤 다른 worker/replica 가 먼저 저장했거나 삭제함 (version 불일치).
+    다시 읽어서 변경을 반영한 뒤 재시도해야 합니다.
+    """
+
+    def __init__(self, session_id: str, version: int):
+        super().__init__(f"Session {session_id} changed since version {version}")
+        self.session_id = session_id
+        self.version = version
 
 class InterviewRepository(ABC):
     @abstractmethod
@@ -8,20 +21,88 @@ class InterviewRepository(ABC):
     @abstractmethod
     def save_session(self, session: InterviewSession) -> InterviewSession: ...
 
+    def save_sessions(self, sessions: List[InterviewSession]) -> List[InterviewSession]:
+        """새 세션 여러 개를 저장 (저장소가 지원하면 한 번의 bulk 요청으로)"""
+        return [self.save_session(session) for session in sessions]
+
     @abstractmethod
     def update_session(self, session: InterviewSession) -> InterviewSession: ...
 
     @abstractmethod
     def get_all_sessions(self) -> list[InterviewSession]: ...
 
+    def iter_sessions(self) -> Iterator[InterviewSession]:
+        """전체 세션을 하나씩 (저장소가 지원하면 전체를 메모리에 올리지 않고) 돌려줍니다."""
+        yield from self.get_all_sessions()
+
     @abstractmethod
     def get_session_by_interview_and_member_interview_id(self, interview_id: str, member_interview_id: str) -> InterviewSession: ...
 
     @abstractmethod
     def get_session_by_id(self, session_id: str) -> InterviewSession: ...
 
+    def get_session_fields(self, session_id: str, fields: Sequence[str]) -> Optional[Dict[str, Any]]:
+        """
+        세션의 일부 필드만 ({"jobs": {...}, "cursor": Cursor(...)}). 세션이 없으면 None.
+        저장소가 projection 을 지원하면 해당 필드만 읽습니다.
+        """
+        session = self.get_session_by_id(session_id)
+        return {field: getattr(session, field) for field in fields} if session else None
+
+    def get_qa(self, session_id: str, index: int) -> Optional[QA]:
+        """qa_flow[index] 만. 세션이나 질문이 없으면 None."""
+        session = self.get_session_by_id(session_id)
+        if not session or index >= len(session.qa_flow):
+            return None
+        return session.qa_flow[index]
+
     @abstractmethod
     def delete_session(self, session_id: str) -> bool: ...
 
     @abstractmethod
     def delete_all_sessions(self) -> int: ...
+
+
+class AsyncInterviewRepository(ABC):
+    """InterviewRepository 의 async 버전 (이벤트 루프를 막지 않는 드라이버용). 동작은 동기 버전과 같습니다."""
+
+    @abstractmethod
+    async def save_session(self, session: InterviewSession) -> InterviewSession: ...
+
+    async def save_sessions(self, sessions: List[InterviewSession]) -> List[InterviewSession]:
+        return [await self.save_session(session) for session in sessions]
+
+    @abstractmethod
+    async def update_session(self, session: InterviewSession) -> InterviewSession: ...
+
+    @abstractmethod
+    async def get_all_sessions(self) -> list[InterviewSession]: ...
+
+    async def iter_sessions(self) -> AsyncIterator[InterviewSession]:
+        for session in await self.get_all_sessions():
+            yield session
+
+    @abstractmethod
+    async def get_session_by_interview_and_member_interview_id(self, interview_id: str, member_interview_id: str) -> InterviewSession: ...
+
+    @abstractmethod
+    async def get_session_by_id(self, session_id: str) -> InterviewSession: ...
+
+    async def get_session_fields(self, session_id: str, fields: Sequence[str]) -> Optional[Dict[str, Any]]:
+        session = await self.get_session_by_id(session_id)
+        return {field: getattr(session, field) for field in fields} if session else None
+
+    async def get_qa(self, session_id: str, index: int) -> Optional[QA]:
+        session = await self.get_session_by_id(session_id)
+        if not session or index >= len(session.qa_flow):
+            return None
+        return session.qa_flow[index]
+
+    @abstractmethod
+    async def delete_session(self, session_id: str) -> bool: ...
+
+    @abstractmethod
+    async def delete_all_sessions(self) -> int: ...
+
+    async def close(self):
+        """커넥션 풀 정리 (서버 종료 시)"""
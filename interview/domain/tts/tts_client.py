@@ -1,6 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Hashable, List
+
+DEFAULT_VOICE_ID = "Seoyeon"
 
 class TTSClient(ABC):
     @abstractmethod
     def synthesize_to_s3(self, text: str, voice_id: str, filename: str) -> str: ...
+
+    def flight_key(self, text: str, filename: str, voice_id: str = DEFAULT_VOICE_ID) -> Hashable:
+        """같은 key 의 동시 합성은 한 번만 실행하고 결과(object key)를 나눠 씁니다. 기본은 파일 이름까지 같을 때만."""
+        return (text, voice_id, filename)
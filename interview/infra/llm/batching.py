@@ -0,0 +1,120 @@
+import os
+import asyncio
+import logging
+from typing import Awaitable, Callable, List, Optional, Set, Tuple
+
+from interview.infra.llm.http_client import get_async_http_client
+
+# GPU 서버(Local/OpenChat) 질문 생성 micro-batching 설정
+BATCH_ENABLED = os.getenv("LLM_BATCH_ENABLED", "true").lower() == "true"
+BATCH_WINDOW = float(os.getenv("LLM_BATCH_WINDOW_MS", "20")) / 1000
+BATCH_MAX_SIZE = int(os.getenv("LLM_BATCH_MAX_SIZE", "8"))
+
+# batch endpoint가 없는 서버로 판단하는 응답 코드
+UNSUPPORTED_STATUS = (404, 405, 501)
+
+
+class BatchUnsupported(Exception):
+    pass
+
+
+async def apost_batch(url: str, payloads: List[dict]) -> list:
+    """
+    batch endpoint 호출. 요청 {"requests": [단건 payload, ...]} → 응답 {"responses": [...]} (같은 순서)
+    각 응답 항목은 단건 endpoint 응답과 같은 형식(문자열 또는 {"response": ...})입니다.
+    """
+    res = await get_async_http_client().post(url, json={"requests": payloads})
+    if res.status_code in UNSUPPORTED_STATUS:
+        raise BatchUnsupported(f"{url} returned {res.status_code}")
+    res.raise_for_status()
+    return res.json()["responses"]
+
+
+def response_text(item) -> str:
+    if isinstance(item, dict):
+        return item.get("response", "")
+    return item if isinstance(item, str) else ""
+
+
+class PromptBatcher:
+    """
+    window 동안 동시에 들어온 프롬프트를 모아 한 번의 batch 요청으로 보내고, 결과를 호출자별로 나눠 줍니다.
+    - max_batch_size 에 도달하면 window를 기다리지 않고 바로 보냅니다.
+    - 혼자 들어온 프롬프트는 단건 요청으로 보냅니다.
+    - 서버가 batch endpoint를 지원하지 않으면 이후로는 단건 요청만 사용합니다.
+    """
+
+    def __init__(self, send_one: Callable[[dict], Awaitable[str]],
+                 send_batch: Callable[[List[dict]], Awaitable[List[str]]],
+                 window: float = BATCH_WINDOW, max_batch_size: int = BATCH_MAX_SIZE):
+        self.send_one = send_one
+        self.send_batch = send_batch
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self.supported = True
+        self.batches = 0
+        self.batched_prompts = 0
+        self._pending: List[Tuple[dict, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def submit(self, payload: dict) -> str:
+        if not self.supported:
+            return await self.send_one(payload)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((payload, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+        return await future
+
+    # ─────────────────── 내부 ────────────────────
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._send(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: List[Tuple[dict, asyncio.Future]]):
+        payloads = [payload for payload, _ in batch]
+        try:
+            results = await self._dispatch(payloads)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if future.done():  # 호출자가 취소한 경우
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _dispatch(self, payloads: List[dict]) -> list:
+        if len(payloads) > 1 and self.supported:
+            try:
+                results = await self.send_batch(payloads)
+                if len(results) != len(payloads):
+                    raise RuntimeError(f"batch returned {len(results)} results for {len(payloads)} prompts")
+                self.batches += 1
+                self.batched_prompts += len(payloads)
+                logging.info(f"📦 LLM batch request: {len(payloads)} prompts")
+                return results
+            except BatchUnsupported as e:
+                if self.supported:
+                    logging.warning(f"LLM batch endpoint unavailable, falling back to per-prompt requests: {e}")
+                self.supported = False
+        return await asyncio.gather(*(self.send_one(p) for p in payloads), return_exceptions=True)
+
+
+def make_batcher(send_one: Callable[[dict], Awaitable[str]],
+                 send_batch: Callable[[List[dict]], Awaitable[List[str]]]) -> Optional[PromptBatcher]:
+    return PromptBatcher(send_one, send_batch) if BATCH_ENABLED else None
@@ -1,30 +1,30 @@
 import os
+from typing import AsyncIterator
 from interview.domain.interview import InterviewSession
 from interview.domain.llm.llm_client import LLMClient
 from langchain_aws import ChatBedrock
 from langchain.schema import SystemMessage, HumanMessage
+from interview.infra.llm.tokens import record_usage
+from interview.infra.llm.streaming import chunk_text, iter_lines
+from interview.infra.llm.transcript import transcript_for, budgeted_history
 # from langchain.vectorstores import FAISS
 # from langchain.embeddings import BedrockEmbeddings  # or OpenAIEmbeddings etc.
 # from langchain.text_splitter import RecursiveCharacterTextSplitter
 # from langchain.document_loaders import TextLoader
 
-def estimate_tokens(text: str) -> int:
-    return int(len(text) / 4)  # 평균 1 token ≈ 4 characters
-
 class BedrockClient(LLMClient):
     def __init__(self):
         self.use_llm = os.getenv("USE_LLM", "false").lower() == "true"
+        self.model_id = os.getenv("BEDROCK_MODEL_ID", "anthropic.claude-3-sonnet-20240229-v1:0")
         if self.use_llm:
             self.llm = ChatBedrock(
-                model_id="anthropic.claude-3-sonnet-20240229-v1:0",
+                model_id=self.model_id,
                 region_name=os.getenv("AWS_REGION", "us-east-1"),
                 temperature=0.7,
             )
 
-    def generate_questions(self, info, cover_letter) -> str:
-        if not self.use_llm:
-            return "1. 자기소개\n2. 지원동기\n3. 장점과 단점\n4. 직무 관련 경험\n5. 향후 커리어 목표"
-
+    # ─────────────────── 메시지 구성 ────────────────────
+    def _questions_messages(self, info, cover_letter) -> list:
         # loader = TextLoader("/home/ubuntu/images/image_1.txt")  # 지원자 사전 문서 등
         # docs = loader.load()
         # splitter = RecursiveCharacterTextSplitter(chunk_size=500, chunk_overlap=50)
@@ -54,20 +54,71 @@ class BedrockClient(LLMClient):
             SystemMessage(content="너는 면접 질문을 생성하는 면접관이야."),
             HumanMessage(content=prompt)
         ]
-        
+        return messages
+
+    def _follow_up_messages(self, session: InterviewSession, index: int) -> list:
+        system = SystemMessage(content="너는 인공지능 면접관이야.")
+        instruction = HumanMessage(
+            content=f"""위 대화를 참고해서 '{session.qa_flow[index].question}'에 대한 꼬리 질문 2개를 작성해줘.
+            네가 생성한 꼬리 질문 문자열을 line 별로 split하는 규칙 기반 알고리즘 수행 예정이야.
+            그러니 꼬리 질문만 줄바꿈을 통해 답변해주고, "예, 알겠습니다"와 같은 답변은 절대 포함시키지 마.
+            """
+        )
+        history = budgeted_history(session, self.model_id, [system, instruction], keep_turn=index)
+        return [system] + history + [instruction]
+
+    def _feedback_messages(self, session: InterviewSession, index: int) -> list:
+        messages = [SystemMessage(content="너는 인공지능 면접관이야.")] + transcript_for(session).turn_messages(index)
+        messages.append(HumanMessage(content="""위 응답에 대한 면접 피드백을 제공해줘. 
+                                            네가 생성한 피드백을 클라이언트에게 제공하는 규칙 기반 알고리즘 수행 예정이야.
+                                            그러니 피드백 내용만 답변해주고, "예, 알겠습니다"와 같은 답변은 절대 포함시키지 마."""))
+        return messages
+
+    def _final_report_messages(self, session: InterviewSession) -> list:
+        system = SystemMessage(content="너는 면접 평가자야.")
+        instruction = HumanMessage(content="""위 면접에 대한 종합 평가를 제공해줘. 
+                                            네가 생성한 종합 평가를 클라이언트에게 제공하는 규칙 기반 알고리즘 수행 예정이야.
+                                            그러니 종합 평가 내용만 답변해주고, "예, 알겠습니다"와 같은 답변은 절대 포함시키지 마.""")
+        return [system] + budgeted_history(session, self.model_id, [system, instruction]) + [instruction]
+
+    # ─────────────────── 호출 + 토큰 사용량 기록 ────────────────────
+    def _call(self, operation: str, messages: list) -> str:
+        response = self.llm.invoke(messages)
+        record_usage("Bedrock", self.model_id, operation, messages, response.content,
+                     getattr(response, "usage_metadata", None))
+        return response.content
+
+    async def _acall(self, operation: str, messages: list) -> str:
+        response = await self.llm.ainvoke(messages)
+        record_usage("Bedrock", self.model_id, operation, messages, response.content,
+                     getattr(response, "usage_metadata", None))
+        return response.content
+
+    async def _astream(self, operation: str, messages: list) -> AsyncIterator[str]:
+        output, usage = [], None
+        try:
+            async for chunk in self.llm.astream(messages):
+                usage = getattr(chunk, "usage_metadata", None) or usage
+                text = chunk_text(chunk)
+                if text:
+                    output.append(text)
+                    yield text
+        finally:
+            # 중간에 끊겨도(꼬리 질문 개수 충족 등) 받은 만큼 기록
+            record_usage("Bedrock", self.model_id, operation, messages, "".join(output), usage)
+
+    # ─────────────────── sync ────────────────────
+    def generate_questions(self, info, cover_letter) -> str:
+        if not self.use_llm:
+            return "1. 자기소개\n2. 지원동기\n3. 장점과 단점\n4. 직무 관련 경험\n5. 향후 커리어 목표"
+
+        messages = self._questions_messages(info, cover_letter)
         try:
-            return self.llm.invoke(messages).content
+            return self._call("questions", messages)
         except Exception as e:
             print(f"Error generating questions: {e}")
             return None
 
-        prompt_text = prompt.strip()
-        input_tokens = estimate_tokens(prompt_text)
-        output_tokens = estimate_tokens(output)
-
-        logging.info(f"🧮 Bedrock 토큰 사용량 - 입력: {input_tokens}, 출력: {output_tokens}")
-        return output
-
     def generate_follow_up(self, session: InterviewSession, index: int) -> list:
         if not self.use_llm:
             return [
@@ -75,83 +126,81 @@ class BedrockClient(LLMClient):
                 "그 상황에서 다른 선택을 했다면 결과가 달라졌을까요?"
             ]
 
-        messages = [SystemMessage(content="너는 인공지능 면접관이야.")]
-        for qa in session.qa_flow:
-            messages.append(HumanMessage(content=f"질문: {qa.question}\n답변: {qa.answer or '없음'}"))
-            for fqa in qa.follow_ups:
-                messages.append(HumanMessage(content=f"꼬리 질문: {fqa.question}\n답변: {fqa.answer or '없음'}"))
-
-        messages.append(
-            HumanMessage(
-                content=f"""위 대화를 참고해서 '{session.qa_flow[index].question}'에 대한 꼬리 질문 2개를 작성해줘.
-                네가 생성한 꼬리 질문 문자열을 line 별로 split하는 규칙 기반 알고리즘 수행 예정이야.
-                그러니 꼬리 질문만 줄바꿈을 통해 답변해주고, "예, 알겠습니다"와 같은 답변은 절대 포함시키지 마.
-                """
-            )
-        )
-
+        messages = self._follow_up_messages(session, index)
         try:
-            response = self.llm.invoke(messages).content
+            response = self._call("follow_up", messages)
             return [line.strip() for line in response.split("\n") if line.strip()]
         except Exception as e:
             print(f"Error generating follow-up questions: {e}")
             return None
 
-        prompt_text = prompt.strip()
-        input_tokens = estimate_tokens(prompt_text)
-        output_tokens = estimate_tokens(output)
-
-        logging.info(f"🧮 Bedrock 토큰 사용량 - 입력: {input_tokens}, 출력: {output_tokens}")
-        return output
-
     def generate_feedback(self, session: InterviewSession, index: int) -> str:
         if not self.use_llm:
             return "논리적으로 잘 설명했으나, 구체적인 사례가 부족합니다."
 
-        messages = [SystemMessage(content="너는 인공지능 면접관이야.")]
-        qa = session.qa_flow[index]
-        messages.append(HumanMessage(content=f"질문: {qa.question}\n답변: {qa.answer or '없음'}"))
-        for fqa in qa.follow_ups:
-            messages.append(HumanMessage(content=f"꼬리 질문: {fqa.question}\n답변: {fqa.answer or '없음'}"))
-        messages.append(HumanMessage(content="""위 응답에 대한 면접 피드백을 제공해줘. 
-                                            네가 생성한 피드백을 클라이언트에게 제공하는 규칙 기반 알고리즘 수행 예정이야.
-                                            그러니 피드백 내용만 답변해주고, "예, 알겠습니다"와 같은 답변은 절대 포함시키지 마."""))
-
+        messages = self._feedback_messages(session, index)
         try:
-            return self.llm.invoke(messages).content
+            return self._call("feedback", messages)
         except Exception as e:
             print(f"Error generating feedback: {e}")
             return None
 
-        prompt_text = prompt.strip()
-        input_tokens = estimate_tokens(prompt_text)
-        output_tokens = estimate_tokens(output)
-
-        logging.info(f"🧮 Bedrock 토큰 사용량 - 입력: {input_tokens}, 출력: {output_tokens}")
-        return output
-
     def generate_final_report(self, session: InterviewSession) -> str:
         if not self.use_llm:
             return "지원자는 문제 해결 능력과 협업 역량이 뛰어나며, 직무 적합성이 높습니다."
 
-        messages = [SystemMessage(content="너는 면접 평가자야.")]
-        for qa in session.qa_flow:
-            messages.append(HumanMessage(content=f"질문: {qa.question}\n답변: {qa.answer or '없음'}"))
-            for fqa in qa.follow_ups:
-                messages.append(HumanMessage(content=f"꼬리 질문: {fqa.question}\n답변: {fqa.answer or '없음'}"))
-        messages.append(HumanMessage(content="""위 면접에 대한 종합 평가를 제공해줘. 
-                                            네가 생성한 종합 평가를 클라이언트에게 제공하는 규칙 기반 알고리즘 수행 예정이야.
-                                            그러니 종합 평가 내용만 답변해주고, "예, 알겠습니다"와 같은 답변은 절대 포함시키지 마."""))
-
+        messages = self._final_report_messages(session)
         try:
-            return self.llm.invoke(messages).content
+            return self._call("final_report", messages)
         except Exception as e:
             print(f"Error generating final report: {e}")
             return None
 
-        prompt_text = prompt.strip()
-        input_tokens = estimate_tokens(prompt_text)
-        output_tokens = estimate_tokens(output)
+    # ─────────────────── async (ainvoke) ────────────────────
+    async def agenerate_questions(self, info, cover_letter) -> str:
+        if not self.use_llm:
+            return self.generate_questions(info, cover_letter)
+        try:
+            return await self._acall("questions", self._questions_messages(info, cover_letter))
+        except Exception as e:
+            print(f"Error generating questions: {e}")
+            return None
 
-        logging.info(f"🧮 Bedrock 토큰 사용량 - 입력: {input_tokens}, 출력: {output_tokens}")
-        return output
+    async def agenerate_follow_up(self, session: InterviewSession, index: int) -> list:
+        if not self.use_llm:
+            return self.generate_follow_up(session, index)
+        try:
+            response = await self._acall("follow_up", self._follow_up_messages(session, index))
+            return [line.strip() for line in response.split("\n") if line.strip()]
+        except Exception as e:
+            print(f"Error generating follow-up questions: {e}")
+            return None
+
+    async def astream_follow_up(self, session: InterviewSession, index: int) -> AsyncIterator[str]:
+        if not self.use_llm:
+            for question in self.generate_follow_up(session, index):
+                yield question
+            return
+        try:
+            async for question in iter_lines(self._astream("follow_up", self._follow_up_messages(session, index))):
+                yield question
+        except Exception as e:
+            print(f"Error streaming follow-up questions: {e}")
+
+    async def agenerate_feedback(self, session: InterviewSession, index: int) -> str:
+        if not self.use_llm:
+            return self.generate_feedback(session, index)
+        try:
+            return await self._acall("feedback", self._feedback_messages(session, index))
+        except Exception as e:
+            print(f"Error generating feedback: {e}")
+            return None
+
+    async def agenerate_final_report(self, session: InterviewSession) -> str:
+        if not self.use_llm:
+            return self.generate_final_report(session)
+        try:
+            return await self._acall("final_report", self._final_report_messages(session))
+        except Exception as e:
+            print(f"Error generating final report: {e}")
+            return None
@@ -0,0 +1,49 @@
+import os
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from typing import Optional
+
+# GPU 서버(vLLM/OpenChat) 호출에 공통으로 사용하는 keep-alive HTTP 클라이언트
+# 프로세스당 하나만 만들어 모든 LLM provider가 커넥션 풀을 공유합니다.
+MAX_CONNECTIONS = int(os.getenv("LLM_HTTP_MAX_CONNECTIONS", "64"))
+MAX_KEEPALIVE = int(os.getenv("LLM_HTTP_MAX_KEEPALIVE", "32"))
+TIMEOUT = float(os.getenv("LLM_HTTP_TIMEOUT", "60"))
+
+_async_client: Optional[httpx.AsyncClient] = None
+_session: Optional[requests.Session] = None
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    global _async_client
+    if _async_client is None or _async_client.is_closed:
+        _async_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(TIMEOUT, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE,
+                keepalive_expiry=30.0,
+            ),
+        )
+    return _async_client
+
+
+def get_http_session() -> requests.Session:
+    """동기 경로용 requests.Session (커넥션 재사용)"""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=MAX_KEEPALIVE, pool_maxsize=MAX_CONNECTIONS)
+        _session.mount("http://", adapter)
+        _session.mount("https://", adapter)
+    return _session
+
+
+async def aclose_http_clients():
+    global _async_client, _session
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
+    if _session is not None:
+        _session.close()
+        _session = None
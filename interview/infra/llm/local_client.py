@@ -1,8 +1,11 @@
 import os
-import requests
 from interview.domain.interview import InterviewSession
 from interview.domain.llm.llm_client import LLMClient
 from langchain.schema import SystemMessage, HumanMessage
+from interview.infra.llm.http_client import get_async_http_client, get_http_session
+from interview.infra.llm.batching import apost_batch, make_batcher, response_text
+from interview.infra.llm.tokens import record_usage
+from interview.infra.llm.transcript import transcript_for, budgeted_history
 
 
 class LocalClient(LLMClient):
@@ -12,6 +15,11 @@ class LocalClient(LLMClient):
         self.use_llm = os.getenv("USE_LLM", "false").lower() == "true"
         # FastAPI 서버 URL 반드시 /llm/generate
         self.api_url = os.getenv("GPU_API_URL", "http://gpu-server-ip:8000/llm/generate")
+        # 토큰 계산/컨텍스트 예산에 사용할 모델 이름
+        self.model_name = os.getenv("GPU_MODEL_NAME", "llama-3")
+        # 여러 참가자의 질문 생성 요청을 모아 한 번에 보내는 batch endpoint
+        self.batch_api_url = os.getenv("GPU_BATCH_API_URL", f"{self.api_url}_batch")
+        self.batcher = make_batcher(self._apost_payload, self._apost_batch)
 
     # ─────────────────── 내부 헬퍼 ────────────────────
     @staticmethod
@@ -29,38 +37,64 @@ class LocalClient(LLMClient):
         headered.append("<|start_header_id|>assistant<|end_header_id|>")
         return "<|begin_of_text|>" + "".join(headered)
 
-    def _post(self, prompt: str, temperature=0.7, max_new_tokens=256, top_p=0.95) -> str:
-        res = requests.post(
-            self.api_url,
-            json={
-                "prompt": prompt,
-                "temperature": temperature,
-                "max_new_tokens": max_new_tokens,
-                "top_p": top_p,
-            },
-            timeout=60,
-        )
+    @staticmethod
+    def _payload(prompt: str, temperature=0.7, max_new_tokens=256, top_p=0.95) -> dict:
+        return {
+            "prompt": prompt,
+            "temperature": temperature,
+            "max_new_tokens": max_new_tokens,
+            "top_p": top_p,
+        }
+
+    def _post(self, prompt: str, **kwargs) -> str:
+        res = get_http_session().post(self.api_url, json=self._payload(prompt, **kwargs), timeout=60)
+        res.raise_for_status()
+        return res.json().get("response", "").strip()
+
+    async def _apost(self, prompt: str, **kwargs) -> str:
+        return await self._apost_payload(self._payload(prompt, **kwargs))
+
+    async def _apost_payload(self, payload: dict) -> str:
+        res = await get_async_http_client().post(self.api_url, json=payload)
         res.raise_for_status()
         return res.json().get("response", "").strip()
 
+    async def _apost_batch(self, payloads: list) -> list:
+        return [response_text(item).strip() for item in await apost_batch(self.batch_api_url, payloads)]
+
     # ─────────────────── 공통 호출 ────────────────────
-    def _invoke(self, messages: list):
+    def _invoke(self, operation: str, messages: list):
         if not self.use_llm:
             return None
         # langchain Message → str
         strs = [m.content.strip() for m in messages]
         prompt = self._to_prompt(strs)
         try:
-            return self._post(prompt)
+            output = self._post(prompt)
+            record_usage("Local", self.model_name, operation, prompt, output)
+            return output
         except Exception as e:
             print(f"❌ LLM 호출 실패: {e}")
             return ""
 
-    # ─────────────────── 기능별 메서드 ────────────────────
-    def generate_questions(self, info: dict, cover_letter) -> str:
+    async def _ainvoke(self, operation: str, messages: list):
         if not self.use_llm:
-            return "1. 자기소개\n2. 지원동기\n3. 장점과 단점\n4. 직무 관련 경험\n5. 향후 커리어 목표"
+            return None
+        prompt = self._to_prompt([m.content.strip() for m in messages])
+        try:
+            if operation == "questions" and self.batcher is not None:
+                output = await self.batcher.submit(self._payload(prompt))
+            else:
+                output = await self._apost(prompt)
+            record_usage("Local", self.model_name, operation, prompt, output)
+            return output
+        except Exception as e:
+            print(f"❌ LLM 호출 실패: {e}")
+            return ""
 
+    # ─────────────────── 메시지 구성 ────────────────────
+    @staticmethod
+    def _questions_messages(info: dict, cover_letter) -> list:
         sys_msg = "당신은 뛰어난 면접관입니다."
         usr_msg = (
             f"지원 회사: {info["result"]["interview"]["corporateName"]}"
@@ -70,61 +104,86 @@ class LocalClient(LLMClient):
             "(각 질문은 이후 꼬리 질문으로 이어집니다.)\n\n"
             "**[중요] 오직 질문 5개만 줄바꿈으로 나열하고, 그 외 코멘트는 절대 쓰지 마세요.**"
         )
-        return self._invoke([SystemMessage(content=sys_msg), HumanMessage(content=usr_msg)])
-
-    def generate_follow_up(self, session: InterviewSession, index: int) -> list[str]:
-        if not self.use_llm:
-            return [
-                "이 경험이 본인의 성장에 어떤 영향을 주었나요?",
-                "그 상황에서 다른 선택을 했다면 결과가 달라졌을까요?",
-            ]
+        return [SystemMessage(content=sys_msg), HumanMessage(content=usr_msg)]
 
-        msgs = ["너는 인공지능 면접관이야."]
-        for qa in session.qa_flow:
-            msgs.append(f"질문: {qa.question}\n답변: {qa.answer or '없음'}")
-            for fqa in qa.follow_ups:
-                msgs.append(f"꼬리 질문: {fqa.question}\n답변: {fqa.answer or '없음'}")
-
-        msgs.append(
+    def _follow_up_messages(self, session: InterviewSession, index: int) -> list:
+        instruction = (
             f"""위 내용을 참고해 **'{session.qa_flow[index].question}'**에 대한
 꼬리 질문을 두 개 작성해 줘.
 
-- 오직 꼬리 질문 두 줄만 출력
+- 오직 꼬리 질문 두 줄만 출력
 - "예, 알겠습니다" 등 불필요 문구 금지
 - 기존 질문과 중복된 내용 금지"""
         )
+        system = SystemMessage(content="너는 인공지능 면접관이야.")
+        instruction = HumanMessage(content=instruction)
+        history = budgeted_history(session, self.model_name, [system, instruction], keep_turn=index)
+        return [system] + history + [instruction]
+
+    @staticmethod
+    def _feedback_messages(session: InterviewSession, index: int) -> list:
+        instruction = (
+            "위 응답에 대한 피드백을 작성해 줘. "
+            '불필요한 인삿말 없이 **피드백 내용만** 출력해.'
+        )
+        return (
+            [SystemMessage(content="너는 인공지능 면접관이야.")]
+            + transcript_for(session).turn_messages(index)
+            + [HumanMessage(content=instruction)]
+        )
 
-        resp = self._invoke([SystemMessage(content=msgs[0])] + [HumanMessage(content=m) for m in msgs[1:]])
+    def _final_report_messages(self, session: InterviewSession) -> list:
+        instruction = (
+            "위 면접 내용을 종합 평가해 줘. "
+            '단, 인삿말 없이 평가만 출력해.'
+        )
+        system = SystemMessage(content="너는 면접 평가자야.")
+        instruction = HumanMessage(content=instruction)
+        return [system] + budgeted_history(session, self.model_name, [system, instruction]) + [instruction]
+
+    # ─────────────────── 기능별 메서드 ────────────────────
+    def generate_questions(self, info: dict, cover_letter) -> str:
+        if not self.use_llm:
+            return "1. 자기소개\n2. 지원동기\n3. 장점과 단점\n4. 직무 관련 경험\n5. 향후 커리어 목표"
+        return self._invoke("questions", self._questions_messages(info, cover_letter))
+
+    def generate_follow_up(self, session: InterviewSession, index: int) -> list[str]:
+        if not self.use_llm:
+            return [
+                "이 경험이 본인의 성장에 어떤 영향을 주었나요?",
+                "그 상황에서 다른 선택을 했다면 결과가 달라졌을까요?",
+            ]
+        resp = self._invoke("follow_up", self._follow_up_messages(session, index))
         return [line.strip() for line in resp.split("\n") if line.strip()]
 
     def generate_feedback(self, session: InterviewSession, index: int) -> str:
         if not self.use_llm:
             return "논리적으로 잘 설명했으나, 구체적인 사례가 부족합니다."
-
-        msgs = ["너는 인공지능 면접관이야."]
-        qa = session.qa_flow[index]
-        msgs.append(f"질문: {qa.question}\n답변: {qa.answer or '없음'}")
-        for fqa in qa.follow_ups:
-            msgs.append(f"꼬리 질문: {fqa.question}\n답변: {fqa.answer or '없음'}")
-
-        msgs.append(
-            "위 응답에 대한 피드백을 작성해 줘. "
-            '불필요한 인삿말 없이 **피드백 내용만** 출력해.'
-        )
-        return self._invoke([SystemMessage(content=msgs[0])] + [HumanMessage(content=m) for m in msgs[1:]])
+        return self._invoke("feedback", self._feedback_messages(session, index))
 
     def generate_final_report(self, session: InterviewSession) -> str:
         if not self.use_llm:
             return "지원자는 문제 해결 능력과 협업 역량이 뛰어나며, 직무 적합성이 높습니다."
+        return self._invoke("final_report", self._final_report_messages(session))
 
-        msgs = ["너는 면접 평가자야."]
-        for qa in session.qa_flow:
-            msgs.append(f"질문: {qa.question}\n답변: {qa.answer or '없음'}")
-            for fqa in qa.follow_ups:
-                msgs.append(f"꼬리 질문: {fqa.question}\n답변: {fqa.answer or '없음'}")
+    # ─────────────────── async 메서드 (공유 AsyncClient) ────────────────────
+    async def agenerate_questions(self, info: dict, cover_letter) -> str:
+        if not self.use_llm:
+            return self.generate_questions(info, cover_letter)
+        return await self._ainvoke("questions", self._questions_messages(info, cover_letter))
 
-        msgs.append(
-            "위 면접 내용을 종합 평가해 줘. "
-            '단, 인삿말 없이 평가만 출력해.'
-        )
-        return self._invoke([SystemMessage(content=msgs[0])] + [HumanMessage(content=m) for m in msgs[1:]])
+    async def agenerate_follow_up(self, session: InterviewSession, index: int) -> list[str]:
+        if not self.use_llm:
+            return self.generate_follow_up(session, index)
+        resp = await self._ainvoke("follow_up", self._follow_up_messages(session, index))
+        return [line.strip() for line in resp.split("\n") if line.strip()]
+
+    async def agenerate_feedback(self, session: InterviewSession, index: int) -> str:
+        if not self.use_llm:
+            return self.generate_feedback(session, index)
+        return await self._ainvoke("feedback", self._feedback_messages(session, index))
+
+    async def agenerate_final_report(self, session: InterviewSession) -> str:
+        if not self.use_llm:
+            return self.generate_final_report(session)
+        return await self._ainvoke("final_report", self._final_report_messages(session))
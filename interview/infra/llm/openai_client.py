@@ -1,19 +1,25 @@
 import os
+from typing import AsyncIterator
 from interview.domain.interview import InterviewSession
 from interview.domain.llm.llm_client import LLMClient
 from langchain_openai import ChatOpenAI
 from langchain.schema import SystemMessage, HumanMessage
+from interview.infra.llm.tokens import record_usage
+from interview.infra.llm.streaming import chunk_text, iter_lines
+from interview.infra.llm.transcript import transcript_for, budgeted_history
 
 class GPTClient(LLMClient):
     def __init__(self):
         self.use_llm = os.getenv("USE_LLM", "false").lower() == "true"
+        self.model_name = "gpt-4"  # 또는 "gpt-3.5-turbo"
         self.llm = ChatOpenAI(
-            model_name="gpt-4",  # 또는 "gpt-3.5-turbo"
+            model_name=self.model_name,
             temperature=0.7,
             openai_api_key=os.getenv("OPENAI_API_KEY")
         )
 
-    def generate_questions(self, info: dict) -> str:
+    # ─────────────────── 메시지 구성 ────────────────────
+    def _questions_messages(self, info: dict, cover_letter=None) -> list:
         prompt = f"""
 너는 면접관이야. 다음 지원자 정보를 바탕으로 본질적인 면접 질문을 5개 이하로 작성해줘. 숫자와 함께 줄바꿈된 형식으로.
 
@@ -23,20 +29,63 @@ class GPTClient(LLMClient):
 지원 회사: {info['company']}
 지원 직무: {info['position']}
 """
+        return [
+            SystemMessage(content="너는 면접 질문을 생성하는 면접관이야."),
+            HumanMessage(content=prompt)
+        ]
+
+    def _follow_up_messages(self, session: InterviewSession, index: int) -> list:
+        system = SystemMessage(content="너는 인공지능 면접관이야.")
+        instruction = HumanMessage(content=f"위 대화를 참고해서 '{session.qa_flow[index].question}'에 대한 꼬리 질문 2개를 작성해줘.")
+        history = budgeted_history(session, self.model_name, [system, instruction], keep_turn=index)
+        return [system] + history + [instruction]
+
+    def _feedback_messages(self, session: InterviewSession, index: int) -> list:
+        messages = [SystemMessage(content="너는 인공지능 면접관이야.")] + transcript_for(session).turn_messages(index)
+        messages.append(HumanMessage(content="위 응답에 대한 면접 피드백을 1~2문장으로 제공해줘."))
+        return messages
+
+    def _final_report_messages(self, session: InterviewSession) -> list:
+        system = SystemMessage(content="너는 면접 평가자야.")
+        instruction = HumanMessage(content="전체 면접 내용을 바탕으로 종합 평가를 작성해줘.")
+        return [system] + budgeted_history(session, self.model_name, [system, instruction]) + [instruction]
+
+    # ─────────────────── 호출 + 토큰 사용량 기록 ────────────────────
+    def _call(self, operation: str, messages: list) -> str:
+        response = self.llm.invoke(messages)
+        record_usage("GPT", self.model_name, operation, messages, response.content,
+                     getattr(response, "usage_metadata", None))
+        return response.content
+
+    async def _acall(self, operation: str, messages: list) -> str:
+        response = await self.llm.ainvoke(messages)
+        record_usage("GPT", self.model_name, operation, messages, response.content,
+                     getattr(response, "usage_metadata", None))
+        return response.content
+
+    async def _astream(self, operation: str, messages: list) -> AsyncIterator[str]:
+        output, usage = [], None
+        try:
+            async for chunk in self.llm.astream(messages):
+                usage = getattr(chunk, "usage_metadata", None) or usage
+                text = chunk_text(chunk)
+                if text:
+                    output.append(text)
+                    yield text
+        finally:
+            # 중간에 끊겨도(꼬리 질문 개수 충족 등) 받은 만큼 기록
+            record_usage("GPT", self.model_name, operation, messages, "".join(output), usage)
+
+    # ─────────────────── sync ────────────────────
+    def generate_questions(self, info: dict, cover_letter=None) -> str:
         if not self.use_llm:
             return """1. 자기소개\n2. 지원동기\n3. 장점과 단점\n4. 직무 관련 경험\n5. 향후 커리어 목표"""
-        else:
-            messages = [
-                SystemMessage(content="너는 면접 질문을 생성하는 면접관이야."),
-                HumanMessage(content=prompt)
-            ]
-            
-            try:
-                response = self.llm(messages)
-                return response.content
-            except Exception as e:
-                print(f"Error generating questions: {e}")
-                return None
+
+        try:
+            return self._call("questions", self._questions_messages(info, cover_letter))
+        except Exception as e:
+            print(f"Error generating questions: {e}")
+            return None
 
     def generate_follow_up(self, session: InterviewSession, index: int) -> list:
         if not self.use_llm:
@@ -45,17 +94,9 @@ class GPTClient(LLMClient):
                 "그 상황에서 다른 선택을 했다면 결과가 달라졌을까요?"
             ]
 
-        messages = [SystemMessage(content="너는 인공지능 면접관이야.")]
-        for qa in session.qa_flow:
-            messages.append(HumanMessage(content=f"질문: {qa.question}\n답변: {qa.answer or '없음'}"))
-            for fqa in qa.follow_ups:
-                messages.append(HumanMessage(content=f"꼬리 질문: {fqa.question}\n답변: {fqa.answer or '없음'}"))
-
-        messages.append(HumanMessage(content=f"위 대화를 참고해서 '{session.qa_flow[index].question}'에 대한 꼬리 질문 2개를 작성해줘."))
-
         try:
-            response = self.llm(messages)
-            return [line.strip() for line in response.content.split("\n") if line.strip()]
+            response = self._call("follow_up", self._follow_up_messages(session, index))
+            return [line.strip() for line in response.split("\n") if line.strip()]
         except Exception as e:
             print(f"Error generating follow-up questions: {e}")
             return None
@@ -64,18 +105,8 @@ class GPTClient(LLMClient):
         if not self.use_llm:
             return "논리적으로 잘 설명했으나, 구체적인 사례가 부족합니다."
 
-        messages = [SystemMessage(content="너는 인공지능 면접관이야.")]
-        qa = session.qa_flow[index]
-
-        messages.append(HumanMessage(content=f"질문: {qa.question}\n답변: {qa.answer or '없음'}"))
-        for fqa in qa.follow_ups:
-            messages.append(HumanMessage(content=f"꼬리 질문: {fqa.question}\n답변: {fqa.answer or '없음'}"))
-
-        messages.append(HumanMessage(content="위 응답에 대한 면접 피드백을 1~2문장으로 제공해줘."))
-
         try:
-            response = self.llm(messages)
-            return response.content
+            return self._call("feedback", self._feedback_messages(session, index))
         except Exception as e:
             print(f"Error generating feedback: {e}")
             return None
@@ -84,17 +115,57 @@ class GPTClient(LLMClient):
         if not self.use_llm:
             return "지원자는 문제 해결 능력과 협업 역량이 뛰어나며, 직무 적합성이 높습니다."
 
-        messages = [SystemMessage(content="너는 면접 평가자야.")]
-        for qa in session.qa_flow:
-            messages.append(HumanMessage(content=f"질문: {qa.question}\n답변: {qa.answer or '없음'}"))
-            for fqa in qa.follow_ups:
-                messages.append(HumanMessage(content=f"꼬리 질문: {fqa.question}\n답변: {fqa.answer or '없음'}"))
+        try:
+            return self._call("final_report", self._final_report_messages(session))
+        except Exception as e:
+            print(f"Error generating final report: {e}")
+            return None
 
-        messages.append(HumanMessage(content="전체 면접 내용을 바탕으로 종합 평가를 작성해줘."))
+    # ─────────────────── async (ainvoke) ────────────────────
+    async def agenerate_questions(self, info: dict, cover_letter=None) -> str:
+        if not self.use_llm:
+            return self.generate_questions(info, cover_letter)
+        try:
+            return await self._acall("questions", self._questions_messages(info, cover_letter))
+        except Exception as e:
+            print(f"Error generating questions: {e}")
+            return None
+
+    async def agenerate_follow_up(self, session: InterviewSession, index: int) -> list:
+        if not self.use_llm:
+            return self.generate_follow_up(session, index)
+        try:
+            response = await self._acall("follow_up", self._follow_up_messages(session, index))
+            return [line.strip() for line in response.split("\n") if line.strip()]
+        except Exception as e:
+            print(f"Error generating follow-up questions: {e}")
+            return None
 
+    async def astream_follow_up(self, session: InterviewSession, index: int) -> AsyncIterator[str]:
+        if not self.use_llm:
+            for question in self.generate_follow_up(session, index):
+                yield question
+            return
         try:
-            response = self.llm(messages)
-            return response.content
+            async for question in iter_lines(self._astream("follow_up", self._follow_up_messages(session, index))):
+                yield question
+        except Exception as e:
+            print(f"Error streaming follow-up questions: {e}")
+
+    async def agenerate_feedback(self, session: InterviewSession, index: int) -> str:
+        if not self.use_llm:
+            return self.generate_feedback(session, index)
+        try:
+            return await self._acall("feedback", self._feedback_messages(session, index))
+        except Exception as e:
+            print(f"Error generating feedback: {e}")
+            return None
+
+    async def agenerate_final_report(self, session: InterviewSession) -> str:
+        if not self.use_llm:
+            return self.generate_final_report(session)
+        try:
+            return await self._acall("final_report", self._final_report_messages(session))
         except Exception as e:
             print(f"Error generating final report: {e}")
-            return None
\ No newline at end of file
+            return None
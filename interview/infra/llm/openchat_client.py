@@ -1,19 +1,25 @@
 import os
-import requests
 from interview.domain.interview import InterviewSession
 from interview.domain.llm.llm_client import LLMClient
 from langchain.schema import SystemMessage, HumanMessage
+from interview.infra.llm.tokens import record_usage
+from interview.infra.llm.transcript import transcript_for, budgeted_history
+from interview.infra.llm.http_client import get_async_http_client, get_http_session
+from interview.infra.llm.batching import apost_batch, make_batcher, response_text
 
 
 class OpenChatClient(LLMClient):
     def __init__(self):
         self.use_llm = os.getenv("USE_LLM", "false").lower() == "true"
         self.api_url = os.getenv("GPU_API_URL", "http://gpu-server-ip:8000/generate")
-
-    def _invoke(self, messages: list) -> str:
-        if not self.use_llm:
-            return None
-
+        # 토큰 계산/컨텍스트 예산에 사용할 모델 이름
+        self.model_name = os.getenv("GPU_MODEL_NAME", "openchat")
+        # 여러 참가자의 질문 생성 요청을 모아 한 번에 보내는 batch endpoint
+        self.batch_api_url = os.getenv("GPU_BATCH_API_URL", f"{self.api_url}_batch")
+        self.batcher = make_batcher(self._apost_payload, self._apost_batch)
+
+    @staticmethod
+    def _to_prompt(messages: list) -> str:
         # OpenChat 스타일 prompt 구성
         system_prompt = ""
         user_prompt = ""
@@ -23,36 +29,72 @@ class OpenChatClient(LLMClient):
             elif isinstance(msg, HumanMessage):
                 user_prompt += f"### User:\n{msg.content.strip()}\n"
 
-        prompt = f"{system_prompt}{user_prompt}### Assistant:"
+        return f"{system_prompt}{user_prompt}### Assistant:"
 
+    @staticmethod
+    def _parse_response(res) -> str:
+        # 💡 응답이 JSON 문자열인지, 그냥 문자열인지 구분
         try:
-            res = requests.post(self.api_url, json={
-                "prompt": prompt,
-                "temperature": 0.7,
-                "max_new_tokens": 512
-            })
-            res.raise_for_status()
-
-            # 💡 응답이 JSON 문자열인지, 그냥 문자열인지 구분
-            try:
-                data = res.json()
-                if isinstance(data, dict):
-                    return data.get("response", "")
-                elif isinstance(data, str):
-                    return data  # 혹시 string 자체가 리턴되는 경우
-                else:
-                    return ""
-            except Exception:
-                return res.text  # fallback 처리
+            data = res.json()
+            if isinstance(data, dict):
+                return data.get("response", "")
+            elif isinstance(data, str):
+                return data  # 혹시 string 자체가 리턴되는 경우
+            else:
+                return ""
+        except Exception:
+            return res.text  # fallback 처리
+
+    @staticmethod
+    def _payload(prompt: str) -> dict:
+        return {
+            "prompt": prompt,
+            "temperature": 0.7,
+            "max_new_tokens": 512
+        }
+
+    def _invoke(self, operation: str, messages: list) -> str:
+        if not self.use_llm:
+            return None
 
+        try:
+            prompt = self._to_prompt(messages)
+            res = get_http_session().post(self.api_url, json=self._payload(prompt))
+            res.raise_for_status()
+            output = self._parse_response(res)
+            record_usage("OpenChat", self.model_name, operation, prompt, output)
+            return output
         except Exception as e:
             print(f"❌ Error invoking OpenChat API: {e}")
             return ""
 
-    def generate_questions(self, info: dict) -> str:
+    async def _apost_payload(self, payload: dict) -> str:
+        res = await get_async_http_client().post(self.api_url, json=payload)
+        res.raise_for_status()
+        return self._parse_response(res)
+
+    async def _apost_batch(self, payloads: list) -> list:
+        return [response_text(item) for item in await apost_batch(self.batch_api_url, payloads)]
+
+    async def _ainvoke(self, operation: str, messages: list) -> str:
         if not self.use_llm:
-            return "1. 자기소개\n2. 지원동기\n3. 장점과 단점\n4. 직무 관련 경험\n5. 향후 커리어 목표"
+            return None
+
+        try:
+            prompt = self._to_prompt(messages)
+            if operation == "questions" and self.batcher is not None:
+                output = await self.batcher.submit(self._payload(prompt))
+            else:
+                output = await self._apost_payload(self._payload(prompt))
+            record_usage("OpenChat", self.model_name, operation, prompt, output)
+            return output
+        except Exception as e:
+            print(f"❌ Error invoking OpenChat API: {e}")
+            return ""
 
+    # ─────────────────── 메시지 구성 ────────────────────
+    @staticmethod
+    def _questions_messages(info: dict, cover_letter=None) -> list:
         prompt = f"""
         너는 면접관이야. 다음은 지원자 정보야.
 
@@ -68,12 +110,42 @@ class OpenChatClient(LLMClient):
         다시 한번 말할게. 오로지 질문만 줄바꿈을 통해 5개 생성해.
         """
 
-        messages = [
+        return [
             SystemMessage(content="너는 면접 질문을 생성하는 면접관이야."),
             HumanMessage(content=prompt)
         ]
 
-        return self._invoke(messages)
+    def _follow_up_messages(self, session: InterviewSession, index: int) -> list:
+        system = SystemMessage(content="너는 인공지능 면접관이야.")
+        instruction = HumanMessage(
+            content=f"""위 대화를 참고해서 '{session.qa_flow[index].question}'에 대한 꼬리 질문 2개를 작성해줘.
+            네가 생성한 꼬리 질문 문자열을 line 별로 split하는 규칙 기반 알고리즘 수행 예정이야.
+            그러니 꼬리 질문만 줄바꿈을 통해 답변해주고, "예, 알겠습니다"와 같은 답변은 절대 포함시키지 마.
+            기존 질문과 같은 내용을 꼬리 질문으로 생성하지 마"""
+        )
+        history = budgeted_history(session, self.model_name, [system, instruction], keep_turn=index)
+        return [system] + history + [instruction]
+
+    @staticmethod
+    def _feedback_messages(session: InterviewSession, index: int) -> list:
+        messages = [SystemMessage(content="너는 인공지능 면접관이야.")] + transcript_for(session).turn_messages(index)
+        messages.append(HumanMessage(content="""위 응답에 대한 면접 피드백을 제공해줘. 
+                                            네가 생성한 피드백을 클라이언트에게 제공하는 규칙 기반 알고리즘 수행 예정이야.
+                                            그러니 피드백 내용만 답변해주고, "예, 알겠습니다"와 같은 답변은 절대 포함시키지 마."""))
+        return messages
+
+    def _final_report_messages(self, session: InterviewSession) -> list:
+        system = SystemMessage(content="너는 면접 평가자야.")
+        instruction = HumanMessage(content="""위 면접에 대한 종합 평가를 제공해줘. 
+                                            네가 생성한 종합 평가를 클라이언트에게 제공하는 규칙 기반 알고리즘 수행 예정이야.
+                                            그러니 종합 평가 내용만 답변해주고, "예, 알겠습니다"와 같은 답변은 절대 포함시키지 마.""")
+        return [system] + budgeted_history(session, self.model_name, [system, instruction]) + [instruction]
+
+    # ─────────────────── sync ────────────────────
+    def generate_questions(self, info: dict, cover_letter=None) -> str:
+        if not self.use_llm:
+            return "1. 자기소개\n2. 지원동기\n3. 장점과 단점\n4. 직무 관련 경험\n5. 향후 커리어 목표"
+        return self._invoke("questions", self._questions_messages(info, cover_letter))
 
     def generate_follow_up(self, session: InterviewSession, index: int) -> list:
         if not self.use_llm:
@@ -82,23 +154,8 @@ class OpenChatClient(LLMClient):
                 "그 상황에서 다른 선택을 했다면 결과가 달라졌을까요?"
             ]
 
-        messages = [SystemMessage(content="너는 인공지능 면접관이야.")]
-        for qa in session.qa_flow:
-            messages.append(HumanMessage(content=f"질문: {qa.question}\n답변: {qa.answer or '없음'}"))
-            for fqa in qa.follow_ups:
-                messages.append(HumanMessage(content=f"꼬리 질문: {fqa.question}\n답변: {fqa.answer or '없음'}"))
-
-        messages.append(
-            HumanMessage(
-                content=f"""위 대화를 참고해서 '{session.qa_flow[index].question}'에 대한 꼬리 질문 2개를 작성해줘.
-                네가 생성한 꼬리 질문 문자열을 line 별로 split하는 규칙 기반 알고리즘 수행 예정이야.
-                그러니 꼬리 질문만 줄바꿈을 통해 답변해주고, "예, 알겠습니다"와 같은 답변은 절대 포함시키지 마.
-                기존 질문과 같은 내용을 꼬리 질문으로 생성하지 마"""
-            )
-        )
-
         try:
-            response = self._invoke(messages)
+            response = self._invoke("follow_up", self._follow_up_messages(session, index))
             return [line.strip() for line in response.split("\n") if line.strip()]
         except Exception as e:
             print(f"Error generating follow-up questions: {e}")
@@ -107,29 +164,35 @@ class OpenChatClient(LLMClient):
     def generate_feedback(self, session: InterviewSession, index: int) -> str:
         if not self.use_llm:
             return "논리적으로 잘 설명했으나, 구체적인 사례가 부족합니다."
-
-        messages = [SystemMessage(content="너는 인공지능 면접관이야.")]
-        qa = session.qa_flow[index]
-        messages.append(HumanMessage(content=f"질문: {qa.question}\n답변: {qa.answer or '없음'}"))
-        for fqa in qa.follow_ups:
-            messages.append(HumanMessage(content=f"꼬리 질문: {fqa.question}\n답변: {fqa.answer or '없음'}"))
-        messages.append(HumanMessage(content="""위 응답에 대한 면접 피드백을 제공해줘. 
-                                            네가 생성한 피드백을 클라이언트에게 제공하는 규칙 기반 알고리즘 수행 예정이야.
-                                            그러니 피드백 내용만 답변해주고, "예, 알겠습니다"와 같은 답변은 절대 포함시키지 마."""))
-
-        return self._invoke(messages)
+        return self._invoke("feedback", self._feedback_messages(session, index))
 
     def generate_final_report(self, session: InterviewSession) -> str:
         if not self.use_llm:
             return "지원자는 문제 해결 능력과 협업 역량이 뛰어나며, 직무 적합성이 높습니다."
+        return self._invoke("final_report", self._final_report_messages(session))
 
-        messages = [SystemMessage(content="너는 면접 평가자야.")]
-        for qa in session.qa_flow:
-            messages.append(HumanMessage(content=f"질문: {qa.question}\n답변: {qa.answer or '없음'}"))
-            for fqa in qa.follow_ups:
-                messages.append(HumanMessage(content=f"꼬리 질문: {fqa.question}\n답변: {fqa.answer or '없음'}"))
-        messages.append(HumanMessage(content="""위 면접에 대한 종합 평가를 제공해줘. 
-                                            네가 생성한 종합 평가를 클라이언트에게 제공하는 규칙 기반 알고리즘 수행 예정이야.
-                                            그러니 종합 평가 내용만 답변해주고, "예, 알겠습니다"와 같은 답변은 절대 포함시키지 마."""))
+    # ─────────────────── async (공유 AsyncClient) ────────────────────
+    async def agenerate_questions(self, info: dict, cover_letter=None) -> str:
+        if not self.use_llm:
+            return self.generate_questions(info, cover_letter)
+        return await self._ainvoke("questions", self._questions_messages(info, cover_letter))
+
+    async def agenerate_follow_up(self, session: InterviewSession, index: int) -> list:
+        if not self.use_llm:
+            return self.generate_follow_up(session, index)
+        try:
+            response = await self._ainvoke("follow_up", self._follow_up_messages(session, index))
+            return [line.strip() for line in response.split("\n") if line.strip()]
+        except Exception as e:
+            print(f"Error generating follow-up questions: {e}")
+            return None
 
-        return self._invoke(messages)
+    async def agenerate_feedback(self, session: InterviewSession, index: int) -> str:
+        if not self.use_llm:
+            return self.generate_feedback(session, index)
+        return await self._ainvoke("feedback", self._feedback_messages(session, index))
+
+    async def agenerate_final_report(self, session: InterviewSession) -> str:
+        if not self.use_llm:
+            return self.generate_final_report(session)
+        return await self._ainvoke("final_report", self._final_report_messages(session))
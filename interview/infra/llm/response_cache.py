@@ -0,0 +1,242 @@
+import os
+import re
+import json
+import time
+import asyncio
+import hashlib
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import AsyncIterator, Optional, Tuple
+
+from interview.domain.interview import InterviewSession
+from interview.domain.llm.llm_client import LLMClient
+
+
+def _normalize(value):
+    """공백/대소문자 차이로 같은 입력이 다른 키가 되지 않도록 정규화"""
+    if isinstance(value, str):
+        return re.sub(r"\s+", " ", value).strip().lower()
+    if isinstance(value, dict):
+        return {k: _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    return value
+
+
+def question_cache_key(info: dict, cover_letter, provider: str, model: str) -> str:
+    """(회사, 직무, 자기소개서 qnaList, 질문 수, provider, model) 해시"""
+    result = info.get("result") if isinstance(info, dict) else None
+    if isinstance(result, dict):
+        interview = result.get("interview") or {}
+        fields = {
+            "company": interview.get("corporateName"),
+            "job": interview.get("jobName"),
+            "question_number": (result.get("options") or {}).get("questionNumber"),
+        }
+    else:
+        # GPT/OpenChat 용 평면 info (name, company, position …)
+        fields = {"info": info}
+    cover_letter = [
+        {"question": qna.get("question"), "answer": qna.get("answer")} if isinstance(qna, dict) else qna
+        for qna in cover_letter or []
+    ]
+    raw = json.dumps(
+        {**_normalize(fields), "qna_list": _normalize(cover_letter), "provider": provider, "model": model},
+        ensure_ascii=False, sort_keys=True, default=str,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    LLM 응답 캐시.
+    - 메모리: LRU(max_entries) + TTL
+    - 디스크: cache_dir/<key[:2]>/<key>.json (재시작 후에도 유지, 같은 TTL 적용)
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 7 * 24 * 3600,
+                 cache_dir: Optional[str] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.cache_dir = cache_dir
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def get_memory(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self._expired(entry[1]):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def get_disk(self, key: str) -> Optional[str]:
+        """디스크 tier 조회. 찾으면 메모리에 올리고, 없으면 miss로 집계합니다."""
+        entry = self._read_file(key) if self.cache_dir else None
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._remember(key, *entry)
+        return entry[0]
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.get_memory(key)
+        return value if value is not None else self.get_disk(key)
+
+    def put(self, key: str, value: str) -> None:
+        created_at = time.time()
+        with self._lock:
+            self._remember(key, value, created_at)
+        if self.cache_dir:
+            self._write_file(key, value, created_at)
+
+    def record_bypass(self) -> None:
+        with self._lock:
+            self.bypassed += 1
+
+    def hit_rate(self) -> float:
+        total = self.hits + self.disk_hits + self.misses
+        return (self.hits + self.disk_hits) / total if total else 0.0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "bypassed": self.bypassed,
+                "hit_rate": self.hit_rate(),
+            }
+
+    # ─────────────────── 내부 헬퍼 ────────────────────
+    def _expired(self, created_at: float) -> bool:
+        return self.ttl_seconds > 0 and time.time() - created_at > self.ttl_seconds
+
+    def _remember(self, key: str, value: str, created_at: float):
+        self._entries[key] = (value, created_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def _read_file(self, key: str) -> Optional[Tuple[str, float]]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.warning(f"LLM cache read failed ({path}): {e}")
+            return None
+        if self._expired(data["created_at"]):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        return data["value"], data["created_at"]
+
+    def _write_file(self, key: str, value: str, created_at: float):
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # 같은 디렉터리에 임시 파일로 쓴 뒤 교체 (동시 쓰기/중단 시 깨진 파일 방지)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"value": value, "created_at": created_at}, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logging.warning(f"LLM cache write failed ({path}): {e}")
+
+
+class CachedLLMClient(LLMClient):
+    """
+    질문 생성(generate_questions) 결과를 캐시하는 LLMClient 래퍼.
+    꼬리 질문/피드백/최종 리포트는 답변마다 달라지므로 그대로 위임합니다.
+    """
+
+    def __init__(self, llm: LLMClient, cache: LLMResponseCache, bypass: bool = False,
+                 provider: Optional[str] = None):
+        self.llm = llm
+        self.cache = cache
+        self.bypass = bypass
+        self.provider = provider or type(llm).__name__
+        self.model = getattr(llm, "model_id", None) or getattr(llm, "model_name", "")
+
+    def _key(self, info: dict, cover_letter) -> Optional[str]:
+        if self.bypass:
+            self.cache.record_bypass()
+            return None
+        return question_cache_key(info, cover_letter, self.provider, self.model)
+
+    def _log_hit(self):
+        logging.info(f"🔁 LLM question cache hit (hit_rate={self.cache.hit_rate():.1%})")
+
+    # ─────────────────── sync ────────────────────
+    def generate_questions(self, info: dict, cover_letter) -> str:
+        key = self._key(info, cover_letter)
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self._log_hit()
+                return cached
+        result = self.llm.generate_questions(info, cover_letter)
+        if key is not None and result:
+            self.cache.put(key, result)
+        return result
+
+    def generate_follow_up(self, session: InterviewSession, index: int) -> list:
+        return self.llm.generate_follow_up(session, index)
+
+    def generate_feedback(self, session: InterviewSession, index: int) -> str:
+        return self.llm.generate_feedback(session, index)
+
+    def generate_final_report(self, session: InterviewSession) -> str:
+        return self.llm.generate_final_report(session)
+
+    # ─────────────────── async ────────────────────
+    async def agenerate_questions(self, info: dict, cover_letter) -> str:
+        key = self._key(info, cover_letter)
+        if key is not None:
+            cached = self.cache.get_memory(key)
+            if cached is None:
+                # 디스크 I/O는 이벤트 루프 밖에서
+                cached = await asyncio.to_thread(self.cache.get_disk, key)
+            if cached is not None:
+                self._log_hit()
+                return cached
+        result = await self.llm.agenerate_questions(info, cover_letter)
+        if key is not None and result:
+            await asyncio.to_thread(self.cache.put, key, result)
+        return result
+
+    async def agenerate_follow_up(self, session: InterviewSession, index: int) -> list:
+        return await self.llm.agenerate_follow_up(session, index)
+
+    async def astream_follow_up(self, session: InterviewSession, index: int) -> AsyncIterator[str]:
+        async for question in self.llm.astream_follow_up(session, index):
+            yield question
+
+    async def agenerate_feedback(self, session: InterviewSession, index: int) -> str:
+        return await self.llm.agenerate_feedback(session, index)
+
+    async def agenerate_final_report(self, session: InterviewSession) -> str:
+        return await self.llm.agenerate_final_report(session)
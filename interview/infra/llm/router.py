@@ -0,0 +1,301 @@
+import os
+import time
+import asyncio
+import logging
+from collections import deque
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from interview.domain.interview import InterviewSession
+from interview.domain.llm.llm_client import LLMClient
+
+# 여러 provider 를 묶어 쓸 때의 라우팅 설정
+HEDGE_OPERATIONS = {
+    op.strip() for op in os.getenv("LLM_HEDGE_OPERATIONS", "questions,follow_up").split(",") if op.strip()
+}
+HEDGE_PERCENTILE = float(os.getenv("LLM_HEDGE_PERCENTILE", "95"))
+# 지연 통계가 충분히 쌓이기 전에 쓸 hedge 대기 시간(초)
+HEDGE_DEFAULT_DELAY = float(os.getenv("LLM_HEDGE_DEFAULT_DELAY", "5"))
+HEDGE_MIN_SAMPLES = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "20"))
+BREAKER_FAILURE_THRESHOLD = int(os.getenv("LLM_BREAKER_FAILURES", "5"))
+BREAKER_RESET_TIMEOUT = float(os.getenv("LLM_BREAKER_RESET_SECONDS", "30"))
+STATS_WINDOW = 200
+
+
+class RollingStats:
+    """최근 window 개 호출의 지연 시간 / 실패 여부"""
+
+    def __init__(self, window: int = STATS_WINDOW):
+        self.latencies = deque(maxlen=window)
+        self.outcomes = deque(maxlen=window)
+
+    def record(self, elapsed: float, ok: bool):
+        self.outcomes.append(ok)
+        if ok:
+            self.latencies.append(elapsed)
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * q / 100))]
+
+    def error_rate(self) -> float:
+        return self.outcomes.count(False) / len(self.outcomes) if self.outcomes else 0.0
+
+    def snapshot(self) -> dict:
+        return {
+            "samples": len(self.outcomes),
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+            "error_rate": self.error_rate(),
+        }
+
+
+class CircuitBreaker:
+    """
+    연속 실패가 failure_threshold 에 도달하면 open (호출 제외).
+    reset_timeout 이 지나면 half-open 으로 한 번만 시험 호출을 허용하고, 성공하면 close 합니다.
+    """
+
+    def __init__(self, failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+                 reset_timeout: float = BREAKER_RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def available(self) -> bool:
+        """후보 선택용 (상태를 바꾸지 않음). half-open 이면 시험 호출이 진행 중이 아닐 때만 True"""
+        state = self.state
+        return state == "closed" or (state == "half_open" and not self._trial)
+
+    def allow(self) -> bool:
+        """실제로 호출을 시작할 때. half-open 이면 시험 호출 자리를 차지합니다."""
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._trial:
+            self._trial = True
+            return True
+        return False
+
+    def release(self):
+        """시험 호출이 결과 없이 끝남 (취소 등). 다음 호출이 다시 시험할 수 있도록 자리를 비웁니다."""
+        self._trial = False
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+        self._trial = False
+
+    def record_failure(self) -> bool:
+        """이번 실패로 open 되었으면 True"""
+        self.failures += 1
+        was_trial, self._trial = self._trial, False
+        if was_trial or (self.opened_at is None and self.failures >= self.failure_threshold):
+            self.opened_at = time.monotonic()
+            return True
+        return False
+
+
+class _Provider:
+    def __init__(self, name: str, client: LLMClient):
+        self.name = name
+        self.client = client
+        self.breaker = CircuitBreaker()
+        self.stats: Dict[str, RollingStats] = {}
+
+    def stats_for(self, operation: str) -> RollingStats:
+        if operation not in self.stats:
+            self.stats[operation] = RollingStats()
+        return self.stats[operation]
+
+
+def _failed(result) -> bool:
+    # provider 들은 오류를 None / "" 로 돌려주므로 빈 결과도 실패로 봅니다.
+    return result is None or result == "" or result == []
+
+
+class RouterLLMClient(LLMClient):
+    """
+    여러 LLM provider 를 우선순위 순서로 묶는 LLMClient.
+    - provider/operation 별 최근 지연(p50/p99)과 실패율을 기록합니다.
+    - hedge 대상 operation 은 첫 provider 가 자기 p95(LLM_HEDGE_PERCENTILE) 지연을 넘기면
+      다음 provider 에 같은 요청을 보내고 먼저 성공한 결과를 씁니다.
+    - 실패가 이어지는 provider 는 circuit breaker 로 잠시 제외하고, 실패 시 다음 provider 로 넘어갑니다.
+    """
+
+    def __init__(self, providers: List[Tuple[str, LLMClient]], hedge_operations=None):
+        self.providers = [_Provider(name, client) for name, client in providers]
+        self.hedge_operations = HEDGE_OPERATIONS if hedge_operations is None else set(hedge_operations)
+        self.use_llm = any(getattr(client, "use_llm", True) for _, client in providers)
+        # 캐시 키 등에 사용 (provider 구성이 바뀌면 다른 모델로 취급)
+        self.model_name = ",".join(
+            getattr(client, "model_id", None) or getattr(client, "model_name", name) for name, client in providers
+        )
+
+    # ─────────────────── 라우팅 ────────────────────
+    def _candidates(self) -> Tuple[List[_Provider], bool]:
+        """(시도할 provider 목록, breaker 무시 여부). 실제로 호출하기 전에는 breaker 상태를 바꾸지 않습니다."""
+        available = [p for p in self.providers if p.breaker.available()]
+        # 모두 open 이면 그래도 순서대로 시도 (전부 막아 버리지 않음)
+        return (available, False) if available else (list(self.providers), True)
+
+    @staticmethod
+    def _acquire(provider: _Provider, forced: bool) -> Optional[bool]:
+        """호출을 시작할 수 있으면 half-open 시험 호출인지 여부, 그 사이 다른 호출이 시험 자리를 가져갔으면 None"""
+        trial = provider.breaker.state == "half_open"
+        if provider.breaker.allow():
+            return trial
+        return False if forced else None
+
+    def _hedge_delay(self, provider: _Provider, operation: str) -> float:
+        stats = provider.stats_for(operation)
+        if len(stats.latencies) < HEDGE_MIN_SAMPLES:
+            return HEDGE_DEFAULT_DELAY
+        return stats.percentile(HEDGE_PERCENTILE)
+
+    def _record(self, provider: _Provider, operation: str, elapsed: float, ok: bool):
+        provider.stats_for(operation).record(elapsed, ok)
+        if ok:
+            provider.breaker.record_success()
+        elif provider.breaker.record_failure():
+            logging.warning(f"⛔ LLM provider {provider.name} circuit opened after {provider.breaker.failures} failure(s)")
+
+    async def _timed(self, provider: _Provider, operation: str, call: Callable[[LLMClient], Awaitable],
+                     trial: bool = False):
+        start = time.perf_counter()
+        try:
+            result = await call(provider.client)
+        except asyncio.CancelledError:
+            # hedge 에서 진 쪽은 취소됩니다. 결과가 없으므로 기록하지 않고 시험 자리만 돌려줍니다.
+            if trial:
+                provider.breaker.release()
+            raise
+        except Exception as e:
+            logging.warning(f"LLM provider {provider.name} {operation} failed: {e}")
+            result = None
+        self._record(provider, operation, time.perf_counter() - start, not _failed(result))
+        return result
+
+    async def _route(self, operation: str, call: Callable[[LLMClient], Awaitable]):
+        queue, forced = self._candidates()
+        hedge = operation in self.hedge_operations
+        pending: Dict[asyncio.Task, _Provider] = {}
+
+        def start_next() -> Optional[_Provider]:
+            while queue:
+                provider = queue.pop(0)
+                trial = self._acquire(provider, forced)
+                if trial is not None:
+                    pending[asyncio.create_task(self._timed(provider, operation, call, trial))] = provider
+                    return provider
+            return None
+
+        primary = start_next()
+        hedged = False
+        try:
+            while pending:
+                timeout = self._hedge_delay(primary, operation) if hedge and not hedged and queue else None
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    hedged = True
+                    backup = start_next()
+                    if backup is not None:
+                        logging.info(f"🪁 Hedging {operation}: {primary.name} slower than {timeout:.2f}s, also trying {backup.name}")
+                    continue
+                for task in done:
+                    pending.pop(task)
+                    result = task.result()
+                    if not _failed(result):
+                        return result
+                if not pending and queue:
+                    start_next()  # 실패 → 다음 provider 로 failover
+            return None
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _route_sync(self, operation: str, call: Callable[[LLMClient], object]):
+        """동기 경로: hedge 없이 순서대로 failover"""
+        providers, forced = self._candidates()
+        for provider in providers:
+            if self._acquire(provider, forced) is None:
+                continue
+            start = time.perf_counter()
+            try:
+                result = call(provider.client)
+            except Exception as e:
+                logging.warning(f"LLM provider {provider.name} {operation} failed: {e}")
+                result = None
+            self._record(provider, operation, time.perf_counter() - start, not _failed(result))
+            if not _failed(result):
+                return result
+        return None
+
+    def stats(self) -> dict:
+        return {
+            p.name: {"state": p.breaker.state, **{op: s.snapshot() for op, s in p.stats.items()}}
+            for p in self.providers
+        }
+
+    # ─────────────────── sync ────────────────────
+    def generate_questions(self, info: dict, cover_letter) -> str:
+        return self._route_sync("questions", lambda c: c.generate_questions(info, cover_letter))
+
+    def generate_follow_up(self, session: InterviewSession, index: int) -> list:
+        return self._route_sync("follow_up", lambda c: c.generate_follow_up(session, index))
+
+    def generate_feedback(self, session: InterviewSession, index: int) -> str:
+        return self._route_sync("feedback", lambda c: c.generate_feedback(session, index))
+
+    def generate_final_report(self, session: InterviewSession) -> str:
+        return self._route_sync("final_report", lambda c: c.generate_final_report(session))
+
+    # ─────────────────── async ────────────────────
+    async def agenerate_questions(self, info: dict, cover_letter) -> str:
+        return await self._route("questions", lambda c: c.agenerate_questions(info, cover_letter))
+
+    async def agenerate_follow_up(self, session: InterviewSession, index: int) -> list:
+        return await self._route("follow_up", lambda c: c.agenerate_follow_up(session, index))
+
+    async def agenerate_feedback(self, session: InterviewSession, index: int) -> str:
+        return await self._route("feedback", lambda c: c.agenerate_feedback(session, index))
+
+    async def agenerate_final_report(self, session: InterviewSession) -> str:
+        return await self._route("final_report", lambda c: c.agenerate_final_report(session))
+
+    async def astream_follow_up(self, session: InterviewSession, index: int) -> AsyncIterator[str]:
+        # 스트리밍은 hedge 하지 않고, 한 줄도 받지 못한 채 실패하면 다음 provider 로 넘어갑니다.
+        providers, forced = self._candidates()
+        for provider in providers:
+            trial = self._acquire(provider, forced)
+            if trial is None:
+                continue
+            start = time.perf_counter()
+            produced = False
+            try:
+                async for question in provider.client.astream_follow_up(session, index):
+                    produced = True
+                    yield question
+            except (GeneratorExit, asyncio.CancelledError):
+                # 소비자가 도중에 멈춤: 받은 줄이 있으면 성공, 없으면 시험 자리만 돌려줍니다.
+                if produced:
+                    self._record(provider, "follow_up", time.perf_counter() - start, True)
+                elif trial:
+                    provider.breaker.release()
+                raise
+            except Exception as e:
+                logging.warning(f"LLM provider {provider.name} follow_up stream failed: {e}")
+            self._record(provider, "follow_up", time.perf_counter() - start, produced)
+            if produced:
+                return
@@ -0,0 +1,25 @@
+from typing import AsyncIterator
+
+
+def chunk_text(chunk) -> str:
+    """AIMessageChunk.content (문자열 또는 content block 목록) → 문자열"""
+    content = chunk.content
+    if isinstance(content, str):
+        return content
+    return "".join(block.get("text", "") for block in content if isinstance(block, dict))
+
+
+async def iter_lines(chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    """
+    토큰 단위 텍스트 스트림을 줄 단위로 묶어 돌려줍니다.
+    기존 응답 파싱(split("\n") 후 strip, 빈 줄 제외)과 같은 결과를 줄이 완성되는 즉시 냅니다.
+    """
+    buffer = ""
+    async for chunk in chunks:
+        buffer += chunk
+        while "\n" in buffer:
+            line, buffer = buffer.split("\n", 1)
+            if line.strip():
+                yield line.strip()
+    if buffer.strip():
+        yield buffer.strip()
@@ -0,0 +1,134 @@
+import os
+import logging
+import threading
+from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+# NOTE: tiktoken은 langchain-openai 의존성으로 함께 설치됩니다.
+#       BPE 파일을 내려받지 못하는 환경(오프라인 등)에서는 아래 fallback 추정치를 사용합니다.
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover
+    tiktoken = None
+
+DEFAULT_ENCODING = "cl100k_base"
+# 메시지 1개당 role/구분자 오버헤드 (OpenAI chat 포맷 기준)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+# 모델별 컨텍스트 창 (입력 + 출력). LLM_CONTEXT_BUDGET 으로 입력 예산을 직접 지정할 수 있습니다.
+CONTEXT_WINDOWS = {
+    "gpt-4": 8192,
+    "gpt-3.5-turbo": 16385,
+    "anthropic.claude-3-sonnet-20240229-v1:0": 200000,
+}
+DEFAULT_CONTEXT_WINDOW = 8192
+OUTPUT_RESERVE_TOKENS = int(os.getenv("LLM_OUTPUT_RESERVE_TOKENS", "1024"))
+
+
+@lru_cache(maxsize=None)
+def get_encoding(model: str):
+    """모델별 tokenizer (프로세스당 한 번만 로드)"""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        pass
+    except Exception as e:
+        logging.warning(f"tokenizer load failed for {model}, using estimate: {e}")
+        return None
+    try:
+        return tiktoken.get_encoding(DEFAULT_ENCODING)
+    except Exception as e:
+        logging.warning(f"tokenizer load failed ({DEFAULT_ENCODING}), using estimate: {e}")
+        return None
+
+
+def warm_encodings(models=tuple(CONTEXT_WINDOWS)) -> None:
+    """
+    tokenizer 를 미리 로드합니다. 첫 tiktoken 호출은 BPE 파일을 동기로 내려받으므로
+    요청 처리 중(event loop 위)에 일어나지 않도록 서버 시작 시 thread 에서 호출합니다.
+    실패한 모델은 get_encoding 이 None 을 캐시해 추정치로 동작합니다.
+    """
+    for model in models:
+        get_encoding(model)
+
+
+def _estimate(text: str) -> int:
+    # 한글 등 non-ASCII 문자는 대략 1자 ≈ 1토큰, ASCII 는 4자 ≈ 1토큰
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    return non_ascii + (len(text) - non_ascii + 3) // 4
+
+
+def count_tokens(text: str, model: str) -> int:
+    if not text:
+        return 0
+    encoding = get_encoding(model)
+    if encoding is None:
+        return _estimate(text)
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def count_message_tokens(messages: list, model: str) -> int:
+    """langchain 메시지 또는 문자열 목록의 토큰 수"""
+    total = 0
+    for m in messages:
+        content = m if isinstance(m, str) else m.content
+        total += count_tokens(content, model) + MESSAGE_OVERHEAD_TOKENS
+    return total
+
+
+def context_budget(model: str) -> int:
+    """프롬프트(입력)에 쓸 수 있는 최대 토큰 수"""
+    configured = os.getenv("LLM_CONTEXT_BUDGET")
+    if configured:
+        return int(configured)
+    return CONTEXT_WINDOWS.get(model, DEFAULT_CONTEXT_WINDOW) - OUTPUT_RESERVE_TOKENS
+
+
+def history_budget(model: str, fixed_messages: list) -> int:
+    """시스템 프롬프트/지시문을 뺀, 대화 기록에 쓸 수 있는 토큰 수"""
+    return context_budget(model) - count_message_tokens(fixed_messages, model)
+
+
+# ─────────────────── 사용량 기록 ────────────────────
+class TokenUsage:
+    """provider / model / operation 별 누적 입력·출력 토큰"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.totals: Dict[tuple, Dict[str, int]] = defaultdict(lambda: {"calls": 0, "input": 0, "output": 0})
+
+    def record(self, provider: str, model: str, operation: str, input_tokens: int, output_tokens: int):
+        with self._lock:
+            entry = self.totals[(provider, model, operation)]
+            entry["calls"] += 1
+            entry["input"] += input_tokens
+            entry["output"] += output_tokens
+        logging.info(f"🧮 {provider} 토큰 사용량 ({operation}) - 입력: {input_tokens}, 출력: {output_tokens}")
+
+    def snapshot(self) -> List[dict]:
+        with self._lock:
+            return [
+                {"provider": p, "model": m, "operation": op, **dict(v)}
+                for (p, m, op), v in self.totals.items()
+            ]
+
+
+token_usage = TokenUsage()
+
+
+def record_usage(provider: str, model: str, operation: str, prompt, output: Optional[str],
+                 usage_metadata: Optional[dict] = None):
+    """
+    provider 응답에 usage 정보가 있으면 그 값을, 없으면 tokenizer로 센 값을 기록합니다.
+    prompt 는 메시지 목록 또는 완성된 프롬프트 문자열입니다.
+    """
+    if usage_metadata and usage_metadata.get("input_tokens") is not None:
+        input_tokens = usage_metadata["input_tokens"]
+        output_tokens = usage_metadata.get("output_tokens", 0)
+    else:
+        input_tokens = count_tokens(prompt, model) if isinstance(prompt, str) else count_message_tokens(prompt, model)
+        output_tokens = count_tokens(output or "", model)
+    token_usage.record(provider, model, operation, input_tokens, output_tokens)
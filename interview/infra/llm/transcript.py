@@ -0,0 +1,164 @@
+import logging
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+from langchain.schema import HumanMessage
+from interview.domain.interview import InterviewSession
+from interview.infra.llm.tokens import count_tokens, history_budget, MESSAGE_OVERHEAD_TOKENS
+
+MAIN_TEMPLATE = "질문: {question}\n답변: {answer}"
+FOLLOW_UP_TEMPLATE = "꼬리 질문: {question}\n답변: {answer}"
+
+
+class _Segment:
+    """질문/답변 한 쌍의 렌더링 결과 (문자열과 HumanMessage를 memoize)"""
+
+    __slots__ = ("question", "answer", "text", "_message", "_tokens")
+
+    def __init__(self, template: str, question: str, answer: Optional[str]):
+        self.question = question
+        self.answer = answer
+        self.text = template.format(question=question, answer=answer or "없음")
+        self._message = None
+        self._tokens = {}
+
+    def same(self, question: str, answer: Optional[str]) -> bool:
+        return self.question == question and self.answer == answer
+
+    @property
+    def message(self) -> HumanMessage:
+        if self._message is None:
+            self._message = HumanMessage(content=self.text)
+        return self._message
+
+    def tokens(self, model: str) -> int:
+        if model not in self._tokens:
+            self._tokens[model] = count_tokens(self.text, model) + MESSAGE_OVERHEAD_TOKENS
+        return self._tokens[model]
+
+
+class Transcript:
+    """
+    세션 하나의 면접 대화 기록.
+    sync() 는 바뀐 질문/답변만 다시 렌더링하고 나머지 세그먼트는 그대로 재사용합니다.
+    세그먼트 순서(질문 → 꼬리 질문들 → 다음 질문 …)가 고정되어 있어
+    앞부분이 바뀌지 않는 한 provider 쪽 prompt caching 에 같은 prefix 를 넘길 수 있습니다.
+    """
+
+    def __init__(self):
+        self._turns: List[List[_Segment]] = []
+        self._messages: Optional[List[HumanMessage]] = None
+        self._texts: Optional[List[str]] = None
+        self._lock = threading.Lock()
+
+    def sync(self, session: InterviewSession) -> "Transcript":
+        with self._lock:
+            changed = len(self._turns) != len(session.qa_flow)
+            del self._turns[len(session.qa_flow):]
+            for i, qa in enumerate(session.qa_flow):
+                if i == len(self._turns):
+                    self._turns.append([])
+                turn = self._turns[i]
+                items = [(MAIN_TEMPLATE, qa.question, qa.answer)]
+                items += [(FOLLOW_UP_TEMPLATE, fqa.question, fqa.answer) for fqa in qa.follow_ups or []]
+                if len(turn) > len(items):
+                    del turn[len(items):]
+                    changed = True
+                for j, (template, question, answer) in enumerate(items):
+                    if j < len(turn) and turn[j].same(question, answer):
+                        continue
+                    segment = _Segment(template, question, answer)
+                    if j < len(turn):
+                        turn[j] = segment
+                    else:
+                        turn.append(segment)
+                    changed = True
+            if changed:
+                self._messages = None
+                self._texts = None
+        return self
+
+    def messages(self) -> List[HumanMessage]:
+        """전체 대화 (langchain 메시지)"""
+        if self._messages is None:
+            self._messages = [seg.message for turn in self._turns for seg in turn]
+        return list(self._messages)
+
+    def texts(self) -> List[str]:
+        """전체 대화 (문자열)"""
+        if self._texts is None:
+            self._texts = [seg.text for turn in self._turns for seg in turn]
+        return list(self._texts)
+
+    def turn_messages(self, index: int) -> List[HumanMessage]:
+        """질문 하나(메인 + 꼬리 질문)의 대화 (langchain 메시지)"""
+        return [seg.message for seg in self._turns[index]]
+
+    def turn_texts(self, index: int) -> List[str]:
+        return [seg.text for seg in self._turns[index]]
+
+    def fit_messages(self, model: str, budget: int, keep_turn: Optional[int] = None) -> List[HumanMessage]:
+        """
+        budget(토큰) 안에 들어가도록 오래된 질문부터 생략한 대화.
+        생략한 질문들은 질문 문장만 모은 요약 메시지 하나로 대신합니다. keep_turn 은 생략하지 않습니다.
+        세그먼트별 토큰 수는 memoize 되므로 새로 추가된 내용만 tokenize 합니다.
+        """
+        turn_tokens = [sum(seg.tokens(model) for seg in turn) for turn in self._turns]
+        total = sum(turn_tokens)
+        if total <= budget:
+            return self.messages()
+
+        dropped = []
+        summary_tokens = MESSAGE_OVERHEAD_TOKENS + count_tokens("(이전 면접 요약) 앞서 다룬 질문: ", model)
+        total += summary_tokens
+        for i, turn in enumerate(self._turns):
+            if total <= budget:
+                break
+            if i == keep_turn:
+                continue
+            dropped.append(i)
+            total -= turn_tokens[i]
+            total += count_tokens(turn[0].question, model) + 1
+        if total > budget:
+            logging.warning(f"Transcript still exceeds context budget ({total} > {budget} tokens)")
+
+        summary = HumanMessage(
+            content="(이전 면접 요약) 앞서 다룬 질문: " + " / ".join(self._turns[i][0].question for i in dropped)
+        )
+        dropped_set = set(dropped)
+        kept = [seg.message for i, turn in enumerate(self._turns) if i not in dropped_set for seg in turn]
+        return [summary] + kept
+
+
+class TranscriptStore:
+    """session_id → Transcript (LRU). 모든 LLM provider가 같은 store를 공유합니다."""
+
+    def __init__(self, max_sessions: int = 1024):
+        self.max_sessions = max_sessions
+        self._items: "OrderedDict[str, Transcript]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session: InterviewSession) -> Transcript:
+        with self._lock:
+            transcript = self._items.get(session.session_id)
+            if transcript is None:
+                transcript = Transcript()
+                self._items[session.session_id] = transcript
+                while len(self._items) > self.max_sessions:
+                    self._items.popitem(last=False)
+            else:
+                self._items.move_to_end(session.session_id)
+        return transcript.sync(session)
+
+
+_store = TranscriptStore()
+
+
+def transcript_for(session: InterviewSession) -> Transcript:
+    return _store.get(session)
+
+
+def budgeted_history(session: InterviewSession, model: str, fixed_messages: list,
+                     keep_turn: Optional[int] = None) -> List[HumanMessage]:
+    """fixed_messages(시스템 프롬프트, 지시문)와 합쳐 모델 컨텍스트 예산을 넘지 않는 대화 기록"""
+    return transcript_for(session).fit_messages(model, history_budget(model, fixed_messages), keep_turn)
@@ -0,0 +1,42 @@
+from typing import Callable, List
+
+from interview.infra.llm.tokens import TokenUsage
+from interview.infra.metrics.registry import render_samples
+
+
+def token_usage_collector(usage: TokenUsage) -> Callable[[], List[str]]:
+    def collect() -> List[str]:
+        samples = []
+        for entry in usage.snapshot():
+            labels = {"provider": entry["provider"], "model": entry["model"], "operation": entry["operation"]}
+            samples.append(({**labels, "direction": "input"}, entry["input"]))
+            samples.append(({**labels, "direction": "output"}, entry["output"]))
+        return render_samples("llm_tokens_total", "LLM tokens by direction", "counter", samples)
+    return collect
+
+
+def single_flight_collector(flights) -> Callable[[], List[str]]:
+    def collect() -> List[str]:
+        stats = flights.stats()
+        return (
+            render_samples("singleflight_calls_total", "Calls routed through single-flight", "counter",
+                           [({"operation": op}, v["calls"]) for op, v in stats.items()])
+            + render_samples("singleflight_coalesced_total", "Calls that joined an in-flight duplicate", "counter",
+                             [({"operation": op}, v["coalesced"]) for op, v in stats.items()])
+            + render_samples("singleflight_in_flight", "Distinct in-flight single-flight keys", "gauge",
+                             [({}, flights.in_flight())])
+        )
+    return collect
+
+
+def cache_collector(name: str, cache) -> Callable[[], List[str]]:
+    """stats() 에 hits / misses (및 disk_hits, bypassed) 가 있는 캐시 (LLMResponseCache, TTSAudioCache)"""
+    def collect() -> List[str]:
+        stats = cache.stats()
+        results = [r for r in ("hits", "disk_hits", "misses", "bypassed") if r in stats]
+        return (
+            render_samples(f"{name}_requests_total", f"{name} lookups by result", "counter",
+                           [({"result": r}, stats[r]) for r in results])
+            + render_samples(f"{name}_entries", f"{name} entries held in memory", "gauge", [({}, stats["entries"])])
+        )
+    return collect
@@ -0,0 +1,278 @@
+import time
+import asyncio
+import functools
+from contextlib import contextmanager
+from typing import AsyncIterator
+
+from interview.domain.interview import InterviewSession
+from interview.domain.llm.llm_client import LLMClient
+from interview.domain.tts.tts_client import DEFAULT_VOICE_ID, TTSClient
+from interview.domain.repository.interview_repo import AsyncInterviewRepository, InterviewRepository
+from interview.infra.metrics.registry import registry
+
+# ─────────────────── metric 정의 ────────────────────
+SERVICE_LATENCY = registry.histogram(
+    "interview_service_duration_seconds", "InterviewService method latency", ("method",))
+SERVICE_ERRORS = registry.counter(
+    "interview_service_errors_total", "InterviewService method exceptions", ("method",))
+SERVICE_IN_FLIGHT = registry.gauge(
+    "interview_service_in_flight", "InterviewService calls in progress", ("method",))
+
+LLM_LATENCY = registry.histogram(
+    "llm_request_duration_seconds", "LLM call latency", ("provider", "operation"))
+LLM_ERRORS = registry.counter(
+    "llm_errors_total", "LLM calls that raised or returned an empty result", ("provider", "operation"))
+LLM_IN_FLIGHT = registry.gauge(
+    "llm_in_flight", "LLM calls in progress", ("provider",))
+
+TTS_LATENCY = registry.histogram(
+    "tts_request_duration_seconds", "TTS synthesize_to_s3 latency", ("provider",))
+TTS_ERRORS = registry.counter(
+    "tts_errors_total", "TTS synthesize_to_s3 exceptions", ("provider",))
+TTS_IN_FLIGHT = registry.gauge(
+    "tts_in_flight", "TTS calls in progress", ("provider",))
+
+REPO_LATENCY = registry.histogram(
+    "repository_operation_duration_seconds", "Repository operation latency", ("backend", "operation"),
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5))
+REPO_ERRORS = registry.counter(
+    "repository_errors_total", "Repository operation exceptions", ("backend", "operation"))
+
+
+@contextmanager
+def _measure(latency, errors, in_flight, labels: tuple, in_flight_labels: tuple = None):
+    in_flight_labels = labels if in_flight_labels is None else in_flight_labels
+    if in_flight is not None:
+        in_flight.inc(*in_flight_labels)
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        errors.inc(*labels)
+        raise
+    finally:
+        latency.observe(*labels, value=time.perf_counter() - start)
+        if in_flight is not None:
+            in_flight.dec(*in_flight_labels)
+
+
+def _empty(result) -> bool:
+    return result is None or result == "" or result == []
+
+
+class InstrumentedLLMClient(LLMClient):
+    """provider 코드를 건드리지 않고 호출 지연/오류/진행 중 개수를 기록하는 래퍼"""
+
+    def __init__(self, llm: LLMClient, provider: str):
+        self.llm = llm
+        self.provider = provider
+
+    def __getattr__(self, name):
+        # use_llm, model_name 등 provider 속성은 그대로 노출
+        return getattr(self.llm, name)
+
+    def _call(self, operation: str, fn, *args):
+        with _measure(LLM_LATENCY, LLM_ERRORS, LLM_IN_FLIGHT, (self.provider, operation), (self.provider,)):
+            result = fn(*args)
+        if _empty(result):
+            LLM_ERRORS.inc(self.provider, operation)
+        return result
+
+    async def _acall(self, operation: str, fn, *args):
+        with _measure(LLM_LATENCY, LLM_ERRORS, LLM_IN_FLIGHT, (self.provider, operation), (self.provider,)):
+            result = await fn(*args)
+        if _empty(result):
+            LLM_ERRORS.inc(self.provider, operation)
+        return result
+
+    def generate_questions(self, info: dict, cover_letter) -> str:
+        return self._call("questions", self.llm.generate_questions, info, cover_letter)
+
+    def generate_follow_up(self, session: InterviewSession, index: int) -> list:
+        return self._call("follow_up", self.llm.generate_follow_up, session, index)
+
+    def generate_feedback(self, session: InterviewSession, index: int) -> str:
+        return self._call("feedback", self.llm.generate_feedback, session, index)
+
+    def generate_final_report(self, session: InterviewSession) -> str:
+        return self._call("final_report", self.llm.generate_final_report, session)
+
+    async def agenerate_questions(self, info: dict, cover_letter) -> str:
+        return await self._acall("questions", self.llm.agenerate_questions, info, cover_letter)
+
+    async def agenerate_follow_up(self, session: InterviewSession, index: int) -> list:
+        return await self._acall("follow_up", self.llm.agenerate_follow_up, session, index)
+
+    async def agenerate_feedback(self, session: InterviewSession, index: int) -> str:
+        return await self._acall("feedback", self.llm.agenerate_feedback, session, index)
+
+    async def agenerate_final_report(self, session: InterviewSession) -> str:
+        return await self._acall("final_report", self.llm.agenerate_final_report, session)
+
+    async def astream_follow_up(self, session: InterviewSession, index: int) -> AsyncIterator[str]:
+        produced = False
+        with _measure(LLM_LATENCY, LLM_ERRORS, LLM_IN_FLIGHT, (self.provider, "follow_up_stream"), (self.provider,)):
+            async for question in self.llm.astream_follow_up(session, index):
+                produced = True
+                yield question
+        if not produced:
+            LLM_ERRORS.inc(self.provider, "follow_up_stream")
+
+
+class InstrumentedTTSClient(TTSClient):
+    def __init__(self, tts: TTSClient, provider: str):
+        self.tts = tts
+        self.provider = provider
+
+    def __getattr__(self, name):
+        return getattr(self.tts, name)
+
+    def flight_key(self, text: str, filename: str, voice_id: str = DEFAULT_VOICE_ID):
+        return self.tts.flight_key(text, filename, voice_id=voice_id)
+
+    def synthesize_to_s3(self, text: str, voice_id: str = DEFAULT_VOICE_ID, filename: str = None) -> str:
+        # NOTE: asyncio.to_thread 워커에서 호출됩니다 (registry 는 thread-safe)
+        with _measure(TTS_LATENCY, TTS_ERRORS, TTS_IN_FLIGHT, (self.provider,)):
+            return self.tts.synthesize_to_s3(text, voice_id=voice_id, filename=filename)
+
+
+class InstrumentedRepository(InterviewRepository):
+    """모든 public 메서드의 지연/오류를 backend, operation(메서드 이름) 별로 기록"""
+
+    def __init__(self, repo: InterviewRepository, backend: str):
+        self.repo = repo
+        self.backend = backend
+
+    def __getattr__(self, name):
+        attr = getattr(self.repo, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+        labels = (self.backend, name)
+        if asyncio.iscoroutinefunction(attr):
+            @functools.wraps(attr)
+            async def async_wrapper(*args, **kwargs):
+                with _measure(REPO_LATENCY, REPO_ERRORS, None, labels):
+                    return await attr(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(attr)
+        def wrapper(*args, **kwargs):
+            with _measure(REPO_LATENCY, REPO_ERRORS, None, labels):
+                return attr(*args, **kwargs)
+        return wrapper
+
+    # 추상 메서드는 명시적으로 정의해야 하므로 __getattr__ 경로로 위임
+    def save_session(self, session: InterviewSession) -> InterviewSession:
+        return self.__getattr__("save_session")(session)
+
+    def save_sessions(self, sessions):
+        return self.__getattr__("save_sessions")(sessions)
+
+    def update_session(self, session: InterviewSession) -> InterviewSession:
+        return self.__getattr__("update_session")(session)
+
+    def get_all_sessions(self) -> list[InterviewSession]:
+        return self.__getattr__("get_all_sessions")()
+
+    def iter_sessions(self, *args, **kwargs):
+        # generator 는 소비가 끝날 때까지를 한 번의 호출로 측정합니다.
+        with _measure(REPO_LATENCY, REPO_ERRORS, None, (self.backend, "iter_sessions")):
+            yield from self.repo.iter_sessions(*args, **kwargs)
+
+    def get_session_by_interview_and_member_interview_id(self, interview_id: str, member_interview_id: str) -> InterviewSession:
+        return self.__getattr__("get_session_by_interview_and_member_interview_id")(interview_id, member_interview_id)
+
+    def get_session_by_id(self, session_id: str) -> InterviewSession:
+        return self.__getattr__("get_session_by_id")(session_id)
+
+    def get_session_fields(self, session_id: str, fields):
+        return self.__getattr__("get_session_fields")(session_id, fields)
+
+    def get_qa(self, session_id: str, index: int):
+        return self.__getattr__("get_qa")(session_id, index)
+
+    def delete_session(self, session_id: str) -> bool:
+        return self.__getattr__("delete_session")(session_id)
+
+    def delete_all_sessions(self) -> int:
+        return self.__getattr__("delete_all_sessions")()
+
+
+class InstrumentedAsyncRepository(AsyncInterviewRepository):
+    """InstrumentedRepository 의 async 저장소 버전"""
+
+    def __init__(self, repo: AsyncInterviewRepository, backend: str):
+        self.repo = repo
+        self.backend = backend
+
+    def __getattr__(self, name):
+        return getattr(self.repo, name)
+
+    async def _call(self, operation: str, *args):
+        with _measure(REPO_LATENCY, REPO_ERRORS, None, (self.backend, operation)):
+            return await getattr(self.repo, operation)(*args)
+
+    async def save_session(self, session: InterviewSession) -> InterviewSession:
+        return await self._call("save_session", session)
+
+    async def save_sessions(self, sessions):
+        return await self._call("save_sessions", sessions)
+
+    async def update_session(self, session: InterviewSession) -> InterviewSession:
+        return await self._call("update_session", session)
+
+    async def get_all_sessions(self) -> list[InterviewSession]:
+        return await self._call("get_all_sessions")
+
+    async def iter_sessions(self):
+        with _measure(REPO_LATENCY, REPO_ERRORS, None, (self.backend, "iter_sessions")):
+            async for session in self.repo.iter_sessions():
+                yield session
+
+    async def get_session_by_interview_and_member_interview_id(self, interview_id: str, member_interview_id: str) -> InterviewSession:
+        return await self._call("get_session_by_interview_and_member_interview_id", interview_id, member_interview_id)
+
+    async def get_session_by_id(self, session_id: str) -> InterviewSession:
+        return await self._call("get_session_by_id", session_id)
+
+    async def get_session_fields(self, session_id: str, fields):
+        return await self._call("get_session_fields", session_id, fields)
+
+    async def get_qa(self, session_id: str, index: int):
+        return await self._call("get_qa", session_id, index)
+
+    async def delete_session(self, session_id: str) -> bool:
+        return await self._call("delete_session", session_id)
+
+    async def delete_all_sessions(self) -> int:
+        return await self._call("delete_all_sessions")
+
+    async def close(self):
+        await self.repo.close()
+
+
+class InstrumentedService:
+    """
+    InterviewService 프록시. public 메서드 호출마다 지연/오류/진행 중 개수를 기록합니다.
+    (스트리밍 메서드는 iterator 를 돌려줄 때까지의 시간만 측정합니다)
+    """
+
+    def __init__(self, service):
+        self._service = service
+
+    def __getattr__(self, name):
+        attr = getattr(self._service, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+        if asyncio.iscoroutinefunction(attr):
+            @functools.wraps(attr)
+            async def async_wrapper(*args, **kwargs):
+                with _measure(SERVICE_LATENCY, SERVICE_ERRORS, SERVICE_IN_FLIGHT, (name,)):
+                    return await attr(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(attr)
+        def wrapper(*args, **kwargs):
+            with _measure(SERVICE_LATENCY, SERVICE_ERRORS, SERVICE_IN_FLIGHT, (name,)):
+                return attr(*args, **kwargs)
+        return wrapper
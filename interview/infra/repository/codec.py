@@ -0,0 +1,133 @@
+# codec.py
+# 세션의 긴 텍스트 필드(질문/답변/피드백/최종 리포트)를 저장소에 압축해서 씁니다.
+# 필드 단위로만 압축하므로 부분 갱신(SET qa_flow[0].answer), 조건식, projection 조회는 그대로 동작합니다.
+# 읽을 때는 SESSION_CODEC 설정과 관계없이 압축된 값을 풀어 줍니다 (설정을 끄거나 바꿔도 기존 항목을 읽을 수 있음).
+
+import os
+import zlib
+from typing import Any, Iterable, List, Optional, Tuple, Union
+
+# none | zlib | zstd (zstd 는 pip install ".[zstd]" 필요)
+SESSION_CODEC = os.getenv("SESSION_CODEC", "none").lower()
+# 이보다 짧은(UTF-8 bytes) 텍스트는 압축하지 않습니다
+SESSION_CODEC_MIN_BYTES = int(os.getenv("SESSION_CODEC_MIN_BYTES", "512"))
+SESSION_CODEC_LEVEL = int(os.getenv("SESSION_CODEC_LEVEL", "3"))
+
+COMPRESSED_FIELDS = frozenset({"question", "answer", "feedback", "final_report"})
+
+# 압축된 값: 0xC5 + codec id + 압축한 UTF-8
+_MAGIC = 0xC5
+_ZLIB = ord("z")
+_ZSTD = ord("s")
+
+_CODEC_IDS = {"none": None, "zlib": _ZLIB, "zstd": _ZSTD}
+
+_zstandard = None
+
+
+def _zstd():
+    """zstandard 는 zstd 로 쓰거나 읽을 때 처음 import 합니다 (설치하지 않아도 모듈 import 는 됩니다)"""
+    global _zstandard
+    if _zstandard is None:
+        try:
+            import zstandard
+        except ImportError as e:
+            raise RuntimeError('zstd session codec requires zstandard (pip install ".[zstd]")') from e
+        _zstandard = zstandard
+    return _zstandard
+
+
+def codec_id(codec: str) -> Optional[int]:
+    if codec not in _CODEC_IDS:
+        raise ValueError(f"Unsupported SESSION_CODEC: {codec}")
+    if codec == "zstd":
+        _zstd()
+    return _CODEC_IDS[codec]
+
+
+def check_session_codec() -> None:
+    """저장소를 만들 때 호출: SESSION_CODEC 설정이 잘못됐거나 zstandard 가 없으면 여기서 실패합니다"""
+    codec_id(SESSION_CODEC)
+
+
+# 잘못된 값은 check_session_codec 에서 알리고, 여기서는 import 가 실패하지 않도록 압축하지 않는 것으로 둡니다
+_CODEC_ID = _CODEC_IDS.get(SESSION_CODEC)
+
+
+def compress_text(text: str, codec: Optional[int] = _CODEC_ID, level: int = SESSION_CODEC_LEVEL,
+                  min_bytes: int = SESSION_CODEC_MIN_BYTES) -> Union[str, bytes]:
+    """압축해서 더 작아질 때만 bytes, 아니면 원래 문자열"""
+    if codec is None:
+        return text
+    raw = text.encode("utf-8")
+    if len(raw) < min_bytes:
+        return text
+    if codec == _ZSTD:
+        # ZstdCompressor 는 thread-safe 하지 않으므로 호출마다 만듭니다.
+        packed = _zstd().ZstdCompressor(level=level).compress(raw)
+    else:
+        packed = zlib.compress(raw, level)
+    return bytes((_MAGIC, codec)) + packed if len(packed) + 2 < len(raw) else text
+
+
+def _raw_bytes(value: Any) -> Optional[bytes]:
+    # pymongo 는 bytes, boto3 는 Binary(.value) 로 돌려줍니다.
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value)
+    inner = getattr(value, "value", None)
+    return inner if isinstance(inner, (bytes, bytearray)) else None
+
+
+def decompress_value(value: Any) -> Any:
+    raw = _raw_bytes(value)
+    if raw is None or len(raw) < 2 or raw[0] != _MAGIC:
+        return value
+    if raw[1] == _ZSTD:
+        # 프레임에 원본 크기가 들어 있으므로 max_output_size 는 필요 없습니다.
+        return _zstd().ZstdDecompressor().decompress(raw[2:]).decode("utf-8")
+    if raw[1] == _ZLIB:
+        return zlib.decompress(raw[2:]).decode("utf-8")
+    return value
+
+
+def encode_value(value: Any, field: Optional[str] = None, codec: Optional[int] = _CODEC_ID) -> Any:
+    """dict/list 는 새로 만들어 돌려줍니다 (세션의 snapshot 을 건드리지 않도록)"""
+    if codec is None:
+        return value
+    if isinstance(value, dict):
+        return {k: encode_value(v, k, codec) for k, v in value.items()}
+    if isinstance(value, list):
+        return [encode_value(v, field, codec) for v in value]
+    if isinstance(value, str) and field in COMPRESSED_FIELDS:
+        return compress_text(value, codec)
+    return value
+
+
+def encode_document(doc: dict, codec: Optional[int] = _CODEC_ID) -> dict:
+    return encode_value(doc, codec=codec)
+
+
+def encode_changes(changes: Iterable[Tuple[tuple, Any]], codec: Optional[int] = _CODEC_ID) -> List[Tuple[tuple, Any]]:
+    """changes() 의 값도 같은 규칙으로 압축 (경로의 마지막 필드 이름 기준)"""
+    if codec is None:
+        return list(changes)
+    encoded = []
+    for path, value in changes:
+        field = path[-1] if isinstance(path[-1], str) else None
+        encoded.append((path, encode_value(value, field, codec)))
+    return encoded
+
+
+def decode_document(doc: Any) -> Any:
+    """저장소에서 읽은 문서의 압축된 값을 제자리에서 풉니다 (드라이버가 만든 새 객체이므로)"""
+    if isinstance(doc, dict):
+        for k, v in doc.items():
+            if isinstance(v, (dict, list)):
+                decode_document(v)
+            elif k in COMPRESSED_FIELDS:
+                doc[k] = decompress_value(v)
+    elif isinstance(doc, list):
+        for v in doc:
+            if isinstance(v, (dict, list)):
+                decode_document(v)
+    return doc
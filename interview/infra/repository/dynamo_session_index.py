@@ -0,0 +1,134 @@
+# dynamo_session_index.py
+# 기존 DynamoDB 테이블에 session_id GSI 를 추가하고 backfill 상태를 확인하는 도구
+#
+#   python -m interview.infra.repository.dynamo_session_index create --wait   # GSI 생성 + backfill 완료까지 대기
+#   python -m interview.infra.repository.dynamo_session_index status          # 인덱스 상태 / backfill 여부
+#   python -m interview.infra.repository.dynamo_session_index verify          # 색인되지 않는 항목 점검
+#
+# GSI 를 만들면 DynamoDB 가 기존 항목을 자동으로 backfill 합니다. 그동안 테이블 읽기/쓰기는 계속 가능하고,
+# 인덱스가 ACTIVE 가 되기 전까지 repository 는 query 실패 시 scan 으로 대신 찾습니다.
+# session_id 속성이 없는 항목은 (sparse index 라) 색인되지 않으므로 verify 로 확인합니다.
+
+import os
+import time
+import argparse
+import logging
+from typing import Optional
+
+import boto3
+from dotenv import load_dotenv
+
+from interview.infra.repository.interview_repo_dynamo import SESSION_INDEX_NAME
+
+
+def _find_index(description: dict, index_name: str) -> Optional[dict]:
+    for index in description.get("GlobalSecondaryIndexes", []):
+        if index["IndexName"] == index_name:
+            return index
+    return None
+
+
+def describe(client, table_name: str) -> dict:
+    return client.describe_table(TableName=table_name)["Table"]
+
+
+def create_session_index(client, table_name: str, index_name: str = SESSION_INDEX_NAME) -> bool:
+    """인덱스를 만들었으면 True, 이미 있으면 False"""
+    table = describe(client, table_name)
+    if _find_index(table, index_name):
+        logging.info(f"{table_name}: index {index_name} already exists")
+        return False
+
+    index = {
+        "IndexName": index_name,
+        "KeySchema": [{"AttributeName": "session_id", "KeyType": "HASH"}],
+        # repository 는 primary key 만 얻고 본문은 GetItem(ConsistentRead) 로 읽습니다.
+        "Projection": {"ProjectionType": "KEYS_ONLY"},
+    }
+    if table.get("BillingModeSummary", {}).get("BillingMode") != "PAY_PER_REQUEST":
+        throughput = table["ProvisionedThroughput"]
+        index["ProvisionedThroughput"] = {
+            "ReadCapacityUnits": throughput["ReadCapacityUnits"],
+            "WriteCapacityUnits": throughput["WriteCapacityUnits"],
+        }
+
+    client.update_table(
+        TableName=table_name,
+        AttributeDefinitions=[{"AttributeName": "session_id", "AttributeType": "S"}],
+        GlobalSecondaryIndexUpdates=[{"Create": index}],
+    )
+    logging.info(f"{table_name}: creating index {index_name} (DynamoDB backfills existing items)")
+    return True
+
+
+def index_status(client, table_name: str, index_name: str = SESSION_INDEX_NAME) -> Optional[dict]:
+    index = _find_index(describe(client, table_name), index_name)
+    if index is None:
+        return None
+    return {
+        "status": index.get("IndexStatus"),
+        "backfilling": index.get("Backfilling", False),
+        "item_count": index.get("ItemCount"),
+    }
+
+
+def wait_until_active(client, table_name: str, index_name: str = SESSION_INDEX_NAME,
+                      poll_seconds: float = 15.0, timeout: float = 6 * 3600) -> dict:
+    deadline = time.monotonic() + timeout
+    while True:
+        status = index_status(client, table_name, index_name)
+        if status is None:
+            raise RuntimeError(f"{table_name}: index {index_name} does not exist")
+        if status["status"] == "ACTIVE" and not status["backfilling"]:
+            return status
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"{table_name}: index {index_name} still {status} after {timeout}s")
+        logging.info(f"{table_name}: index {index_name} {status['status']} (backfilling={status['backfilling']})")
+        time.sleep(poll_seconds)
+
+
+def find_unindexed(table, limit: int = 20) -> dict:
+    """session_id 가 없는(색인되지 않는) 항목 수와 예시 key. 전체 테이블을 scan 합니다."""
+    kwargs = {"ProjectionExpression": "interview_id, member_interview_id, session_id"}
+    scanned, missing, examples = 0, 0, []
+    while True:
+        response = table.scan(**kwargs)
+        for item in response.get("Items", []):
+            scanned += 1
+            if not item.get("session_id"):
+                missing += 1
+                if len(examples) < limit:
+                    examples.append({"interview_id": item["interview_id"],
+                                     "member_interview_id": item["member_interview_id"]})
+        if "LastEvaluatedKey" not in response:
+            return {"scanned": scanned, "missing_session_id": missing, "examples": examples}
+        kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def main():
+    load_dotenv()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    parser = argparse.ArgumentParser(description="DynamoDB session_id GSI migration")
+    parser.add_argument("command", choices=["create", "status", "verify"])
+    parser.add_argument("--table", default=os.getenv("DYNAMO_TABLE_NAME"))
+    parser.add_argument("--index", default=SESSION_INDEX_NAME)
+    parser.add_argument("--region", default=os.getenv("AWS_REGION", "us-east-1"))
+    parser.add_argument("--wait", action="store_true", help="create 후 backfill 이 끝날 때까지 대기")
+    args = parser.parse_args()
+    if not args.table:
+        parser.error("--table or DYNAMO_TABLE_NAME is required")
+
+    resource = boto3.resource("dynamodb", region_name=args.region)
+    client = resource.meta.client
+    if args.command == "create":
+        create_session_index(client, args.table, args.index)
+        if args.wait:
+            logging.info(f"ready: {wait_until_active(client, args.table, args.index)}")
+    elif args.command == "status":
+        print(index_status(client, args.table, args.index) or f"index {args.index} not found")
+    else:
+        print(find_unindexed(resource.Table(args.table)))
+
+
+if __name__ == "__main__":
+    main()
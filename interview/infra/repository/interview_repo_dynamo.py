@@ -1,11 +1,156 @@
-from interview.domain.repository.interview_repo import InterviewRepository
-from interview.domain.interview import InterviewSession
+from interview.domain.repository.interview_repo import InterviewRepository, SessionConflictError
+from interview.domain.interview import InterviewSession, REMOVED
+from interview.infra.repository.codec import check_session_codec, decode_document, encode_changes, encode_document
 import boto3
 import os
-from boto3.dynamodb.conditions import Key
+import queue
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from typing import Iterator, List, Optional, Tuple, get_origin
+from boto3.dynamodb.conditions import Attr, Key
+from botocore.exceptions import ClientError
+
+# session_id → (interview_id, member_interview_id) 를 찾는 GSI 이름. 비우면 scan 으로 찾습니다.
+# 기존 테이블은 `python -m interview.infra.repository.dynamo_session_index create --wait` 로 추가합니다.
+SESSION_INDEX_NAME = os.getenv("DYNAMO_SESSION_INDEX", "session_id-index")
+# session_id → primary key 캐시 크기 (세션의 primary key 는 바뀌지 않으므로 삭제 외에는 무효화하지 않음)
+KEY_CACHE_SIZE = int(os.getenv("DYNAMO_KEY_CACHE_SIZE", "10000"))
+# 전체 scan(get_all_sessions, delete_all_sessions)을 나눠 돌릴 병렬 segment 수. 1이면 순차 scan.
+SCAN_SEGMENTS = int(os.getenv("DYNAMO_SCAN_SEGMENTS", "1"))
+
+_SEGMENT_DONE = object()
+
+
+class _KeyCache:
+    """thread-safe LRU (sync endpoint 는 threadpool 에서 repo 를 호출합니다)"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str) -> Optional[dict]:
+        with self._lock:
+            key = self._entries.get(session_id)
+            if key is not None:
+                self._entries.move_to_end(session_id)
+            return key
+
+    def put(self, session_id: str, key: dict):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[session_id] = key
+            self._entries.move_to_end(session_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, session_id: str):
+        with self._lock:
+            self._entries.pop(session_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def _primary_key(item: dict) -> dict:
+    return {"interview_id": item["interview_id"], "member_interview_id": item["member_interview_id"]}
+
+
+def _load(item: dict) -> InterviewSession:
+    session = InterviewSession(**decode_document(item))
+    session.mark_clean()
+    return session
+
+
+def _item(session: InterviewSession) -> dict:
+    """저장할 항목 (긴 텍스트는 SESSION_CODEC 으로 압축, version + 1)"""
+    item = encode_document(session.dict())
+    item["version"] = session.version + 1
+    return item
+
+
+# jobs 처럼 key 가 자유로운 map 필드. 필드가 생기기 전에 저장된 항목에는 부모 map 이 없어
+# SET jobs.#key = ... 가 ValidationException 으로 실패하므로, 이 필드의 변경은 map 전체를 SET 합니다.
+MAP_FIELDS = frozenset(
+    name for name, field in InterviewSession.model_fields.items() if get_origin(field.annotation) is dict
+)
+
+
+def _collapse_map_changes(changes, doc: dict) -> list:
+    collapsed, seen = [], set()
+    for path, value in changes:
+        if len(path) > 1 and path[0] in MAP_FIELDS:
+            if path[0] not in seen:
+                seen.add(path[0])
+                collapsed.append(((path[0],), doc[path[0]]))
+        else:
+            collapsed.append((path, value))
+    return collapsed
+
+
+def _update_expression(changes) -> Tuple[str, dict, dict]:
+    """changes() → (UpdateExpression, ExpressionAttributeNames, ExpressionAttributeValues)"""
+    names, values, sets, removes = {}, {}, [], []
+    placeholders = {}
+
+    def name(segment: str) -> str:
+        # "feedback:0" 같은 jobs key 와 예약어 때문에 모든 이름을 placeholder 로 씁니다.
+        # (#n / :v 는 boto3 가 ConditionExpression 을 만들 때 쓰므로 다른 접두어 사용)
+        if segment not in placeholders:
+            placeholders[segment] = f"#f{len(placeholders)}"
+            names[placeholders[segment]] = segment
+        return placeholders[segment]
+
+    for path, value in encode_changes(changes):
+        expression = ""
+        for segment in path:
+            if isinstance(segment, int):
+                expression += f"[{segment}]"
+            else:
+                expression += ("." if expression else "") + name(segment)
+        if value is REMOVED:
+            removes.append(expression)
+        else:
+            placeholder = f":u{len(values)}"
+            values[placeholder] = value
+            sets.append(f"{expression} = {placeholder}")
+
+    clauses = []
+    if sets:
+        clauses.append("SET " + ", ".join(sets))
+    if removes:
+        clauses.append("REMOVE " + ", ".join(removes))
+    return " ".join(clauses), names, values
+
+
+def _expected_version(version: int):
+    """저장된 version 이 읽은 시점 그대로인지 (version 도입 전 항목은 0 으로 취급)"""
+    condition = Attr("version").eq(version)
+    if version == 0:
+        condition = condition | Attr("version").not_exists()
+    return condition
+
+
+def _conditional_check_failed(error: ClientError) -> bool:
+    return error.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException"
+
+
+def _missing_index(error: ClientError) -> bool:
+    # DynamoDB: ValidationException "The table does not have the specified index"
+    # (DynamoDB Local / moto 는 ResourceNotFoundException 을 돌려줍니다)
+    detail = error.response.get("Error", {})
+    return (detail.get("Code") in ("ValidationException", "ResourceNotFoundException")
+            and "index" in detail.get("Message", "").lower())
+
 
 class InterviewRepositoryDynamo(InterviewRepository):
     def __init__(self):
+        check_session_codec()
         self.dynamodb = boto3.resource(
             "dynamodb",
             region_name=os.getenv("AWS_REGION", "us-east-1")
@@ -14,53 +159,218 @@ class InterviewRepositoryDynamo(InterviewRepository):
         if not table_name:
             raise ValueError("DYNAMO_TABLE_NAME environment variable is required")
         self.table = self.dynamodb.Table(table_name)
+        self.session_index = SESSION_INDEX_NAME or None
+        self._keys = _KeyCache(KEY_CACHE_SIZE)
 
-    def save_session(self, session: InterviewSession) -> InterviewSession:
-        self.table.put_item(Item=session.dict())
+    # ─────────────────── session_id → primary key ────────────────────
+    def _key_for(self, session_id: str) -> Optional[dict]:
+        key = self._keys.get(session_id)
+        if key is None:
+            key = self._lookup_key(session_id)
+            if key is not None:
+                self._keys.put(session_id, key)
+        return key
+
+    def _lookup_key(self, session_id: str) -> Optional[dict]:
+        if self.session_index:
+            try:
+                # NOTE: GSI 는 eventually consistent 라 다른 프로세스가 방금 만든 세션은 잠깐 안 보일 수 있습니다.
+                response = self.table.query(
+                    IndexName=self.session_index,
+                    KeyConditionExpression=Key("session_id").eq(session_id),
+                )
+                items = response.get("Items", [])
+                return _primary_key(items[0]) if items else None
+            except ClientError as e:
+                if not _missing_index(e):
+                    raise
+                logging.warning(
+                    f"DynamoDB index {self.session_index} not found, falling back to scan for session_id lookups. "
+                    f"Create it with `python -m interview.infra.repository.dynamo_session_index create --wait`."
+                )
+                self.session_index = None
+
+        matches = self._scan(
+            FilterExpression=Key("session_id").eq(session_id),
+            ProjectionExpression="interview_id, member_interview_id",
+        )
+        with closing(matches):
+            item = next(matches, None)
+        return _primary_key(item) if item else None
+
+    # ─────────────────── scan ────────────────────
+    def _scan_pages(self, stop: threading.Event, segment: int = 0, total_segments: int = 1,
+                    **kwargs) -> Iterator[List[dict]]:
+        """
+        LastEvaluatedKey 를 따라 모든 page 를 읽습니다.
+        Table 리소스는 thread-safe 하지 않으므로 client 를 씁니다 (resource 의 client 라 타입 변환은 그대로 적용됨).
+        """
+        client = self.table.meta.client
+        kwargs["TableName"] = self.table.name
+        if total_segments > 1:
+            kwargs.update(Segment=segment, TotalSegments=total_segments)
+        while not stop.is_set():
+            response = client.scan(**kwargs)
+            yield response.get("Items", [])
+            if "LastEvaluatedKey" not in response:
+                return
+            kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    def _scan(self, segments: Optional[int] = None, **kwargs) -> Iterator[dict]:
+        """
+        테이블 전체 scan. segments > 1 이면 Segment/TotalSegments 로 나눠 worker thread 에서 병렬로 읽고,
+        도착한 page 순서대로 item 을 냅니다 (순서는 보장하지 않음).
+        호출자가 중간에 멈추면(generator close) worker 도 다음 page 전에 멈춥니다.
+        """
+        segments = segments or SCAN_SEGMENTS
+        stop = threading.Event()
+        if segments <= 1:
+            for page in self._scan_pages(stop, **kwargs):
+                yield from page
+            return
+
+        # 소비 속도보다 빨리 읽어 메모리에 쌓지 않도록 segment 당 2 page 까지만 버퍼링
+        pages: queue.Queue = queue.Queue(maxsize=segments * 2)
+
+        def put(obj) -> bool:
+            while not stop.is_set():
+                try:
+                    pages.put(obj, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def worker(segment: int):
+            try:
+                for page in self._scan_pages(stop, segment, segments, **dict(kwargs)):
+                    if not put(page):
+                        return
+                put(_SEGMENT_DONE)
+            except Exception as e:
+                put(e)
+
+        with ThreadPoolExecutor(max_workers=segments, thread_name_prefix="dynamo-scan") as pool:
+            for segment in range(segments):
+                pool.submit(worker, segment)
+            try:
+                finished = 0
+                while finished < segments:
+                    page = pages.get()
+                    if page is _SEGMENT_DONE:
+                        finished += 1
+                    elif isinstance(page, Exception):
+                        raise page
+                    else:
+                        yield from page
+            finally:
+                stop.set()
+
+    # ─────────────────── repository ────────────────────
+    def _put(self, session: InterviewSession, **kwargs) -> InterviewSession:
+        item = _item(session)
+        self.table.put_item(Item=item, **kwargs)
+        self._keys.put(session.session_id, _primary_key(item))
+        session.version = item["version"]
+        session.mark_clean()
         return session
 
+    def save_session(self, session: InterviewSession) -> InterviewSession:
+        return self._put(session)
+
+    def save_sessions(self, sessions: List[InterviewSession]) -> List[InterviewSession]:
+        # 25개씩 BatchWriteItem (UnprocessedItems 재시도는 batch_writer 가 처리). 조건식은 쓸 수 없으므로 새 세션 전용.
+        items = []
+        with self.table.batch_writer(overwrite_by_pkeys=["interview_id", "member_interview_id"]) as batch:
+            for session in sessions:
+                item = _item(session)
+                batch.put_item(Item=item)
+                items.append(item)
+        for session, item in zip(sessions, items):
+            self._keys.put(session.session_id, _primary_key(item))
+            session.version = item["version"]
+            session.mark_clean()
+        return sessions
+
     def update_session(self, session: InterviewSession) -> InterviewSession:
-        return self.save_session(session)
+        """
+        저장소에서 읽은 세션이면 바뀐 필드만 UpdateItem (SET qa_flow[i].answer = ...) 으로 씁니다.
+        읽은 뒤 다른 쓰기(또는 삭제)가 있었으면 SessionConflictError.
+        """
+        changes = session.changes()
+        if changes is not None and not changes:
+            return session
+        try:
+            if changes is None or any(path[0] in ("interview_id", "member_interview_id") for path, _ in changes):
+                return self._put(session, ConditionExpression=_expected_version(session.version))
+
+            doc = session.dict()
+            expression, names, values = _update_expression(
+                _collapse_map_changes(changes, doc) + [(("version",), session.version + 1)]
+            )
+            self.table.update_item(
+                Key=_primary_key(doc),
+                UpdateExpression=expression,
+                ExpressionAttributeNames=names,
+                ExpressionAttributeValues=values,
+                # 삭제된 항목에 일부 필드만 있는 항목이 생기지 않도록 session_id 도 확인
+                ConditionExpression=Attr("session_id").eq(session.session_id) & _expected_version(session.version),
+            )
+        except ClientError as e:
+            if not _conditional_check_failed(e):
+                raise
+            raise SessionConflictError(session.session_id, session.version) from e
+        session.version += 1
+        session.mark_clean()
+        return session
 
     def get_all_sessions(self):
-        response = self.table.scan()
-        return [InterviewSession(**item) for item in response.get("Items", [])]
+        return list(self.iter_sessions())
+
+    def iter_sessions(self, segments: Optional[int] = None) -> Iterator[InterviewSession]:
+        for item in self._scan(segments):
+            yield _load(item)
 
     def get_session_by_interview_and_member_interview_id(self, interview_id: str, member_interview_id: str):
         response = self.table.query(
             KeyConditionExpression=Key("interview_id").eq(interview_id) & Key("member_interview_id").eq(member_interview_id)
         )
         items = response.get("Items", [])
-        return InterviewSession(**items[0]) if items else None
+        if not items:
+            return None
+        self._keys.put(items[0]["session_id"], _primary_key(items[0]))
+        return _load(items[0])
 
     def get_session_by_id(self, session_id: str) -> InterviewSession:
-        response = self.table.scan(
-            FilterExpression=Key("session_id").eq(session_id)
-        )
-        items = response.get("Items", [])
-        return InterviewSession(**items[0]) if items else None
+        key = self._key_for(session_id)
+        if key is None:
+            return None
+        item = self.table.get_item(Key=key, ConsistentRead=True).get("Item")
+        if not item or item.get("session_id") != session_id:
+            # 다른 프로세스가 삭제(또는 같은 key 로 새 세션 저장)한 경우
+            self._keys.discard(session_id)
+            return None
+        return _load(item)
 
     def delete_session(self, session_id: str) -> bool:
-        session = self.get_session_by_id(session_id)
-        if not session:
+        key = self._key_for(session_id)
+        if key is None:
             return False
-        self.table.delete_item(
-            Key={
-                "interview_id": session.interview_id,
-                "member_interview_id": session.member_interview_id
-            }
-        )
+        self._keys.discard(session_id)
+        try:
+            self.table.delete_item(Key=key, ConditionExpression=Attr("session_id").eq(session_id))
+        except ClientError as e:
+            if _conditional_check_failed(e):
+                return False  # 이미 삭제됨
+            raise
         return True
 
     def delete_all_sessions(self) -> int:
-        response = self.table.scan()
         deleted = 0
-        for item in response.get("Items", []):
-            self.table.delete_item(
-                Key={
-                    "interview_id": item["interview_id"],
-                    "member_interview_id": item["member_interview_id"]
-                }
-            )
-            deleted += 1
+        # key 만 읽고, 25개씩 BatchWriteItem (UnprocessedItems 재시도는 batch_writer 가 처리)
+        with self.table.batch_writer() as batch:
+            for item in self._scan(ProjectionExpression="interview_id, member_interview_id"):
+                batch.delete_item(Key=_primary_key(item))
+                deleted += 1
+        self._keys.clear()
         return deleted
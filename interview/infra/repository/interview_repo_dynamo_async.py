@@ -0,0 +1,274 @@
+from interview.domain.repository.interview_repo import AsyncInterviewRepository, SessionConflictError
+from interview.domain.interview import InterviewSession
+from interview.infra.repository.codec import check_session_codec
+from interview.infra.repository.interview_repo_dynamo import (
+    KEY_CACHE_SIZE, SESSION_INDEX_NAME, _KeyCache, _collapse_map_changes, _conditional_check_failed, _expected_version,
+    _item, _load, _missing_index, _primary_key, _update_expression,
+)
+import os
+import asyncio
+import logging
+from typing import AsyncIterator, List, Optional
+from boto3.dynamodb.conditions import Attr, ConditionBase, ConditionExpressionBuilder, Key
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.exceptions import ClientError
+
+# NOTE: aiobotocore 는 REPO_BACKEND=dynamo-async 일 때만 필요합니다 (pip install ".[dynamo-async]").
+try:
+    from aiobotocore.config import AioConfig
+    from aiobotocore.session import get_session
+except ImportError:  # pragma: no cover
+    AioConfig = get_session = None
+
+# 프로세스당 DynamoDB HTTP 커넥션 풀 크기
+DYNAMO_MAX_POOL_CONNECTIONS = int(os.getenv("DYNAMO_MAX_POOL_CONNECTIONS", "50"))
+# BatchWriteItem 의 UnprocessedItems 재시도 횟수
+BATCH_WRITE_RETRIES = 8
+
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+
+def _to_attributes(item: dict) -> dict:
+    return {k: _serializer.serialize(v) for k, v in item.items()}
+
+
+def _from_attributes(item: dict) -> dict:
+    return {k: _deserializer.deserialize(v) for k, v in item.items()}
+
+
+def _expression(condition: ConditionBase, key_condition: bool = False) -> tuple:
+    """boto3 condition → (expression, names, values). client 를 직접 쓰므로 값 직렬화까지 여기서 합니다."""
+    built = ConditionExpressionBuilder().build_expression(condition, is_key_condition=key_condition)
+    values = {k: _serializer.serialize(v) for k, v in built.attribute_value_placeholders.items()}
+    return built.condition_expression, built.attribute_name_placeholders, values
+
+
+class AsyncInterviewRepositoryDynamo(AsyncInterviewRepository):
+    """
+    aiobotocore 기반. 조회/쓰기 규칙(session_id GSI, version 조건, 부분 갱신)은 InterviewRepositoryDynamo 와 같습니다.
+    client 는 첫 호출 때 만들고 커넥션 풀을 프로세스 안에서 공유합니다.
+    """
+
+    def __init__(self):
+        if get_session is None:
+            raise RuntimeError('REPO_BACKEND=dynamo-async requires aiobotocore (pip install ".[dynamo-async]")')
+        check_session_codec()
+        self.table_name = os.getenv("DYNAMO_TABLE_NAME")
+        if not self.table_name:
+            raise ValueError("DYNAMO_TABLE_NAME environment variable is required")
+        self.region = os.getenv("AWS_REGION", "us-east-1")
+        self.session_index = SESSION_INDEX_NAME or None
+        self._keys = _KeyCache(KEY_CACHE_SIZE)
+        self._client = None
+        self._client_context = None
+        self._client_lock = asyncio.Lock()
+
+    async def _get_client(self):
+        if self._client is None:
+            async with self._client_lock:
+                if self._client is None:
+                    context = get_session().create_client(
+                        "dynamodb", region_name=self.region,
+                        config=AioConfig(max_pool_connections=DYNAMO_MAX_POOL_CONNECTIONS, tcp_keepalive=True),
+                    )
+                    self._client = await context.__aenter__()
+                    self._client_context = context
+        return self._client
+
+    async def close(self):
+        if self._client_context is not None:
+            await self._client_context.__aexit__(None, None, None)
+            self._client = self._client_context = None
+
+    # ─────────────────── session_id → primary key ────────────────────
+    async def _key_for(self, session_id: str) -> Optional[dict]:
+        key = self._keys.get(session_id)
+        if key is None:
+            key = await self._lookup_key(session_id)
+            if key is not None:
+                self._keys.put(session_id, key)
+        return key
+
+    async def _lookup_key(self, session_id: str) -> Optional[dict]:
+        client = await self._get_client()
+        if self.session_index:
+            expression, names, values = _expression(Key("session_id").eq(session_id), key_condition=True)
+            try:
+                response = await client.query(
+                    TableName=self.table_name, IndexName=self.session_index, KeyConditionExpression=expression,
+                    ExpressionAttributeNames=names, ExpressionAttributeValues=values,
+                )
+                items = response.get("Items", [])
+                return _primary_key(_from_attributes(items[0])) if items else None
+            except ClientError as e:
+                if not _missing_index(e):
+                    raise
+                logging.warning(
+                    f"DynamoDB index {self.session_index} not found, falling back to scan for session_id lookups. "
+                    f"Create it with `python -m interview.infra.repository.dynamo_session_index create --wait`."
+                )
+                self.session_index = None
+
+        expression, names, values = _expression(Attr("session_id").eq(session_id))
+        async for items in self._scan_pages(
+            FilterExpression=expression, ProjectionExpression="interview_id, member_interview_id",
+            ExpressionAttributeNames=names, ExpressionAttributeValues=values,
+        ):
+            if items:
+                return _primary_key(items[0])
+        return None
+
+    async def _scan_pages(self, **kwargs) -> AsyncIterator[List[dict]]:
+        client = await self._get_client()
+        kwargs["TableName"] = self.table_name
+        while True:
+            response = await client.scan(**kwargs)
+            yield [_from_attributes(item) for item in response.get("Items", [])]
+            if "LastEvaluatedKey" not in response:
+                return
+            kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+    # ─────────────────── repository ────────────────────
+    async def _put(self, session: InterviewSession, condition: Optional[ConditionBase] = None) -> InterviewSession:
+        client = await self._get_client()
+        item = _item(session)
+        kwargs = {"TableName": self.table_name, "Item": _to_attributes(item)}
+        if condition is not None:
+            expression, names, values = _expression(condition)
+            kwargs.update(ConditionExpression=expression, ExpressionAttributeNames=names,
+                          ExpressionAttributeValues=values)
+        await client.put_item(**kwargs)
+        self._keys.put(session.session_id, _primary_key(item))
+        session.version = item["version"]
+        session.mark_clean()
+        return session
+
+    async def save_session(self, session: InterviewSession) -> InterviewSession:
+        return await self._put(session)
+
+    async def save_sessions(self, sessions: List[InterviewSession]) -> List[InterviewSession]:
+        items = [_item(session) for session in sessions]
+        for start in range(0, len(items), 25):
+            await self._batch_write([{"PutRequest": {"Item": _to_attributes(item)}} for item in items[start:start + 25]])
+        for session, item in zip(sessions, items):
+            self._keys.put(session.session_id, _primary_key(item))
+            session.version = item["version"]
+            session.mark_clean()
+        return sessions
+
+    async def update_session(self, session: InterviewSession) -> InterviewSession:
+        changes = session.changes()
+        if changes is not None and not changes:
+            return session
+        try:
+            if changes is None or any(path[0] in ("interview_id", "member_interview_id") for path, _ in changes):
+                return await self._put(session, _expected_version(session.version))
+
+            doc = session.dict()
+            update, names, values = _update_expression(
+                _collapse_map_changes(changes, doc) + [(("version",), session.version + 1)]
+            )
+            condition, condition_names, condition_values = _expression(
+                Attr("session_id").eq(session.session_id) & _expected_version(session.version)
+            )
+            client = await self._get_client()
+            await client.update_item(
+                TableName=self.table_name,
+                Key=_to_attributes(_primary_key(doc)),
+                UpdateExpression=update,
+                ConditionExpression=condition,
+                ExpressionAttributeNames={**names, **condition_names},
+                ExpressionAttributeValues={**_to_attributes(values), **condition_values},
+            )
+        except ClientError as e:
+            if not _conditional_check_failed(e):
+                raise
+            raise SessionConflictError(session.session_id, session.version) from e
+        session.version += 1
+        session.mark_clean()
+        return session
+
+    async def get_all_sessions(self):
+        return [session async for session in self.iter_sessions()]
+
+    async def iter_sessions(self) -> AsyncIterator[InterviewSession]:
+        async for items in self._scan_pages():
+            for item in items:
+                yield _load(item)
+
+    async def get_session_by_interview_and_member_interview_id(self, interview_id: str, member_interview_id: str):
+        client = await self._get_client()
+        expression, names, values = _expression(
+            Key("interview_id").eq(interview_id) & Key("member_interview_id").eq(member_interview_id),
+            key_condition=True,
+        )
+        response = await client.query(
+            TableName=self.table_name, KeyConditionExpression=expression,
+            ExpressionAttributeNames=names, ExpressionAttributeValues=values,
+        )
+        items = response.get("Items", [])
+        if not items:
+            return None
+        item = _from_attributes(items[0])
+        self._keys.put(item["session_id"], _primary_key(item))
+        return _load(item)
+
+    async def get_session_by_id(self, session_id: str) -> InterviewSession:
+        key = await self._key_for(session_id)
+        if key is None:
+            return None
+        client = await self._get_client()
+        response = await client.get_item(TableName=self.table_name, Key=_to_attributes(key), ConsistentRead=True)
+        item = _from_attributes(response["Item"]) if response.get("Item") else None
+        if not item or item.get("session_id") != session_id:
+            self._keys.discard(session_id)
+            return None
+        return _load(item)
+
+    async def delete_session(self, session_id: str) -> bool:
+        key = await self._key_for(session_id)
+        if key is None:
+            return False
+        self._keys.discard(session_id)
+        expression, names, values = _expression(Attr("session_id").eq(session_id))
+        client = await self._get_client()
+        try:
+            await client.delete_item(
+                TableName=self.table_name, Key=_to_attributes(key), ConditionExpression=expression,
+                ExpressionAttributeNames=names, ExpressionAttributeValues=values,
+            )
+        except ClientError as e:
+            if _conditional_check_failed(e):
+                return False  # 이미 삭제됨
+            raise
+        return True
+
+    async def _batch_write(self, writes: List[dict]):
+        """BatchWriteItem (최대 25개). UnprocessedItems 는 backoff 후 다시 보냅니다."""
+        client = await self._get_client()
+        requests = {self.table_name: writes}
+        for attempt in range(BATCH_WRITE_RETRIES):
+            response = await client.batch_write_item(RequestItems=requests)
+            requests = response.get("UnprocessedItems") or {}
+            if not requests:
+                return
+            await asyncio.sleep(min(0.05 * 2 ** attempt, 2.0))
+        raise RuntimeError(f"BatchWriteItem left {len(requests[self.table_name])} unprocessed items")
+
+    async def _batch_delete(self, keys: List[dict]):
+        await self._batch_write([{"DeleteRequest": {"Key": _to_attributes(key)}} for key in keys])
+
+    async def delete_all_sessions(self) -> int:
+        deleted, keys = 0, []
+        async for items in self._scan_pages(ProjectionExpression="interview_id, member_interview_id"):
+            for item in items:
+                keys.append(_primary_key(item))
+                if len(keys) == 25:
+                    await self._batch_delete(keys)
+                    deleted, keys = deleted + 25, []
+        if keys:
+            await self._batch_delete(keys)
+            deleted += len(keys)
+        self._keys.clear()
+        return deleted
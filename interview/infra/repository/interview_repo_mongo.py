@@ -1,39 +1,175 @@
-from interview.domain.repository.interview_repo import InterviewRepository
-from interview.domain.interview import InterviewSession
-from pymongo import MongoClient
+from interview.domain.repository.interview_repo import InterviewRepository, SessionConflictError
+from interview.domain.interview import InterviewSession, QA, REMOVED, parse_session_fields
+from interview.infra.repository.codec import check_session_codec, decode_document, encode_changes, encode_document
+from pymongo import ASCENDING, IndexModel, MongoClient
+from pymongo.errors import DuplicateKeyError, OperationFailure
+from typing import Any, Dict, List, Optional, Sequence
 import os
+import logging
+
+# 시작할 때 인덱스를 만들지 여부 (이미 있으면 아무 일도 하지 않음). 권한이 없는 계정이면 false 로 두고 따로 생성합니다.
+MONGO_CREATE_INDEXES = os.getenv("MONGO_CREATE_INDEXES", "true").lower() == "true"
+
+SESSION_ID_INDEX = IndexModel([("session_id", ASCENDING)], name="session_id_unique", unique=True)
+INTERVIEW_MEMBER_INDEX = IndexModel(
+    [("interview_id", ASCENDING), ("member_interview_id", ASCENDING)], name="interview_member"
+)
+
+
+def _index_failed(name: str, error: Exception):
+    # 기존 데이터에 중복 session_id 가 있으면 unique 인덱스를 만들 수 없습니다.
+    logging.warning(f"MongoDB index {name} was not created, lookups fall back to collection scans: {error}")
+
+
+def ensure_indexes(collection):
+    for index in (SESSION_ID_INDEX, INTERVIEW_MEMBER_INDEX):
+        try:
+            collection.create_indexes([index])
+        except (DuplicateKeyError, OperationFailure) as e:
+            _index_failed(index.document["name"], e)
+
+
+def _projection(fields: Sequence[str]) -> dict:
+    return {"_id": 0, "session_id": 1, **{field: 1 for field in fields}}
+
+
+def _qa_projection(index: int) -> dict:
+    # $slice 를 inclusion projection 과 같이 쓰면 qa_flow[index] 하나만 읽습니다.
+    return {"_id": 0, "session_id": 1, "qa_flow": {"$slice": [index, 1]}}
+
+
+def _qa_from(doc: Optional[dict]) -> Optional[QA]:
+    if not doc or not doc.get("qa_flow"):
+        return None
+    return QA(**decode_document(doc["qa_flow"][0]))
+
+
+def _fields_from(doc: dict, fields: Sequence[str]) -> Dict[str, Any]:
+    return parse_session_fields(decode_document(doc), fields)
+
+
+def _load(doc: dict) -> InterviewSession:
+    session = InterviewSession(**decode_document(doc))
+    session.mark_clean()
+    return session
+
+
+def _document(session: InterviewSession) -> dict:
+    """저장할 문서 (긴 텍스트는 SESSION_CODEC 으로 압축, version + 1)"""
+    doc = encode_document(session.dict())
+    doc["version"] = session.version + 1
+    return doc
+
+
+def _expected_version(session: InterviewSession) -> dict:
+    """저장된 version 이 읽은 시점 그대로인 문서 (version 도입 전 문서는 0 으로 취급)"""
+    if session.version == 0:
+        return {"session_id": session.session_id, "version": {"$in": [0, None]}}
+    return {"session_id": session.session_id, "version": session.version}
+
+
+def _new_documents(sessions: List[InterviewSession]) -> List[dict]:
+    return [_document(session) for session in sessions]
+
+
+def _mark_saved(sessions: List[InterviewSession]) -> List[InterviewSession]:
+    for session in sessions:
+        session.version += 1
+        session.mark_clean()
+    return sessions
+
+
+def _update_document(changes) -> dict:
+    """changes() → {"$set": {"qa_flow.0.answer": ...}, "$unset": {...}}"""
+    sets, unsets = {}, {}
+    for path, value in encode_changes(changes):
+        field = ".".join(str(segment) for segment in path)
+        if value is REMOVED:
+            unsets[field] = ""
+        else:
+            sets[field] = value
+    update = {}
+    if sets:
+        update["$set"] = sets
+    if unsets:
+        update["$unset"] = unsets
+    return update
+
 
 class InterviewRepositoryMongo(InterviewRepository):
     def __init__(self):
+        check_session_codec()
         mongo_uri = os.getenv("MONGO_URI")
         if not mongo_uri:
             raise ValueError("MONGO_URI environment variable is required")
         client = MongoClient(mongo_uri)
         self.collection = client["interview_db"]["sessions"]
+        if MONGO_CREATE_INDEXES:
+            ensure_indexes(self.collection)
 
     def save_session(self, session: InterviewSession) -> InterviewSession:
-        self.collection.insert_one(session.dict())
+        doc = _document(session)
+        self.collection.insert_one(doc)
+        session.version = doc["version"]
+        session.mark_clean()
         return session
 
+    def save_sessions(self, sessions: List[InterviewSession]) -> List[InterviewSession]:
+        if not sessions:
+            return sessions
+        self.collection.insert_many(_new_documents(sessions), ordered=False)
+        return _mark_saved(sessions)
+
     def update_session(self, session: InterviewSession) -> InterviewSession:
-        self.collection.replace_one(
-            {"session_id": session.session_id}, session.dict(), upsert=True
-        )
+        """
+        저장소에서 읽은 세션이면 바뀐 필드만 $set / $unset. 어느 쪽이든 읽은 version 과 같은 문서에만 씁니다.
+        읽은 뒤 다른 쓰기(또는 삭제)가 있었으면 SessionConflictError.
+        """
+        changes = session.changes()
+        if changes is not None and not changes:
+            return session
+        if changes is None:
+            doc = _document(session)
+            matched = self.collection.replace_one(_expected_version(session), doc).matched_count
+            if not matched and self.collection.count_documents({"session_id": session.session_id}, limit=1) == 0:
+                try:
+                    return self.save_session(session)
+                except DuplicateKeyError:
+                    pass
+        else:
+            matched = self.collection.update_one(
+                _expected_version(session), _update_document(changes + [(("version",), session.version + 1)])
+            ).matched_count
+        if not matched:
+            raise SessionConflictError(session.session_id, session.version)
+        session.version += 1
+        session.mark_clean()
         return session
 
     def get_all_sessions(self):
-        return [InterviewSession(**doc) for doc in self.collection.find()]
+        return [_load(doc) for doc in self.collection.find()]
+
+    def iter_sessions(self):
+        for doc in self.collection.find():
+            yield _load(doc)
 
     def get_session_by_interview_and_member_interview_id(self, interview_id: str, member_interview_id: str):
         doc = self.collection.find_one({
             "interview_id": interview_id,
             "member_interview_id": member_interview_id
         })
-        return InterviewSession(**doc) if doc else None
+        return _load(doc) if doc else None
 
     def get_session_by_id(self, session_id: str):
         doc = self.collection.find_one({"session_id": session_id})
-        return InterviewSession(**doc) if doc else None
+        return _load(doc) if doc else None
+
+    def get_session_fields(self, session_id: str, fields: Sequence[str]) -> Optional[Dict[str, Any]]:
+        doc = self.collection.find_one({"session_id": session_id}, _projection(fields))
+        return _fields_from(doc, fields) if doc else None
+
+    def get_qa(self, session_id: str, index: int) -> Optional[QA]:
+        return _qa_from(self.collection.find_one({"session_id": session_id}, _qa_projection(index)))
 
     def delete_session(self, session_id: str) -> bool:
         result = self.collection.delete_one({"session_id": session_id})
@@ -0,0 +1,128 @@
+from interview.domain.repository.interview_repo import AsyncInterviewRepository, SessionConflictError
+from interview.domain.interview import InterviewSession, QA
+from interview.infra.repository.codec import check_session_codec
+from interview.infra.repository.interview_repo_mongo import (
+    INTERVIEW_MEMBER_INDEX, MONGO_CREATE_INDEXES, SESSION_ID_INDEX,
+    _document, _expected_version, _fields_from, _index_failed, _load, _mark_saved, _new_documents, _projection, _qa_from,
+    _qa_projection, _update_document,
+)
+from pymongo import AsyncMongoClient
+from pymongo.errors import DuplicateKeyError, OperationFailure
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence
+import os
+import asyncio
+
+# 프로세스당 커넥션 풀 크기 (pymongo 기본 100)
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", "100"))
+
+
+class AsyncInterviewRepositoryMongo(AsyncInterviewRepository):
+    """pymongo AsyncMongoClient 기반. 쓰기 규칙(version 조건, 부분 갱신)은 InterviewRepositoryMongo 와 같습니다."""
+
+    def __init__(self):
+        check_session_codec()
+        mongo_uri = os.getenv("MONGO_URI")
+        if not mongo_uri:
+            raise ValueError("MONGO_URI environment variable is required")
+        # 첫 요청 때 연결합니다 (이벤트 루프 밖에서 만들어도 됨)
+        self.client = AsyncMongoClient(mongo_uri, maxPoolSize=MONGO_MAX_POOL_SIZE)
+        self.collection = self.client["interview_db"]["sessions"]
+        self._indexes_ready = not MONGO_CREATE_INDEXES
+        self._indexes_lock = asyncio.Lock()
+
+    async def ensure_indexes(self):
+        """첫 호출 때 한 번 인덱스를 만듭니다 (생성자에서는 await 할 수 없으므로)"""
+        if self._indexes_ready:
+            return
+        async with self._indexes_lock:
+            if self._indexes_ready:
+                return
+            for index in (SESSION_ID_INDEX, INTERVIEW_MEMBER_INDEX):
+                try:
+                    await self.collection.create_indexes([index])
+                except (DuplicateKeyError, OperationFailure) as e:
+                    _index_failed(index.document["name"], e)
+            self._indexes_ready = True
+
+    async def save_session(self, session: InterviewSession) -> InterviewSession:
+        await self.ensure_indexes()
+        doc = _document(session)
+        await self.collection.insert_one(doc)
+        session.version = doc["version"]
+        session.mark_clean()
+        return session
+
+    async def save_sessions(self, sessions: List[InterviewSession]) -> List[InterviewSession]:
+        await self.ensure_indexes()
+        if not sessions:
+            return sessions
+        await self.collection.insert_many(_new_documents(sessions), ordered=False)
+        return _mark_saved(sessions)
+
+    async def update_session(self, session: InterviewSession) -> InterviewSession:
+        await self.ensure_indexes()
+        changes = session.changes()
+        if changes is not None and not changes:
+            return session
+        if changes is None:
+            doc = _document(session)
+            matched = (await self.collection.replace_one(_expected_version(session), doc)).matched_count
+            if not matched and await self.collection.count_documents({"session_id": session.session_id}, limit=1) == 0:
+                try:
+                    return await self.save_session(session)
+                except DuplicateKeyError:
+                    pass
+        else:
+            result = await self.collection.update_one(
+                _expected_version(session), _update_document(changes + [(("version",), session.version + 1)])
+            )
+            matched = result.matched_count
+        if not matched:
+            raise SessionConflictError(session.session_id, session.version)
+        session.version += 1
+        session.mark_clean()
+        return session
+
+    async def get_all_sessions(self):
+        await self.ensure_indexes()
+        return [_load(doc) async for doc in self.collection.find()]
+
+    async def iter_sessions(self) -> AsyncIterator[InterviewSession]:
+        await self.ensure_indexes()
+        async for doc in self.collection.find():
+            yield _load(doc)
+
+    async def get_session_by_interview_and_member_interview_id(self, interview_id: str, member_interview_id: str):
+        await self.ensure_indexes()
+        doc = await self.collection.find_one({
+            "interview_id": interview_id,
+            "member_interview_id": member_interview_id
+        })
+        return _load(doc) if doc else None
+
+    async def get_session_by_id(self, session_id: str):
+        await self.ensure_indexes()
+        doc = await self.collection.find_one({"session_id": session_id})
+        return _load(doc) if doc else None
+
+    async def get_session_fields(self, session_id: str, fields: Sequence[str]) -> Optional[Dict[str, Any]]:
+        await self.ensure_indexes()
+        doc = await self.collection.find_one({"session_id": session_id}, _projection(fields))
+        return _fields_from(doc, fields) if doc else None
+
+    async def get_qa(self, session_id: str, index: int) -> Optional[QA]:
+        await self.ensure_indexes()
+        return _qa_from(await self.collection.find_one({"session_id": session_id}, _qa_projection(index)))
+
+    async def delete_session(self, session_id: str) -> bool:
+        await self.ensure_indexes()
+        result = await self.collection.delete_one({"session_id": session_id})
+        return result.deleted_count > 0
+
+    async def delete_all_sessions(self) -> int:
+        await self.ensure_indexes()
+        result = await self.collection.delete_many({})
+        return result.deleted_count
+
+    async def close(self):
+        await self.client.close()
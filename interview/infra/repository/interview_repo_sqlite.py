@@ -0,0 +1,196 @@
+from interview.domain.repository.interview_repo import InterviewRepository, SessionConflictError
+from interview.domain.interview import InterviewSession, QA, parse_session_fields
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+import os
+import json
+import sqlite3
+import threading
+
+# 단일 노드 배포 / 로컬 부하 테스트용. 같은 파일을 여러 프로세스(worker)가 열어도 됩니다 (WAL).
+SQLITE_PATH = os.getenv("SQLITE_PATH", "data/interview.db")
+# 다른 connection 이 쓰기 lock 을 잡고 있을 때 기다리는 시간
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+# iter_sessions 가 한 번에 읽는 행 수
+ITER_PAGE_SIZE = 100
+
+SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS sessions (
+        session_id TEXT PRIMARY KEY,
+        interview_id TEXT NOT NULL,
+        member_interview_id TEXT NOT NULL,
+        version INTEGER NOT NULL,
+        data TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS interview_member ON sessions (interview_id, member_interview_id)",
+)
+
+# SQL 문자열을 고정해 두면 sqlite3 가 connection 마다 prepared statement 를 캐시해 재사용합니다.
+INSERT = "INSERT INTO sessions (session_id, interview_id, member_interview_id, version, data) VALUES (?, ?, ?, ?, ?)"
+UPDATE = (
+    "UPDATE sessions SET interview_id = ?, member_interview_id = ?, version = ?, data = ? "
+    "WHERE session_id = ? AND version = ?"
+)
+SELECT_BY_ID = "SELECT version, data FROM sessions WHERE session_id = ?"
+SELECT_BY_INTERVIEW = (
+    "SELECT version, data FROM sessions WHERE interview_id = ? AND member_interview_id = ? ORDER BY rowid LIMIT 1"
+)
+SELECT_PAGE = "SELECT rowid, version, data FROM sessions WHERE rowid > ? ORDER BY rowid LIMIT ?"
+SELECT_QA = "SELECT json_quote(json_extract(data, ?)) FROM sessions WHERE session_id = ?"
+DELETE = "DELETE FROM sessions WHERE session_id = ?"
+DELETE_ALL = "DELETE FROM sessions"
+
+
+def _row(session: InterviewSession, version: int) -> tuple:
+    return (session.session_id, session.interview_id, session.member_interview_id, version,
+            session.model_dump_json(exclude={"version"}))
+
+
+def _load(version: int, data: str) -> InterviewSession:
+    # version 은 컬럼이 기준입니다 (data 에는 저장하지 않음)
+    session = InterviewSession.model_validate_json(data)
+    session.version = version
+    session.mark_clean()
+    return session
+
+
+def _qa_path(index: int) -> str:
+    return f"$.qa_flow[{index}]" if index >= 0 else f"$.qa_flow[#{index}]"
+
+
+class InterviewRepositorySqlite(InterviewRepository):
+    """
+    내장 SQLite 저장소. 세션 전체를 JSON 한 컬럼에 두고 session_id(PK), (interview_id, member_interview_id) 로 찾습니다.
+    - connection 은 thread 마다 하나 (service 는 동기 저장소를 여러 thread 에서 호출합니다).
+    - update_session 은 version 조건(UPDATE ... WHERE version = ?)으로 씁니다. 어차피 행 전체를 다시 쓰므로
+      부분 갱신 대신 전체 JSON 을 저장합니다.
+    """
+
+    def __init__(self, path: str = SQLITE_PATH):
+        if not path or path == ":memory:":
+            # thread 마다 connection 을 따로 열기 때문에 메모리 DB 는 서로 공유되지 않습니다.
+            raise ValueError("SQLITE_PATH must be a file path")
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        conn = self._conn()
+        for statement in SCHEMA:
+            conn.execute(statement)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # isolation_level=None: 문장 단위 autocommit. 여러 문장을 묶을 때만 BEGIN 합니다.
+            # check_same_thread=False 는 close() 때문입니다. 쿼리는 만든 thread 에서만 실행합니다.
+            conn = sqlite3.connect(self.path, timeout=SQLITE_BUSY_TIMEOUT_MS / 1000, isolation_level=None,
+                                   check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")   # WAL 에서는 commit 마다 fsync 하지 않아도 손상되지 않습니다
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self):
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+    def save_session(self, session: InterviewSession) -> InterviewSession:
+        version = session.version + 1
+        self._conn().execute(INSERT, _row(session, version))
+        session.version = version
+        session.mark_clean()
+        return session
+
+    def save_sessions(self, sessions: List[InterviewSession]) -> List[InterviewSession]:
+        if not sessions:
+            return sessions
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(INSERT, [_row(session, session.version + 1) for session in sessions])
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        for session in sessions:
+            session.version += 1
+            session.mark_clean()
+        return sessions
+
+    def update_session(self, session: InterviewSession) -> InterviewSession:
+        changes = session.changes()
+        if changes is not None and not changes:
+            return session
+        version = session.version + 1
+        conn = self._conn()
+        data = session.model_dump_json(exclude={"version"})
+        updated = conn.execute(UPDATE, (
+            session.interview_id, session.member_interview_id, version, data, session.session_id, session.version,
+        )).rowcount
+        if not updated:
+            if changes is not None or conn.execute(SELECT_BY_ID, (session.session_id,)).fetchone() is not None:
+                raise SessionConflictError(session.session_id, session.version)
+            try:
+                return self.save_session(session)
+            except sqlite3.IntegrityError as e:
+                raise SessionConflictError(session.session_id, session.version) from e
+        session.version = version
+        session.mark_clean()
+        return session
+
+    def get_all_sessions(self):
+        return list(self.iter_sessions())
+
+    def iter_sessions(self) -> Iterator[InterviewSession]:
+        # 페이지마다 새로 조회합니다 (ThreadedRepository 는 페이지를 서로 다른 thread 에서 읽습니다).
+        last = 0
+        while True:
+            rows = self._conn().execute(SELECT_PAGE, (last, ITER_PAGE_SIZE)).fetchall()
+            for _, version, data in rows:
+                yield _load(version, data)
+            if len(rows) < ITER_PAGE_SIZE:
+                return
+            last = rows[-1][0]
+
+    def get_session_by_interview_and_member_interview_id(self, interview_id: str, member_interview_id: str):
+        row = self._conn().execute(SELECT_BY_INTERVIEW, (interview_id, member_interview_id)).fetchone()
+        return _load(*row) if row else None
+
+    def get_session_by_id(self, session_id: str):
+        row = self._conn().execute(SELECT_BY_ID, (session_id,)).fetchone()
+        return _load(*row) if row else None
+
+    def get_session_fields(self, session_id: str, fields: Sequence[str]) -> Optional[Dict[str, Any]]:
+        # 필드마다 json_extract 로 꺼내 나머지 필드는 파싱하지 않습니다.
+        columns = ", ".join(["version"] + ["json_quote(json_extract(data, ?))"] * len(fields))
+        row = self._conn().execute(
+            f"SELECT {columns} FROM sessions WHERE session_id = ?",
+            (*(f"$.{field}" for field in fields), session_id),
+        ).fetchone()
+        if row is None:
+            return None
+        doc = {field: json.loads(value) for field, value in zip(fields, row[1:])}
+        doc["version"] = row[0]
+        return parse_session_fields(doc, fields)
+
+    def get_qa(self, session_id: str, index: int) -> Optional[QA]:
+        row = self._conn().execute(SELECT_QA, (_qa_path(index), session_id)).fetchone()
+        if row is None:
+            return None
+        qa = json.loads(row[0])
+        return QA(**qa) if qa else None
+
+    def delete_session(self, session_id: str) -> bool:
+        return self._conn().execute(DELETE, (session_id,)).rowcount > 0
+
+    def delete_all_sessions(self) -> int:
+        return self._conn().execute(DELETE_ALL).rowcount
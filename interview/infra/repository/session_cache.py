@@ -0,0 +1,344 @@
+import os
+import copy
+import time
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from interview.domain.interview import InterviewSession, QA, apply_changes, parse_session_fields
+from interview.domain.repository.interview_repo import InterviewRepository, SessionConflictError
+
+# 여러 worker/replica 가 같은 저장소를 쓰면 다른 쪽의 쓰기를 TTL 동안 못 볼 수 있으므로 기본은 끔 (단일 프로세스 배포용)
+SESSION_CACHE_ENABLED = os.getenv("SESSION_CACHE_ENABLED", "false").lower() == "true"
+SESSION_CACHE_MAX_ENTRIES = int(os.getenv("SESSION_CACHE_MAX_ENTRIES", "1024"))
+# 다른 프로세스(worker/replica)의 쓰기를 놓칠 수 있는 최대 시간
+SESSION_CACHE_TTL_SECONDS = float(os.getenv("SESSION_CACHE_TTL_SECONDS", "60"))
+# 0 이면 write-through. 0보다 크면 이 시간 동안의 변경을 모아 한 번에 저장 (프로세스가 죽으면 그 사이 변경 유실)
+SESSION_CACHE_WRITE_BEHIND_MS = float(os.getenv("SESSION_CACHE_WRITE_BEHIND_MS", "0"))
+
+_caches: "weakref.WeakSet[SessionCache]" = weakref.WeakSet()
+
+
+def flush_session_caches():
+    """write-behind 로 쌓인 변경을 모두 저장 (서버 종료 시)"""
+    for cache in list(_caches):
+        cache.close()
+
+
+@dataclass
+class _Entry:
+    current: dict                       # 최신 상태 (model_dump)
+    loaded_at: float                    # 저장소에서 전체를 마지막으로 읽은(또는 쓴) 시각 — TTL 기준
+    version: int = 0                    # 이 프로세스에서 변경할 때마다 +1 (세션의 version 과는 별개)
+    persisted: Optional[dict] = None    # write-behind: 저장소에 반영된 상태 (dirty 일 때만)
+    dirty_since: Optional[float] = None
+
+
+class SessionCache(InterviewRepository):
+    """
+    InterviewRepository 앞단의 read-through 세션 캐시.
+    - get_session_by_id 는 캐시에서 (매번 새 객체로) 돌려주고, 없으면 저장소에서 읽어 채웁니다.
+    - update_session 은 바뀐 필드만(changes()) 저장소에 쓰고 캐시에도 반영합니다.
+      write_behind_delay > 0 이면 저장소 쓰기를 미루고, 그 사이의 변경을 한 번의 partial update 로 합칩니다.
+    - 읽는 도중 같은 세션에 쓰기/삭제가 있었으면 (lease 로 확인) 읽은 값으로 캐시를 채우지 않습니다.
+    - 다른 프로세스가 먼저 저장해 SessionConflictError 가 나면 항목을 버립니다 (호출자가 다시 읽으면 저장소에서).
+      write-behind flush 가 충돌하면 저장소의 최신 상태 위에 밀린 변경을 다시 얹어 재시도합니다.
+    - LRU(max_entries) + TTL. 저장하지 않은 변경이 있는 항목은 저장 전까지 내보내지 않습니다.
+    """
+
+    def __init__(self, repo: InterviewRepository, max_entries: int = SESSION_CACHE_MAX_ENTRIES,
+                 ttl_seconds: float = SESSION_CACHE_TTL_SECONDS,
+                 write_behind_delay: float = SESSION_CACHE_WRITE_BEHIND_MS / 1000):
+        self.repo = repo
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.write_behind_delay = write_behind_delay
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._leases: Dict[str, object] = {}
+        self._dirty: Dict[str, float] = {}      # session_id → flush 예정 시각
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._flush_lock = threading.Lock()     # flush 중인 쓰기와 delete 가 엇갈리지 않도록
+        self._closed = False
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.coalesced = 0
+        self.flushes = 0
+        self._flusher: Optional[threading.Thread] = None
+        if write_behind_delay > 0:
+            self._flusher = threading.Thread(target=self._run_flusher, name="session-write-behind", daemon=True)
+            self._flusher.start()
+        _caches.add(self)
+
+    # ─────────────────── 캐시 ────────────────────
+    def _hit(self, session_id: str) -> Optional[_Entry]:
+        """lock 안에서 호출. TTL 이 지나지 않은 항목이면 hit 로 셉니다."""
+        entry = self._entries.get(session_id)
+        if entry is None:
+            return None
+        if entry.dirty_since is None and time.monotonic() - entry.loaded_at > self.ttl_seconds:
+            del self._entries[session_id]
+            return None
+        self._entries.move_to_end(session_id)
+        self.hits += 1
+        return entry
+
+    def _cached(self, session_id: str) -> Optional[InterviewSession]:
+        with self._lock:
+            entry = self._hit(session_id)
+            if entry is None:
+                return None
+            session = InterviewSession(**entry.current)
+        session.mark_clean()
+        return session
+
+    def _fill(self, session: InterviewSession):
+        """lock 안에서 호출. 저장소와 같은 전체 상태로 항목을 (다시) 만듭니다."""
+        self._entries[session.session_id] = _Entry(current=session.model_dump(), loaded_at=time.monotonic())
+        self._entries.move_to_end(session.session_id)
+        while len(self._entries) > self.max_entries:
+            victim = next((sid for sid, e in self._entries.items() if e.dirty_since is None), None)
+            if victim is None:
+                break
+            del self._entries[victim]
+
+    def _read_through(self, session_id: str) -> Optional[InterviewSession]:
+        lease = object()
+        with self._lock:
+            self.misses += 1
+            self._leases[session_id] = lease
+        session = self.repo.get_session_by_id(session_id)
+        with self._lock:
+            if self._leases.get(session_id) is lease:
+                del self._leases[session_id]
+                if session is not None and session_id not in self._entries:
+                    self._fill(session)
+        return session
+
+    # ─────────────────── write-behind ────────────────────
+    def _defer(self, session_id: str, changes) -> bool:
+        """lock 안에서 호출. 캐시에 있으면 변경을 반영하고 flush 를 예약합니다."""
+        entry = self._entries.get(session_id)
+        if entry is None:
+            return False
+        if entry.dirty_since is None:
+            entry.persisted = copy.deepcopy(entry.current)
+            entry.dirty_since = time.monotonic()
+            self._dirty[session_id] = entry.dirty_since + self.write_behind_delay
+            self._wake.notify()
+        else:
+            self.coalesced += 1
+        apply_changes(entry.current, changes)
+        entry.version += 1
+        return True
+
+    def _flush_entry(self, session_id: str):
+        with self._flush_lock:
+            with self._lock:
+                self._dirty.pop(session_id, None)
+                entry = self._entries.get(session_id)
+                if entry is None or entry.dirty_since is None:
+                    return
+                data, base, version = copy.deepcopy(entry.current), entry.persisted, entry.version
+            session = InterviewSession(**data)
+            session.mark_clean(base)
+            try:
+                self.repo.update_session(session)
+            except SessionConflictError:
+                self._rebase(session_id, entry)
+                return
+            except Exception as e:
+                logging.warning(f"Write-behind flush failed for {session_id}, retrying: {e}")
+                with self._lock:
+                    if self._entries.get(session_id) is entry:
+                        self._dirty[session_id] = time.monotonic() + max(self.write_behind_delay, 1.0)
+                return
+            with self._lock:
+                self.flushes += 1
+                if self._entries.get(session_id) is not entry:
+                    return
+                data["version"] = entry.current["version"] = session.version
+                if entry.version == version:
+                    entry.persisted = None
+                    entry.dirty_since = None
+                else:
+                    # flush 하는 동안 들어온 변경은 다음 flush 에서
+                    entry.persisted = data
+                    self._dirty[session_id] = time.monotonic() + self.write_behind_delay
+
+    def _rebase(self, session_id: str, entry: _Entry):
+        """다른 프로세스가 먼저 저장함: 저장소의 최신 상태에 아직 저장하지 않은 변경을 다시 적용하고 바로 flush"""
+        fresh = self.repo.get_session_by_id(session_id)
+        with self._lock:
+            if self._entries.get(session_id) is not entry:
+                return
+            if fresh is None:
+                logging.warning(f"Session {session_id} was deleted before its pending changes were flushed")
+                del self._entries[session_id]
+                return
+            pending = InterviewSession(**entry.current)
+            pending.mark_clean(entry.persisted)
+            base = fresh.model_dump()
+            entry.current = copy.deepcopy(base)
+            apply_changes(entry.current, pending.changes())
+            entry.persisted = base
+            entry.loaded_at = time.monotonic()
+            entry.version += 1
+            self._dirty[session_id] = time.monotonic()
+            self._wake.notify()
+
+    def _run_flusher(self):
+        while True:
+            with self._lock:
+                while True:
+                    now = time.monotonic()
+                    ready = [sid for sid, due in self._dirty.items() if due <= now or self._closed]
+                    if ready or (self._closed and not self._dirty):
+                        break
+                    self._wake.wait(min(self._dirty.values()) - now if self._dirty else None)
+                if not ready:
+                    return
+            for session_id in ready:
+                self._flush_entry(session_id)
+
+    def flush(self):
+        with self._lock:
+            pending = list(self._dirty)
+        for session_id in pending:
+            self._flush_entry(session_id)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            self._wake.notify()
+        if self._flusher is not None:
+            self._flusher.join(timeout=30)
+        self.flush()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "writes": self.writes,
+                "coalesced": self.coalesced,
+                "flushes": self.flushes,
+                "dirty": len(self._dirty),
+            }
+
+    # ─────────────────── repository ────────────────────
+    def save_session(self, session: InterviewSession) -> InterviewSession:
+        self.repo.save_session(session)
+        with self._lock:
+            self.writes += 1
+            self._leases.pop(session.session_id, None)
+            self._fill(session)
+        return session
+
+    def save_sessions(self, sessions: List[InterviewSession]) -> List[InterviewSession]:
+        self.repo.save_sessions(sessions)
+        with self._lock:
+            for session in sessions:
+                self.writes += 1
+                self._leases.pop(session.session_id, None)
+                self._fill(session)
+        return sessions
+
+    def update_session(self, session: InterviewSession) -> InterviewSession:
+        changes = session.changes()
+        if changes is not None and not changes:
+            return session
+        session_id = session.session_id
+        if self.write_behind_delay > 0 and changes is not None:
+            with self._lock:
+                if self._defer(session_id, changes):
+                    self.writes += 1
+                    session.mark_clean()
+                    return session
+
+        try:
+            self.repo.update_session(session)
+        except SessionConflictError:
+            with self._lock:
+                self._leases.pop(session_id, None)
+                entry = self._entries.get(session_id)
+                if entry is not None and entry.dirty_since is None:
+                    del self._entries[session_id]
+            raise
+        with self._lock:
+            self.writes += 1
+            self._leases.pop(session_id, None)
+            entry = self._entries.get(session_id)
+            if changes is None:
+                self._fill(session)     # 전체를 썼으므로 그대로 캐시
+            elif entry is not None:
+                apply_changes(entry.current, changes)
+                entry.current["version"] = session.version
+                entry.version += 1
+        return session
+
+    def get_all_sessions(self) -> list[InterviewSession]:
+        self.flush()
+        return self.repo.get_all_sessions()
+
+    def iter_sessions(self) -> Iterator[InterviewSession]:
+        self.flush()
+        return self.repo.iter_sessions()
+
+    def get_session_by_interview_and_member_interview_id(self, interview_id: str, member_interview_id: str) -> InterviewSession:
+        session = self.repo.get_session_by_interview_and_member_interview_id(interview_id, member_interview_id)
+        if session is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(session.session_id)
+            if entry is not None and entry.dirty_since is None and entry.current["version"] < session.version:
+                # 다른 worker 가 더 최근에 저장함: 방금 읽은 것으로 캐시를 갱신
+                self._leases.pop(session.session_id, None)
+                self._fill(session)
+                return session
+        # 아직 저장하지 않은 변경(write-behind)이 있을 수 있으므로 같은 version 이면 캐시 쪽을 우선
+        return self._cached(session.session_id) or session
+
+    def get_session_by_id(self, session_id: str) -> InterviewSession:
+        return self._cached(session_id) or self._read_through(session_id)
+
+    def get_session_fields(self, session_id: str, fields: Sequence[str]) -> Optional[Dict[str, Any]]:
+        # 캐시에 없으면 저장소의 projection 조회로 (전체 세션을 읽어 채우지 않음)
+        with self._lock:
+            entry = self._hit(session_id)
+            if entry is not None:
+                return parse_session_fields(entry.current, fields)
+            self.misses += 1
+        return self.repo.get_session_fields(session_id, fields)
+
+    def get_qa(self, session_id: str, index: int) -> Optional[QA]:
+        with self._lock:
+            entry = self._hit(session_id)
+            if entry is not None:
+                qa_flow = entry.current["qa_flow"]
+                return QA(**qa_flow[index]) if -len(qa_flow) <= index < len(qa_flow) else None
+            self.misses += 1
+        return self.repo.get_qa(session_id, index)
+
+    def delete_session(self, session_id: str) -> bool:
+        with self._flush_lock:
+            with self._lock:
+                self._entries.pop(session_id, None)
+                self._dirty.pop(session_id, None)
+                self._leases.pop(session_id, None)
+            return self.repo.delete_session(session_id)
+
+    def delete_all_sessions(self) -> int:
+        with self._flush_lock:
+            with self._lock:
+                self._entries.clear()
+                self._dirty.clear()
+                self._leases.clear()
+            return self.repo.delete_all_sessions()
@@ -0,0 +1,147 @@
+import os
+import json
+import time
+import atexit
+import hashlib
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Optional
+
+
+@dataclass
+class CacheEntry:
+    object_key: str
+    size: int
+    created_at: float
+
+
+class TTSAudioCache:
+    """
+    (text, voice, format) 해시 → S3 object key 인덱스.
+    - 로컬 인덱스: LRU(max_entries) + TTL
+    - manifest_path가 주어지면 JSON 파일에 기록해 재시작 후에도 유지
+      (변경을 save_delay 초 동안 모아 lock 밖에서 한 번에 기록)
+    PollyClient는 싱글톤이므로 모든 세션이 이 인덱스를 공유합니다.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 7 * 24 * 3600,
+                 manifest_path: Optional[str] = None, save_delay: float = 1.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.manifest_path = manifest_path
+        self.save_delay = save_delay
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()  # TTS는 asyncio.to_thread 워커에서 호출됨
+        self._save_lock = threading.Lock()  # manifest 저장은 한 번에 하나씩 (_lock 보다 먼저 잡음)
+        self._save_timer: Optional[threading.Timer] = None
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        if manifest_path:
+            self._load_manifest()
+            atexit.register(self.flush)
+
+    @staticmethod
+    def make_key(text: str, voice_id: str, output_format: str) -> str:
+        raw = "\x1f".join([text.strip(), voice_id, output_format])
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if self._expired(entry):
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self.bytes_saved += entry.size
+        logging.info(
+            f"🔁 TTS cache hit {entry.object_key} "
+            f"(hit_rate={self.hit_rate():.1%}, saved={self.bytes_saved} bytes)"
+        )
+        return entry.object_key
+
+    def put(self, key: str, object_key: str, size: int) -> None:
+        with self._lock:
+            self._entries[key] = CacheEntry(object_key, size, time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            if self.manifest_path and self._save_timer is None:
+                self._save_timer = threading.Timer(self.save_delay, self.flush)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def flush(self) -> None:
+        """예약된 manifest 저장을 지금 실행 (종료 시에도 호출)"""
+        # snapshot 과 파일 쓰기를 _save_lock 으로 묶어 오래된 snapshot 이 나중에 덮어쓰지 않게 합니다.
+        with self._save_lock:
+            with self._lock:
+                if self._save_timer is None:
+                    return
+                self._save_timer.cancel()
+                self._save_timer = None
+                data = {k: asdict(v) for k, v in self._entries.items()}
+            self._save_manifest(data)
+
+    def record_remote_hit(self, key: str, object_key: str, size: int) -> None:
+        """로컬 인덱스에는 없었지만 S3에 이미 같은 오디오가 있던 경우 (miss → hit로 정정)"""
+        with self._lock:
+            self.misses -= 1
+            self.hits += 1
+            self.bytes_saved += size
+        self.put(key, object_key, size)
+
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hit_rate(),
+                "bytes_saved": self.bytes_saved,
+            }
+
+    # ─────────────────── 내부 헬퍼 ────────────────────
+    def _expired(self, entry: CacheEntry) -> bool:
+        return self.ttl_seconds > 0 and time.time() - entry.created_at > self.ttl_seconds
+
+    def _load_manifest(self):
+        if not os.path.exists(self.manifest_path):
+            return
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for key, value in data.items():
+                entry = CacheEntry(**value)
+                if not self._expired(entry):
+                    self._entries[key] = entry
+            # 오래된 항목부터 제거되도록 생성 시각 순으로 정렬
+            self._entries = OrderedDict(sorted(self._entries.items(), key=lambda kv: kv[1].created_at))
+        except Exception as e:
+            logging.warning(f"TTS cache manifest load failed ({self.manifest_path}): {e}")
+
+    def _save_manifest(self, data: dict):
+        # 같은 디렉터리를 여러 worker 프로세스가 쓰므로 임시 파일 이름은 매번 새로 만듭니다.
+        directory = os.path.dirname(os.path.abspath(self.manifest_path))
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(prefix=".tts-manifest-", suffix=".tmp", dir=directory)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.manifest_path)
+        except Exception as e:
+            logging.warning(f"TTS cache manifest save failed ({self.manifest_path}): {e}")
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
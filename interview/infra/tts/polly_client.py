@@ -1,23 +1,86 @@
 import os
 import uuid
 import boto3
-import tempfile
-from interview.domain.tts.tts_client import TTSClient
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from interview.domain.tts.tts_client import DEFAULT_VOICE_ID, TTSClient
+from interview.infra.tts.audio_cache import TTSAudioCache
+
+OUTPUT_FORMAT = "mp3"
+
+# TTS는 여러 워커 스레드에서 동시에 호출되므로 커넥션 풀을 TTS 동시성보다 넉넉하게 잡습니다.
+BOTO_CONFIG = Config(
+    max_pool_connections=int(os.getenv("TTS_MAX_POOL_CONNECTIONS", "32")),
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=30,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+)
+
+# 질문 오디오는 수백 KB 수준이라 대부분 단일 PUT, 큰 오디오만 multipart 로 전송합니다.
+# 업로드 1건마다 스레드 풀을 만들지 않도록 use_threads=False (호출부가 이미 병렬화됨)
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=int(os.getenv("TTS_MULTIPART_THRESHOLD", str(8 * 1024 * 1024))),
+    multipart_chunksize=int(os.getenv("TTS_MULTIPART_CHUNKSIZE", str(8 * 1024 * 1024))),
+    use_threads=False,
+)
+
+class _CountingStream:
+    """업로드하면서 읽은 바이트 수를 기록하는 read-only 래퍼"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.bytes_read = 0
+
+    def read(self, size=-1):
+        chunk = self.stream.read(size)
+        self.bytes_read += len(chunk)
+        return chunk
 
 class PollyClient(TTSClient):
-    def __init__(self):
-        self.polly = boto3.client("polly", region_name=os.getenv("AWS_REGION", "us-east-1"))
-        self.s3 = boto3.client("s3")
+    def __init__(self, polly_client=None, s3_client=None):
+        region = os.getenv("AWS_REGION", "us-east-1")
+        self.polly = polly_client or boto3.client("polly", region_name=region, config=BOTO_CONFIG)
+        self.s3 = s3_client or boto3.client("s3", config=BOTO_CONFIG)
         self.bucket_name = os.getenv("S3_BUCKET_NAME")
 
         if not self.bucket_name:
             raise ValueError("S3_BUCKET_NAME 환경변수가 설정되지 않았습니다.")
 
-    def synthesize_to_s3(self, text: str, voice_id: str = "Seoyeon", filename: str = None) -> str:
+        # 동일 (text, voice, format)은 한 번만 합성/업로드 (content-addressed key)
+        self.cache = None
+        if os.getenv("TTS_CACHE_ENABLED", "true").lower() == "true":
+            self.cache = TTSAudioCache(
+                max_entries=int(os.getenv("TTS_CACHE_MAX_ENTRIES", "10000")),
+                ttl_seconds=float(os.getenv("TTS_CACHE_TTL_SECONDS", str(7 * 24 * 3600))),
+                manifest_path=os.getenv("TTS_CACHE_MANIFEST") or None,
+            )
+            self.cache_prefix = os.getenv("TTS_CACHE_PREFIX", "tts-cache/")
+
+    def flight_key(self, text: str, filename: str, voice_id: str = DEFAULT_VOICE_ID):
+        key = TTSAudioCache.make_key(text, voice_id, OUTPUT_FORMAT)
+        # 캐시를 쓰면 object key 가 (text, voice, format) 으로 정해지므로 filename 과 관계없이 같은 결과입니다
+        return key if self.cache else (key, filename)
+
+    def synthesize_to_s3(self, text: str, voice_id: str = DEFAULT_VOICE_ID, filename: str = None) -> str:
+        cache_key = None
+        if self.cache:
+            cache_key = self.cache.make_key(text, voice_id, OUTPUT_FORMAT)
+            cached = self.cache.get(cache_key)
+            if cached:
+                return cached
+            filename = f"{self.cache_prefix}{cache_key}.{OUTPUT_FORMAT}"
+            # 다른 인스턴스가 이미 올려둔 오디오인지 확인 (S3 자체가 durable 인덱스 역할)
+            existing_size = self._head_object_size(filename)
+            if existing_size is not None:
+                self.cache.record_remote_hit(cache_key, filename, existing_size)
+                return filename
+
         try:
             response = self.polly.synthesize_speech(
                 Text=text,
-                OutputFormat="mp3",
+                OutputFormat=OUTPUT_FORMAT,
                 VoiceId=voice_id
             )
         except Exception as e:
@@ -26,15 +89,27 @@ class PollyClient(TTSClient):
         if filename is None:
             filename = f"{uuid.uuid4().hex}.mp3"
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            local_path = os.path.join(tmpdir, filename)
-            
-            try:
-                with open(local_path, "wb") as f:
-                    f.write(response["AudioStream"].read())
-                
-                self.s3.upload_file(local_path, self.bucket_name, filename)
-            except Exception as e:
-                raise RuntimeError(f"Failed to save or upload audio file: {str(e)}")
-
-        return f"{filename}"
\ No newline at end of file
+        # Polly 응답 스트림을 임시 파일 없이 그대로 S3로 흘려보냅니다.
+        audio_stream = _CountingStream(response["AudioStream"])
+        try:
+            self.s3.upload_fileobj(
+                audio_stream,
+                self.bucket_name,
+                filename,
+                ExtraArgs={"ContentType": response.get("ContentType", "audio/mpeg")},
+                Config=TRANSFER_CONFIG,
+            )
+        except Exception as e:
+            raise RuntimeError(f"Failed to upload audio stream: {str(e)}")
+        finally:
+            response["AudioStream"].close()
+
+        if self.cache:
+            self.cache.put(cache_key, filename, audio_stream.bytes_read)
+        return f"{filename}"
+
+    def _head_object_size(self, key: str):
+        try:
+            return self.s3.head_object(Bucket=self.bucket_name, Key=key)["ContentLength"]
+        except ClientError:
+            return None
@@ -2,14 +2,17 @@
 
 from fastapi import APIRouter, HTTPException, Depends
 from fastapi.requests import Request
-from typing import List
+from fastapi.responses import StreamingResponse
+from fastapi.encoders import jsonable_encoder
+from typing import Dict, List
 import fitz
 import requests
 import tempfile
 import pymupdf4llm
 import logging # 로깅을 위해 추가
+import json
 
-from interview.domain.interview import InterviewSession
+from interview.domain.interview import InterviewSession, JobStatus
 from interview.domain.info import InfoModel
 from interview.application.interview_service import InterviewService
 from interview.interface.dependencies import get_interview_service
@@ -54,22 +57,43 @@ async def answer_main_question(
     service: InterviewService = Depends(get_interview_service)
     ):
     answer = (await request.body()).decode("utf-8")
-    session = service.answer_main_question(session_id, index, answer)
+    session = await service.answer_main_question(session_id, index, answer)
     if not session:
         raise HTTPException(status_code=404, detail="Session or question not found")
     return session
 
 @router.post("/session/{session_id}/qa/{index}/generate_follow-ups", response_model=InterviewSession)
-def generate_follow_up_questions(
+async def generate_follow_up_questions(
     session_id: str, 
     index: int,
     service: InterviewService = Depends(get_interview_service)
     ):
-    session = service.generate_follow_up_questions(session_id, index)
+    session = await service.generate_follow_up_questions(session_id, index)
     if not session:
         raise HTTPException(status_code=404, detail="Session or question not found")
     return session
 
+@router.post("/session/{session_id}/qa/{index}/generate_follow-ups/stream")
+async def stream_follow_up_questions(
+    session_id: str,
+    index: int,
+    service: InterviewService = Depends(get_interview_service)
+    ):
+    # 꼬리 질문이 (음성까지) 준비되는 대로 한 줄씩 내보내는 NDJSON 스트림. 마지막 줄은 저장된 세션입니다.
+    events = await service.stream_follow_up_questions(session_id, index)
+    if events is None:
+        raise HTTPException(status_code=404, detail="Session or question not found")
+
+    async def ndjson():
+        try:
+            async for event in events:
+                yield json.dumps(jsonable_encoder(event), ensure_ascii=False) + "\n"
+        except Exception as e:
+            logging.error(f"Follow-up streaming failed for {session_id}[{index}]: {e}")
+            yield json.dumps({"type": "error", "message": "Failed to generate follow-up questions."}) + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
 @router.patch("/session/{session_id}/qa/{index}/follow-up/{f_index}/answer")
 async def answer_follow_up_question(
     session_id: str,
@@ -79,11 +103,22 @@ async def answer_follow_up_question(
     service: InterviewService = Depends(get_interview_service)
     ):
     answer = (await request.body()).decode("utf-8")
-    session = service.answer_follow_up_question(session_id, index, f_index, answer)
+    session = await service.answer_follow_up_question(session_id, index, f_index, answer)
     if not session:
         raise HTTPException(status_code=404, detail="Follow-up question not found")
     return session
 
+# NOTE: /session/{interview_id}/{member_interview_id} 보다 먼저 등록되어야 합니다.
+@router.get("/session/{session_id}/jobs", response_model=Dict[str, JobStatus])
+async def get_job_status(
+    session_id: str,
+    service: InterviewService = Depends(get_interview_service)
+    ):
+    jobs = await service.get_job_status(session_id)
+    if jobs is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    return jobs
+
 @router.get("/ocr")
 def do_ocr(pdf_path:str):
     response = requests.get(pdf_path)
@@ -98,41 +133,66 @@ def do_ocr(pdf_path:str):
     
     return md_text
 
-@router.get("/sessions", response_model=List[InterviewSession])
-def list_all_sessions(service: InterviewService = Depends(get_interview_service)):
-    return service.get_all_sessions()
+# StreamingResponse 는 response_model 로 검증/직렬화되지 않으므로 문서용 스키마만 responses 로 둡니다.
+@router.get("/sessions", responses={200: {
+    "model": List[InterviewSession],
+    "description": "세션 JSON 배열 (스트리밍). 첫 세션을 내보낸 뒤 저장소 오류가 나면 배열을 닫지 않고 연결을 끊습니다.",
+}})
+async def list_all_sessions(service: InterviewService = Depends(get_interview_service)):
+    # 테이블 전체를 메모리에 올리지 않도록 읽는 대로 JSON 배열로 내보냅니다
+    sessions = service.iter_all_sessions()
+    # 첫 페이지는 응답을 시작하기 전에 읽어, 그때까지의 오류는 (200 대신) 500 으로 응답합니다
+    try:
+        first = await anext(sessions)
+    except StopAsyncIteration:
+        first = None
+
+    async def json_array():
+        yield "["
+        if first is not None:
+            yield json.dumps(jsonable_encoder(first), ensure_ascii=False)
+            try:
+                async for session in sessions:
+                    yield "," + json.dumps(jsonable_encoder(session), ensure_ascii=False)
+            except Exception as e:
+                # 이미 200 을 보냈으므로 "]" 없이 끊어 클라이언트가 잘린 응답을 완전한 목록으로 읽지 않게 합니다
+                logging.error(f"Listing sessions failed mid-stream: {e}")
+                raise
+        yield "]"
+
+    return StreamingResponse(json_array(), media_type="application/json")
 
 @router.get("/session/{session_id}", response_model=InterviewSession)
-def get_session_by_id(
+async def get_session_by_id(
     session_id: str,
     service: InterviewService = Depends(get_interview_service)
     ):
-    session = service.get_session_by_id(session_id)
+    session = await service.get_session_by_id(session_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     return session
 
 @router.get("/session/{interview_id}/{member_interview_id}", response_model=InterviewSession)
-def get_session_by_interview_and_member_interview_id(
+async def get_session_by_interview_and_member_interview_id(
     interview_id: str, 
     member_interview_id: str,
     service: InterviewService = Depends(get_interview_service)
     ):
-    session = service.get_session_by_interview_and_member_interview_id(interview_id, member_interview_id)
+    session = await service.get_session_by_interview_and_member_interview_id(interview_id, member_interview_id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     return session
 
 @router.delete("/session/{session_id}")
-def delete_session(
+async def delete_session(
     session_id: str,
     service: InterviewService = Depends(get_interview_service)
     ):
-    if service.delete_session(session_id):
+    if await service.delete_session(session_id):
         return {"message": f"Session {session_id} deleted"}
     raise HTTPException(status_code=404, detail="Session not found")
 
 @router.delete("/sessions")
-def delete_all_sessions(service: InterviewService = Depends(get_interview_service)):
-    count = service.delete_all_sessions()
+async def delete_all_sessions(service: InterviewService = Depends(get_interview_service)):
+    count = await service.delete_all_sessions()
     return {"message": f"{count} session(s) deleted"}
\ No newline at end of file
@@ -2,13 +2,20 @@
 
 import uvicorn
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from dotenv import load_dotenv
 load_dotenv()
 
 # REFACTOR: 컨테이너와 와이어링(wiring)을 먼저 처리하기 위해 컨트롤러 import를 아래로 이동합니다.
-from containers import InterviewContainer
+from containers import InterviewContainer, aclose_repositories
 from fastapi.middleware.cors import CORSMiddleware
+from interview.infra.llm.http_client import aclose_http_clients
+from interview.application.interview_service import shared_job_engine
+from interview.infra.metrics.registry import registry
+from interview.infra.repository.session_cache import flush_session_caches
+from interview.infra.llm.tokens import warm_encodings
 import os
+import asyncio
 import logging
 from datetime import datetime, timedelta
 
@@ -43,6 +50,25 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("startup")
+async def startup():
+    # tiktoken BPE 파일 다운로드가 첫 요청의 event loop 를 막지 않도록 미리 로드
+    await asyncio.to_thread(warm_encodings)
+
+@app.on_event("shutdown")
+async def shutdown():
+    # 백그라운드 job 워커와 LLM provider들이 공유하는 keep-alive 커넥션 정리
+    await shared_job_engine().shutdown()
+    await aclose_http_clients()
+    await aclose_repositories()
+    # job 이 남긴 변경까지 write-behind 세션 캐시에서 저장소로
+    flush_session_caches()
+
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    # Prometheus text exposition format
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
 @app.get("/")
 def hello():
     return {"Hello" : "World"}
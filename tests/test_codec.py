@@ -0,0 +1,39 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from interview.infra.repository import codec
+
+
+def test_zlib_round_trip_and_short_values_stay_plain():
+    zlib_id = codec.codec_id("zlib")
+    text = "면접 답변 " * 200
+    packed = codec.compress_text(text, zlib_id)
+    assert isinstance(packed, bytes)
+    assert codec.decompress_value(packed) == text
+    assert codec.compress_text("짧은 답변", zlib_id) == "짧은 답변"
+
+
+def test_unknown_codec_is_rejected():
+    with pytest.raises(ValueError):
+        codec.codec_id("lz4")
+
+
+def test_zstd_without_package_fails_at_repository_construction_not_import():
+    # 새 프로세스에서 zstandard 를 import 할 수 없게 만든 뒤 SESSION_CODEC=zstd 로 모듈을 불러옵니다
+    script = (
+        "import sys; sys.modules['zstandard'] = None\n"
+        "from interview.infra.repository import codec\n"
+        "try:\n"
+        "    codec.check_session_codec()\n"
+        "except RuntimeError as e:\n"
+        "    print('RuntimeError', e)\n"
+    )
+    env = {**os.environ, "SESSION_CODEC": "zstd"}
+    result = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.dirname(__file__)))
+    assert result.returncode == 0, result.stderr
+    assert "RuntimeError" in result.stdout
+    assert ".[zstd]" in result.stdout
@@ -0,0 +1,156 @@
+import pytest
+
+moto = pytest.importorskip("moto")
+import boto3
+
+from interview.domain.interview import Cursor, JobStatus, QA, InterviewSession
+from interview.domain.repository.interview_repo import SessionConflictError
+
+TABLE = "sessions-test"
+
+
+@pytest.fixture
+def repo(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "test")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "test")
+    monkeypatch.setenv("AWS_REGION", "us-east-1")
+    monkeypatch.setenv("DYNAMO_TABLE_NAME", TABLE)
+    with moto.mock_aws():
+        client = boto3.client("dynamodb", region_name="us-east-1")
+        client.create_table(
+            TableName=TABLE,
+            KeySchema=[{"AttributeName": "interview_id", "KeyType": "HASH"},
+                       {"AttributeName": "member_interview_id", "KeyType": "RANGE"}],
+            AttributeDefinitions=[{"AttributeName": name, "AttributeType": "S"}
+                                  for name in ("interview_id", "member_interview_id", "session_id")],
+            GlobalSecondaryIndexes=[{"IndexName": "session_id-index",
+                                     "KeySchema": [{"AttributeName": "session_id", "KeyType": "HASH"}],
+                                     "Projection": {"ProjectionType": "KEYS_ONLY"}}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        from interview.infra.repository.interview_repo_dynamo import InterviewRepositoryDynamo
+        yield InterviewRepositoryDynamo()
+
+
+def _session(session_id: str = "s1", member: str = "1") -> InterviewSession:
+    return InterviewSession(
+        interview_id="10", member_interview_id=member, session_id=session_id, cursor=Cursor(q_idx=0, f_idx=-1),
+        question_length=2,
+        qa_flow=[QA(question="q0", audio_path="a0", follow_up_length=0),
+                 QA(question="q1", audio_path="a1", follow_up_length=0)],
+    )
+
+
+def _stored(repo, member: str = "1") -> dict:
+    return repo.table.get_item(Key={"interview_id": "10", "member_interview_id": member})["Item"]
+
+
+def test_partial_update_writes_changed_fields_and_bumps_version(repo):
+    repo.save_session(_session())
+    session = repo.get_session_by_id("s1")
+    session.qa_flow[1].answer = "답변"
+    session.cursor.q_idx = 1
+    repo.update_session(session)
+
+    assert session.version == 2
+    item = _stored(repo)
+    assert item["version"] == 2
+    assert item["qa_flow"][1]["answer"] == "답변"
+    assert item["cursor"]["q_idx"] == 1
+    assert repo.get_session_by_id("s1").qa_flow[1].answer == "답변"
+
+
+def test_stale_update_raises_conflict(repo):
+    repo.save_session(_session())
+    first = repo.get_session_by_id("s1")
+    second = repo.get_session_by_id("s1")
+    first.final_report = "a"
+    repo.update_session(first)
+
+    second.final_report = "b"
+    with pytest.raises(SessionConflictError):
+        repo.update_session(second)
+    assert repo.get_session_by_id("s1").final_report == "a"
+
+
+def test_update_of_deleted_session_raises_conflict(repo):
+    repo.save_session(_session())
+    session = repo.get_session_by_id("s1")
+    repo.delete_session("s1")
+    session.final_report = "late"
+    with pytest.raises(SessionConflictError):
+        repo.update_session(session)
+
+
+def test_legacy_item_without_jobs_or_version_accepts_new_job(repo):
+    # version / jobs 필드가 생기기 전에 저장된 항목
+    legacy = _session().model_dump()
+    del legacy["jobs"], legacy["version"]
+    repo.table.put_item(Item=legacy)
+
+    session = repo.get_session_by_id("s1")
+    assert session.version == 0
+    session.jobs["feedback:0"] = JobStatus(kind="feedback", index=0, status="pending")
+    repo.update_session(session)
+
+    session = repo.get_session_by_id("s1")
+    assert session.version == 1
+    assert session.jobs["feedback:0"].status == "pending"
+
+    # 이후에는 jobs 안의 key 만 바꿔도 기존 key 가 그대로 남습니다
+    session.jobs["feedback:1"] = JobStatus(kind="feedback", index=1, status="running")
+    session.jobs["feedback:0"].status = "done"
+    repo.update_session(session)
+    jobs = repo.get_session_by_id("s1").jobs
+    assert {key: job.status for key, job in jobs.items()} == {"feedback:0": "done", "feedback:1": "running"}
+
+
+def test_save_sessions_writes_all_items(repo):
+    sessions = repo.save_sessions([_session(f"s{i}", str(i)) for i in range(30)])
+    assert {s.version for s in sessions} == {1}
+    assert len(repo.get_all_sessions()) == 30
+
+
+def test_async_repository_updates_legacy_item(monkeypatch):
+    pytest.importorskip("aiobotocore")
+    import asyncio
+    from moto.server import ThreadedMotoServer
+
+    server = ThreadedMotoServer(port=0, verbose=False)
+    server.start()
+    try:
+        host, port = server.get_host_and_port()
+        monkeypatch.setenv("AWS_ENDPOINT_URL", f"http://{host}:{port}")
+        monkeypatch.setenv("AWS_ACCESS_KEY_ID", "test")
+        monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "test")
+        monkeypatch.setenv("DYNAMO_TABLE_NAME", TABLE)
+        table = boto3.resource("dynamodb", region_name="us-east-1").create_table(
+            TableName=TABLE,
+            KeySchema=[{"AttributeName": "interview_id", "KeyType": "HASH"},
+                       {"AttributeName": "member_interview_id", "KeyType": "RANGE"}],
+            AttributeDefinitions=[{"AttributeName": "interview_id", "AttributeType": "S"},
+                                  {"AttributeName": "member_interview_id", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        legacy = _session().model_dump()
+        del legacy["jobs"], legacy["version"]
+        table.put_item(Item=legacy)
+
+        from interview.infra.repository.interview_repo_dynamo_async import AsyncInterviewRepositoryDynamo
+
+        async def run():
+            repo = AsyncInterviewRepositoryDynamo()
+            repo.session_index = None   # GSI 없이 scan 으로 찾음
+            try:
+                session = await repo.get_session_by_id("s1")
+                session.jobs["feedback:0"] = JobStatus(kind="feedback", index=0, status="pending")
+                await repo.update_session(session)
+                return await repo.get_session_by_id("s1")
+            finally:
+                await repo.close()
+
+        session = asyncio.run(run())
+        assert session.version == 1
+        assert session.jobs["feedback:0"].status == "pending"
+    finally:
+        server.stop()
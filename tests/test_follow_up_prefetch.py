@@ -0,0 +1,45 @@
+import time
+import asyncio
+
+from interview.application.follow_up_prefetch import FollowUpPrefetcher
+
+
+def test_take_skips_remaining_debounce():
+    async def run():
+        prefetcher = FollowUpPrefetcher(delay=5.0)
+        built = []
+
+        async def build():
+            built.append(time.monotonic())
+            return ["q"]
+
+        prefetcher.start("s1", 0, "answer", build)
+        await asyncio.sleep(0)
+        start = time.monotonic()
+        task = prefetcher.take("s1", 0, "answer")
+        assert await asyncio.wait_for(task, 1.0) == ["q"]
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) < 1.0
+
+
+def test_debounce_cancels_superseded_answer():
+    async def run():
+        prefetcher = FollowUpPrefetcher(delay=0.05)
+        built = []
+
+        def build(answer):
+            async def inner():
+                built.append(answer)
+                return [answer]
+            return inner
+
+        prefetcher.start("s1", 0, "partial", build("partial"))
+        await asyncio.sleep(0)
+        prefetcher.start("s1", 0, "full", build("full"))
+        result = await prefetcher.take("s1", 0, "full")
+        return built, result
+
+    built, result = asyncio.run(run())
+    assert built == ["full"]
+    assert result == ["full"]
@@ -0,0 +1,111 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from interview.application import interview_service
+from interview.application.interview_service import InterviewService, FINAL_REPORT_JOB_KEY, feedback_job_key
+from interview.application.job_engine import DONE, FAILED, PENDING, RUNNING, Job, JobAbortedError, JobEngine
+from interview.domain.interview import Cursor, JobStatus, QA, InterviewSession
+from interview.infra.repository.interview_repo_sqlite import InterviewRepositorySqlite
+
+
+class _LLM:
+    def __init__(self):
+        self.calls = []
+
+    async def agenerate_feedback(self, session, index):
+        self.calls.append(("feedback", index))
+        return f"feedback {index}"
+
+    async def agenerate_final_report(self, session):
+        self.calls.append(("final_report", None))
+        return "report"
+
+
+def _status(status: str, age: float) -> JobStatus:
+    updated_at = datetime.now(timezone.utc) - timedelta(seconds=age)
+    return JobStatus(kind="feedback", index=0, status=status, attempts=1, updated_at=updated_at.isoformat())
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    monkeypatch.setattr(interview_service, "FEEDBACK_NOTIFY_URL", "")
+    repo = InterviewRepositorySqlite(str(tmp_path / "sessions.db"))
+    yield repo
+    repo.close()
+
+
+def _save_finished_session(repo, job: JobStatus):
+    # 마지막 질문까지 답했고 피드백 job 이 (재시작 전 프로세스에서) 대기 중이던 세션
+    repo.save_session(InterviewSession(
+        interview_id="10", member_interview_id="1", session_id="s1", cursor=Cursor(q_idx=1, f_idx=-1),
+        question_length=1, qa_flow=[QA(question="q0", answer="a0", audio_path="a", follow_up_length=0)],
+        jobs={feedback_job_key(0): job},
+    ))
+
+
+def test_status_read_resubmits_stale_jobs_and_finishes_report(repo):
+    _save_finished_session(repo, _status(RUNNING, age=3600))
+    llm = _LLM()
+
+    async def run():
+        service = InterviewService(repo=repo, llm=llm, tts=None, ocr=None, jobs=JobEngine(workers=1))
+        jobs = await service.get_job_status("s1")
+        assert jobs[feedback_job_key(0)].status == RUNNING
+        await service.jobs.join()
+        await service.jobs.shutdown()
+
+    asyncio.run(run())
+
+    session = repo.get_session_by_id("s1")
+    assert llm.calls == [("feedback", 0), ("final_report", None)]
+    assert session.qa_flow[0].feedback == "feedback 0"
+    assert session.final_report == "report"
+    assert session.jobs[feedback_job_key(0)].status == DONE
+    assert session.jobs[FINAL_REPORT_JOB_KEY].status == DONE
+
+
+def test_status_read_leaves_recent_jobs_alone(repo):
+    _save_finished_session(repo, _status(PENDING, age=1))
+    llm = _LLM()
+
+    async def run():
+        service = InterviewService(repo=repo, llm=llm, tts=None, ocr=None, jobs=JobEngine(workers=1))
+        await service.get_job_status("s1")
+        await service.jobs.join()
+
+    asyncio.run(run())
+    assert llm.calls == []
+
+
+def test_final_report_marked_pending_with_last_feedback(repo):
+    _save_finished_session(repo, _status(PENDING, age=0))
+    engine = JobEngine(workers=1)
+    # submit 전에 프로세스가 내려간 상황: 큐에 넣지 않습니다
+    engine.submit = lambda job: False
+    service = InterviewService(repo=repo, llm=_LLM(), tts=None, ocr=None, jobs=engine)
+
+    asyncio.run(service.generate_feedback("s1", 0))
+
+    assert repo.get_session_by_id("s1").jobs[FINAL_REPORT_JOB_KEY].status == PENDING
+
+
+def test_missing_session_fails_job_without_retry(repo):
+    statuses = []
+
+    async def on_status(status, attempts, error):
+        statuses.append(status)
+
+    async def run():
+        service = InterviewService(repo=repo, llm=_LLM(), tts=None, ocr=None)
+        with pytest.raises(JobAbortedError):
+            await service.generate_feedback("missing", 0)
+        engine = JobEngine(workers=1, max_retries=2, retry_backoff=0)
+        engine.submit(Job(key="missing:feedback:0", run=lambda: service.generate_feedback("missing", 0),
+                          on_status=on_status))
+        await engine.join()
+        await engine.shutdown()
+
+    asyncio.run(run())
+    assert statuses == [RUNNING, FAILED]
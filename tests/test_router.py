@@ -0,0 +1,70 @@
+import asyncio
+
+from interview.infra.llm.router import RouterLLMClient
+
+
+class FakeClient:
+    def __init__(self, result="ok", delay=0.0):
+        self.result = result
+        self.delay = delay
+        self.calls = 0
+
+    async def agenerate_questions(self, info, cover_letter):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return self.result
+
+    def generate_questions(self, info, cover_letter):
+        self.calls += 1
+        return self.result
+
+
+def _half_open(router: RouterLLMClient, name: str):
+    breaker = next(p for p in router.providers if p.name == name).breaker
+    breaker.opened_at = 0.0     # reset_timeout 이 지난 open → half-open
+    return breaker
+
+
+def test_unused_backup_keeps_half_open_trial_available():
+    primary, backup = FakeClient(), FakeClient()
+    router = RouterLLMClient([("primary", primary), ("backup", backup)], hedge_operations=[])
+    breaker = _half_open(router, "backup")
+
+    for _ in range(3):
+        assert asyncio.run(router.agenerate_questions({}, None)) == "ok"
+        assert router.generate_questions({}, None) == "ok"
+
+    assert backup.calls == 0
+    assert breaker.state == "half_open"
+    assert breaker.available()
+
+
+def test_cancelled_hedge_releases_trial():
+    primary, backup = FakeClient(delay=0.05), FakeClient(delay=1.0)
+    router = RouterLLMClient([("primary", primary), ("backup", backup)], hedge_operations=["questions"])
+    breaker = _half_open(router, "backup")
+
+    async def run():
+        # hedge 를 바로 시작하도록 지연 통계 대신 기본 대기 시간을 0 으로
+        router._hedge_delay = lambda provider, operation: 0.01
+        return await router.agenerate_questions({}, None)
+
+    assert asyncio.run(run()) == "ok"
+    assert backup.calls == 1            # hedge 로 시작했다가 primary 가 이겨 취소됨
+    assert breaker.state == "half_open"
+    assert breaker.available()
+
+
+def test_failed_trial_reopens_and_success_closes():
+    bad, good = FakeClient(result=None), FakeClient()
+    router = RouterLLMClient([("bad", bad), ("good", good)], hedge_operations=[])
+    breaker = _half_open(router, "bad")
+
+    assert asyncio.run(router.agenerate_questions({}, None)) == "ok"
+    assert bad.calls == 1 and good.calls == 1
+    assert breaker.state == "open"
+
+    breaker.opened_at = 0.0
+    bad.result = "fixed"
+    assert asyncio.run(router.agenerate_questions({}, None)) == "fixed"
+    assert breaker.state == "closed"
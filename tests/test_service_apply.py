@@ -0,0 +1,95 @@
+import json
+import asyncio
+
+import httpx
+import pytest
+
+from interview.application import interview_service
+from interview.application.interview_service import InterviewService
+from interview.domain.interview import Cursor, QA, InterviewSession
+from interview.domain.repository.interview_repo import SessionConflictError
+from interview.infra.repository.interview_repo_sqlite import InterviewRepositorySqlite
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = InterviewRepositorySqlite(str(tmp_path / "sessions.db"))
+    repo.save_session(InterviewSession(
+        interview_id="10", member_interview_id="1", session_id="s1", cursor=Cursor(q_idx=0, f_idx=-1),
+        question_length=2,
+        qa_flow=[QA(question="q0", audio_path="a0", follow_up_length=0),
+                 QA(question="q1", audio_path="a1", follow_up_length=0)],
+    ))
+    yield repo
+    repo.close()
+
+
+def _concurrent_write(repo, index: int, answer: str = "other worker"):
+    """다른 worker 가 같은 세션에 먼저 저장한 상황"""
+    other = repo.get_session_by_id("s1")
+    other.qa_flow[index].answer = answer
+    repo.update_session(other)
+
+
+def test_apply_rereads_and_reapplies_after_conflict(repo):
+    service = InterviewService(repo=repo, llm=None, tts=None, ocr=None)
+    calls = []
+
+    def mutate(session: InterviewSession):
+        calls.append(session.version)
+        if len(calls) == 1:
+            _concurrent_write(repo, 1)
+        session.qa_flow[0].answer = "mine"
+
+    session = asyncio.run(service._apply("s1", mutate))
+
+    assert calls == [1, 2]
+    assert session.version == 3
+    stored = repo.get_session_by_id("s1")
+    assert stored.qa_flow[0].answer == "mine"
+    assert stored.qa_flow[1].answer == "other worker"
+
+
+def test_apply_gives_up_after_retries(repo, monkeypatch):
+    monkeypatch.setattr(interview_service, "WRITE_CONFLICT_RETRIES", 2)
+    service = InterviewService(repo=repo, llm=None, tts=None, ocr=None)
+    calls = []
+
+    def mutate(session: InterviewSession):
+        calls.append(session.version)
+        _concurrent_write(repo, 1, f"other worker {len(calls)}")
+        session.qa_flow[0].answer = "mine"
+
+    with pytest.raises(SessionConflictError):
+        asyncio.run(service._apply("s1", mutate))
+    assert len(calls) == 3
+    assert repo.get_session_by_id("s1").qa_flow[0].answer is None
+
+
+def test_apply_missing_session_returns_none(repo):
+    service = InterviewService(repo=repo, llm=None, tts=None, ocr=None)
+    assert asyncio.run(service._apply("missing", lambda s: None)) is None
+
+
+class _ReportLLM:
+    async def agenerate_final_report(self, session):
+        return "report"
+
+
+def test_final_report_notifies_through_shared_client(repo, monkeypatch):
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(json.loads(request.content))
+        return httpx.Response(200)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(interview_service, "FEEDBACK_NOTIFY_URL", "http://notify.test/feedback")
+    monkeypatch.setattr(interview_service, "get_async_http_client", lambda: client)
+    service = InterviewService(repo=repo, llm=_ReportLLM(), tts=None, ocr=None)
+
+    session = asyncio.run(service.generate_final_report("s1"))
+
+    assert session.final_report == "report"
+    assert sent == [{"interviewId": "10", "memberInterviewId": "1"}]
+    assert not client.is_closed
@@ -0,0 +1,118 @@
+import pytest
+
+from interview.domain.interview import Cursor, QA, InterviewSession
+from interview.domain.repository.interview_repo import SessionConflictError
+from interview.infra.repository.interview_repo_sqlite import InterviewRepositorySqlite
+from interview.infra.repository.session_cache import SessionCache
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = InterviewRepositorySqlite(str(tmp_path / "sessions.db"))
+    repo.save_session(InterviewSession(
+        interview_id="10", member_interview_id="1", session_id="s1", cursor=Cursor(q_idx=0, f_idx=-1),
+        question_length=2,
+        qa_flow=[QA(question="q0", audio_path="a0", follow_up_length=0),
+                 QA(question="q1", audio_path="a1", follow_up_length=0)],
+    ))
+    yield repo
+    repo.close()
+
+
+def test_read_through_and_hit(repo):
+    cache = SessionCache(repo)
+    assert cache.get_session_by_id("s1").version == 1
+    session = cache.get_session_by_id("s1")
+    assert cache.stats()["hits"] == 1
+
+    session.qa_flow[0].answer = "답변"
+    cache.update_session(session)
+    cached = cache.get_session_by_id("s1")
+    assert cached.version == 2 and cached.qa_flow[0].answer == "답변"
+    assert cached.changes() == []
+
+
+def test_by_interview_lookup_prefers_newer_stored_copy(repo):
+    ours, other = SessionCache(repo), SessionCache(repo)
+    ours.get_session_by_id("s1")                 # 캐시에 version 1
+
+    session = other.get_session_by_id("s1")      # 다른 worker 가 저장
+    session.final_report = "report"
+    other.update_session(session)
+
+    found = ours.get_session_by_interview_and_member_interview_id("10", "1")
+    assert found.version == 2 and found.final_report == "report"
+    # 캐시도 새 version 으로 갱신되어 이후 쓰기가 충돌하지 않습니다
+    cached = ours.get_session_by_id("s1")
+    assert cached.version == 2
+    cached.qa_flow[0].answer = "답변"
+    ours.update_session(cached)
+    assert repo.get_session_by_id("s1").final_report == "report"
+
+
+def test_stale_entry_conflicts_and_is_dropped(repo):
+    ours, other = SessionCache(repo), SessionCache(repo)
+    stale = ours.get_session_by_id("s1")
+    fresh = other.get_session_by_id("s1")
+    fresh.final_report = "theirs"
+    other.update_session(fresh)
+
+    stale.final_report = "ours"
+    with pytest.raises(SessionConflictError):
+        ours.update_session(stale)
+    assert ours.get_session_by_id("s1").final_report == "theirs"
+
+
+def test_write_behind_coalesces_and_flushes(repo):
+    cache = SessionCache(repo, write_behind_delay=60)
+    try:
+        for index in range(2):
+            session = cache.get_session_by_id("s1")
+            session.qa_flow[index].answer = f"a{index}"
+            cache.update_session(session)
+        assert repo.get_session_by_id("s1").qa_flow[0].answer is None
+        assert cache.stats()["coalesced"] == 1
+
+        cache.flush()
+        stored = repo.get_session_by_id("s1")
+        assert [qa.answer for qa in stored.qa_flow] == ["a0", "a1"]
+        assert stored.version == 2
+    finally:
+        cache.close()
+
+
+class _Spy:
+    """호출된 저장소 메서드 이름을 기록"""
+
+    def __init__(self, repo):
+        self.repo = repo
+        self.calls = []
+
+    def __getattr__(self, name):
+        self.calls.append(name)
+        return getattr(self.repo, name)
+
+
+def test_projection_reads_use_repository_projection_on_miss(repo):
+    spy = _Spy(repo)
+    cache = SessionCache(spy)
+
+    assert cache.get_qa("s1", 1).question == "q1"
+    assert cache.get_session_fields("s1", ["jobs", "version"]) == {"jobs": {}, "version": 1}
+    assert spy.calls == ["get_qa", "get_session_fields"]
+    assert cache.get_qa("missing", 0) is None
+
+
+def test_projection_reads_served_from_cache_on_hit(repo):
+    spy = _Spy(repo)
+    cache = SessionCache(spy)
+    session = cache.get_session_by_id("s1")
+    session.qa_flow[1].answer = "답변"
+    cache.update_session(session)
+    spy.calls.clear()
+
+    assert cache.get_qa("s1", 1).answer == "답변"
+    assert cache.get_qa("s1", -1).answer == "답변"
+    assert cache.get_qa("s1", 2) is None
+    assert cache.get_session_fields("s1", ["version", "final_report"]) == {"version": 2, "final_report": None}
+    assert spy.calls == []
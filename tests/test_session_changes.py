@@ -0,0 +1,97 @@
+import copy
+
+from interview.domain.interview import (
+    REMOVED, Cursor, FollowUpQA, InterviewSession, JobStatus, QA, apply_changes,
+)
+
+
+def _session() -> InterviewSession:
+    session = InterviewSession(
+        interview_id="1", member_interview_id="1", session_id="s1", cursor=Cursor(q_idx=0, f_idx=-1),
+        question_length=2,
+        qa_flow=[QA(question="q0", audio_path="a0", follow_up_length=0),
+                 QA(question="q1", audio_path="a1", follow_up_length=0)],
+        jobs={"feedback:0": JobStatus(kind="feedback", index=0, status="pending")},
+    )
+    session.mark_clean()
+    return session
+
+
+def _round_trip(session: InterviewSession, base: dict) -> dict:
+    data = copy.deepcopy(base)
+    apply_changes(data, session.changes())
+    return data
+
+
+def test_untracked_session_has_no_changes():
+    session = _session()
+    session._snapshot = None
+    assert session.changes() is None
+
+
+def test_clean_session_has_empty_changes():
+    assert _session().changes() == []
+
+
+def test_nested_field_changes_are_paths():
+    session = _session()
+    base = session.model_dump()
+    session.qa_flow[1].answer = "답변"
+    session.cursor.f_idx = 0
+    session.jobs["feedback:0"].status = "done"
+
+    assert dict(session.changes()) == {
+        ("qa_flow", 1, "answer"): "답변",
+        ("cursor", "f_idx"): 0,
+        ("jobs", "feedback:0", "status"): "done",
+    }
+    assert _round_trip(session, base) == session.model_dump()
+
+
+def test_new_and_removed_dict_keys():
+    session = _session()
+    base = session.model_dump()
+    del session.jobs["feedback:0"]
+    session.jobs["final_report"] = JobStatus(kind="final_report", status="running")
+
+    changes = dict(session.changes())
+    assert changes[("jobs", "feedback:0")] is REMOVED
+    assert changes[("jobs", "final_report")]["status"] == "running"
+    assert _round_trip(session, base) == session.model_dump()
+
+
+def test_list_growth_and_shrink_replace_whole_list():
+    session = _session()
+    base = session.model_dump()
+    session.qa_flow[0].follow_ups = [FollowUpQA(question="f0", audio_path="b0")]
+    session.qa_flow.append(QA(question="q2", audio_path="a2", follow_up_length=0))
+
+    changes = dict(session.changes())
+    assert ("qa_flow",) in changes
+    grown = _round_trip(session, base)
+    assert grown == session.model_dump()
+
+    session.mark_clean()
+    session.qa_flow.pop()
+    assert [path for path, _ in session.changes()] == [("qa_flow",)]
+    assert _round_trip(session, grown) == session.model_dump()
+
+
+def test_changes_do_not_alias_applied_data():
+    session = _session()
+    base = session.model_dump()
+    session.qa_flow[0].follow_ups = [FollowUpQA(question="f0", audio_path="b0")]
+    data = _round_trip(session, base)
+    session.qa_flow[0].follow_ups[0].answer = "later"
+    assert data["qa_flow"][0]["follow_ups"][0]["answer"] is None
+
+
+def test_mark_clean_with_snapshot_reports_pending_changes():
+    session = _session()
+    persisted = session.model_dump()
+    session.final_report = "report"
+    session.mark_clean()
+    assert session.changes() == []
+
+    session.mark_clean(persisted)
+    assert session.changes() == [(("final_report",), "report")]
@@ -0,0 +1,54 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from interview.domain.interview import Cursor, InterviewSession
+from interview.interface.controllers import interview_controller
+from interview.interface.dependencies import get_interview_service
+
+
+def _session(i: int) -> InterviewSession:
+    return InterviewSession(interview_id="10", member_interview_id=str(i), session_id=f"s{i}",
+                            cursor=Cursor(q_idx=0, f_idx=-1), question_length=0, qa_flow=[])
+
+
+class _Service:
+    def __init__(self, count: int, fail_after: int = None):
+        self.count = count
+        self.fail_after = fail_after
+
+    async def iter_all_sessions(self):
+        for i in range(self.count):
+            if i == self.fail_after:
+                raise RuntimeError("page read failed")
+            yield _session(i)
+
+
+def _client(service) -> TestClient:
+    app = FastAPI()
+    app.include_router(interview_controller.router)
+    app.dependency_overrides[get_interview_service] = lambda: service
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_list_sessions_streams_json_array():
+    response = _client(_Service(3)).get("/interview/sessions")
+    assert response.status_code == 200
+    assert [s["session_id"] for s in response.json()] == ["s0", "s1", "s2"]
+    assert _client(_Service(0)).get("/interview/sessions").json() == []
+
+
+def test_list_sessions_error_before_output_is_500():
+    response = _client(_Service(3, fail_after=0)).get("/interview/sessions")
+    assert response.status_code == 500
+
+
+def test_list_sessions_error_mid_stream_is_not_valid_json():
+    with pytest.raises(Exception):
+        _client(_Service(3, fail_after=2)).get("/interview/sessions").json()
+
+
+def test_list_sessions_openapi_documents_array():
+    schema = _client(_Service(0)).get("/openapi.json").json()
+    content = schema["paths"]["/interview/sessions"]["get"]["responses"]["200"]["content"]
+    assert content["application/json"]["schema"]["type"] == "array"
@@ -0,0 +1,113 @@
+import threading
+
+import pytest
+
+from interview.domain.interview import Cursor, JobStatus, QA, InterviewSession
+from interview.domain.repository.interview_repo import SessionConflictError
+from interview.infra.repository.interview_repo_sqlite import InterviewRepositorySqlite
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = InterviewRepositorySqlite(str(tmp_path / "sessions.db"))
+    yield repo
+    repo.close()
+
+
+def _session(session_id: str = "s1", member: str = "1") -> InterviewSession:
+    return InterviewSession(
+        interview_id="10", member_interview_id=member, session_id=session_id, cursor=Cursor(q_idx=0, f_idx=-1),
+        question_length=2,
+        qa_flow=[QA(question="q0", audio_path="a0", follow_up_length=0),
+                 QA(question="q1", audio_path="a1", follow_up_length=0)],
+    )
+
+
+def test_update_bumps_version(repo):
+    repo.save_session(_session())
+    session = repo.get_session_by_id("s1")
+    assert session.version == 1
+    session.qa_flow[0].answer = "답변"
+    repo.update_session(session)
+    assert session.version == 2
+    stored = repo.get_session_by_id("s1")
+    assert stored.version == 2 and stored.qa_flow[0].answer == "답변"
+
+
+def test_stale_update_raises_conflict(repo):
+    repo.save_session(_session())
+    first, second = repo.get_session_by_id("s1"), repo.get_session_by_id("s1")
+    first.final_report = "a"
+    repo.update_session(first)
+    second.final_report = "b"
+    with pytest.raises(SessionConflictError):
+        repo.update_session(second)
+    assert repo.get_session_by_id("s1").final_report == "a"
+
+
+def test_tracked_update_of_deleted_session_raises_conflict(repo):
+    repo.save_session(_session())
+    session = repo.get_session_by_id("s1")
+    repo.delete_session("s1")
+    session.final_report = "late"
+    with pytest.raises(SessionConflictError):
+        repo.update_session(session)
+    assert repo.get_session_by_id("s1") is None
+
+
+def test_untracked_update_inserts_missing_session(repo):
+    session = _session()
+    repo.update_session(session)
+    assert session.version == 1
+    assert repo.get_session_by_id("s1").version == 1
+
+
+def test_untracked_update_of_existing_session_with_stale_version_conflicts(repo):
+    repo.save_session(_session())
+    with pytest.raises(SessionConflictError):
+        repo.update_session(_session())     # version 0, 저장소는 1
+
+
+def test_no_changes_skips_write(repo):
+    repo.save_session(_session())
+    session = repo.get_session_by_id("s1")
+    repo.update_session(session)
+    assert repo.get_session_by_id("s1").version == 1
+
+
+def test_save_sessions_is_atomic(repo):
+    repo.save_session(_session("s2", "2"))
+    with pytest.raises(Exception):
+        repo.save_sessions([_session("s1", "1"), _session("s2", "2")])
+    assert repo.get_session_by_id("s1") is None
+
+    saved = repo.save_sessions([_session(f"n{i}", str(i)) for i in range(3, 6)])
+    assert {s.version for s in saved} == {1}
+    assert len(repo.get_all_sessions()) == 4
+
+
+def test_projection_reads(repo):
+    session = _session()
+    session.jobs["feedback:0"] = JobStatus(kind="feedback", index=0, status="done")
+    session.qa_flow[1].answer = "마지막"
+    repo.save_session(session)
+
+    fields = repo.get_session_fields("s1", ["jobs", "final_report", "version"])
+    assert fields["jobs"]["feedback:0"].status == "done"
+    assert fields["final_report"] is None and fields["version"] == 1
+    assert repo.get_qa("s1", 1).answer == "마지막"
+    assert repo.get_qa("s1", -1).question == "q1"
+    assert repo.get_qa("s1", 5) is None
+    assert repo.get_session_fields("missing", ["jobs"]) is None
+
+
+def test_lookup_by_interview_and_iteration_across_threads(repo):
+    repo.save_sessions([_session(f"s{i}", str(i)) for i in range(250)])
+    assert repo.get_session_by_interview_and_member_interview_id("10", "7").session_id == "s7"
+
+    found = []
+    thread = threading.Thread(target=lambda: found.extend(s.session_id for s in repo.iter_sessions()))
+    thread.start()
+    thread.join()
+    assert len(found) == 250
+    assert repo.delete_all_sessions() == 250
@@ -0,0 +1,51 @@
+import pytest
+
+from interview.infra.llm import tokens
+
+
+@pytest.fixture(autouse=True)
+def clear_encodings():
+    tokens.get_encoding.cache_clear()
+    yield
+    tokens.get_encoding.cache_clear()
+
+
+class _FakeTiktoken:
+    def __init__(self, fail: bool):
+        self.fail = fail
+        self.loads = 0
+
+    def encoding_for_model(self, model):
+        raise KeyError(model)
+
+    def get_encoding(self, name):
+        self.loads += 1
+        if self.fail:
+            raise OSError("offline")
+        return _FakeEncoding()
+
+
+class _FakeEncoding:
+    def encode(self, text, disallowed_special=()):
+        return text.split()
+
+
+def test_warm_encodings_loads_once_before_requests(monkeypatch):
+    fake = _FakeTiktoken(fail=False)
+    monkeypatch.setattr(tokens, "tiktoken", fake)
+
+    tokens.warm_encodings(["gpt-4"])
+    assert fake.loads == 1
+
+    assert tokens.count_tokens("a b c", "gpt-4") == 3
+    assert fake.loads == 1
+
+
+def test_warm_encodings_failure_keeps_estimate(monkeypatch):
+    fake = _FakeTiktoken(fail=True)
+    monkeypatch.setattr(tokens, "tiktoken", fake)
+
+    tokens.warm_encodings(["gpt-4"])
+
+    assert tokens.count_tokens("안녕하세요 test", "gpt-4") == tokens._estimate("안녕하세요 test")
+    assert fake.loads == 1
@@ -0,0 +1,37 @@
+import json
+import threading
+
+from interview.infra.tts.audio_cache import TTSAudioCache
+
+
+def test_put_defers_manifest_save_until_flush(tmp_path):
+    manifest = tmp_path / "manifest.json"
+    cache = TTSAudioCache(manifest_path=str(manifest), save_delay=60)
+
+    cache.put("a", "tts-cache/a.mp3", 10)
+    cache.put("b", "tts-cache/b.mp3", 20)
+    assert not manifest.exists()
+
+    cache.flush()
+    assert set(json.loads(manifest.read_text())) == {"a", "b"}
+    assert list(tmp_path.iterdir()) == [manifest]
+
+    reloaded = TTSAudioCache(manifest_path=str(manifest))
+    assert reloaded.get("b") == "tts-cache/b.mp3"
+
+
+def test_timer_saves_batched_puts(tmp_path):
+    manifest = tmp_path / "manifest.json"
+    cache = TTSAudioCache(manifest_path=str(manifest), save_delay=0.05)
+
+    threads = [threading.Thread(target=cache.put, args=(str(i), f"tts-cache/{i}.mp3", i)) for i in range(20)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    timer = cache._save_timer
+    if timer is not None:
+        timer.join()
+
+    assert len(json.loads(manifest.read_text())) == 20
+    assert cache._save_timer is None
@@ -0,0 +1,40 @@
+import asyncio
+import time
+
+from interview.application.interview_service import InterviewService
+from interview.domain.tts.tts_client import TTSClient
+from interview.infra.tts.polly_client import PollyClient
+
+
+class _SlowTTS(TTSClient):
+    def synthesize_to_s3(self, text: str, voice_id: str = "Seoyeon", filename: str = None) -> str:
+        time.sleep(0.05)
+        return filename
+
+
+def _polly(monkeypatch, cache: bool) -> PollyClient:
+    monkeypatch.setenv("S3_BUCKET_NAME", "bucket")
+    monkeypatch.setenv("TTS_CACHE_ENABLED", "true" if cache else "false")
+    monkeypatch.delenv("TTS_CACHE_MANIFEST", raising=False)
+    return PollyClient(polly_client=object(), s3_client=object())
+
+
+def test_polly_flight_key_matches_cache_key_parts(monkeypatch):
+    polly = _polly(monkeypatch, cache=True)
+    assert polly.flight_key("질문", "a.mp3") == polly.flight_key("질문", "b.mp3")
+    assert polly.flight_key("질문", "a.mp3") != polly.flight_key("질문", "a.mp3", voice_id="Jihye")
+
+
+def test_polly_flight_key_includes_filename_without_cache(monkeypatch):
+    polly = _polly(monkeypatch, cache=False)
+    assert polly.flight_key("질문", "a.mp3") != polly.flight_key("질문", "b.mp3")
+
+
+def test_concurrent_synthesis_keeps_each_filename_without_content_addressing():
+    service = InterviewService(repo=None, llm=None, tts=_SlowTTS(), ocr=None)
+
+    async def run():
+        return await asyncio.gather(service._synthesize("같은 질문", "s1_0.mp3"),
+                                    service._synthesize("같은 질문", "s2_0.mp3"))
+
+    assert asyncio.run(run()) == ["s1_0.mp3", "s2_0.mp3"]